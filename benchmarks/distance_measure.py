@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark of measuring a single pair of points, as in
+``geodesic(a, b).km`` called in a loop.
+
+Compares the plain ``(latitude, longitude)`` float tuples (which skip
+the :class:`geopy.point.Point` construction) and the shared per-ellipsoid
+``Geodesic`` instances against the bare ``Geodesic.Inverse`` call and
+against the previous behavior: going through ``Point`` and constructing
+a fresh ``Geodesic`` for every distance instance.
+
+Usage (with geopy installed, e.g. by ``make develop``)::
+
+    python benchmarks/distance_measure.py [number of pairs]
+"""
+
+import random
+import sys
+from timeit import default_timer
+
+from geographiclib.geodesic import Geodesic
+
+from geopy.distance import ELLIPSOIDS, geodesic, great_circle
+from geopy.point import Point
+
+
+def bench(name, func, pairs, baseline=None):
+    start = default_timer()
+    func(pairs)
+    elapsed = default_timer() - start
+    line = '%-45s %8.2f us/pair' % (name, elapsed / len(pairs) * 1e6)
+    if baseline is not None:
+        line += '  (%.2fx of the bare Inverse)' % (elapsed / baseline)
+    print(line)
+    return elapsed
+
+
+def bare_inverse(pairs):
+    major, _, f = ELLIPSOIDS['WGS-84']
+    inverse = Geodesic(major, f).Inverse
+    for a, b in pairs:
+        inverse(*a, *b, outmask=Geodesic.DISTANCE)['s12']
+
+
+def fresh_geodesic_and_points(pairs):
+    # The previous behavior of `geodesic(a, b).km`.
+    major, _, f = ELLIPSOIDS['WGS-84']
+    for a, b in pairs:
+        a, b = Point(a), Point(b)
+        Geodesic(major, f).Inverse(a.latitude, a.longitude,
+                                   b.latitude, b.longitude,
+                                   Geodesic.DISTANCE)['s12']
+
+
+def geodesic_points(pairs):
+    for a, b in pairs:
+        geodesic(Point(a), Point(b)).km
+
+
+def geodesic_tuples(pairs):
+    for a, b in pairs:
+        geodesic(a, b).km
+
+
+def geodesic_measure_tuples(pairs):
+    measure = geodesic().measure
+    for a, b in pairs:
+        measure(a, b)
+
+
+def great_circle_points(pairs):
+    for a, b in pairs:
+        great_circle(Point(a), Point(b)).km
+
+
+def great_circle_tuples(pairs):
+    for a, b in pairs:
+        great_circle(a, b).km
+
+
+def main(n=20000):
+    rng = random.Random(0)
+    pairs = [
+        ((rng.uniform(-80, 80), rng.uniform(-180, 180)),
+         (rng.uniform(-80, 80), rng.uniform(-180, 180)))
+        for _ in range(n)
+    ]
+    baseline = bench('bare Geodesic.Inverse', bare_inverse, pairs)
+    bench('before: fresh Geodesic + Points', fresh_geodesic_and_points,
+          pairs, baseline)
+    bench('geodesic(Point, Point).km', geodesic_points, pairs, baseline)
+    bench('geodesic(tuple, tuple).km', geodesic_tuples, pairs, baseline)
+    bench('geodesic().measure(tuple, tuple)', geodesic_measure_tuples,
+          pairs, baseline)
+    bench('great_circle(Point, Point).km', great_circle_points, pairs)
+    bench('great_circle(tuple, tuple).km', great_circle_tuples, pairs)
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,604 @@
+"""
+Caches store the responses of the geocoding services, so repeated
+queries are answered without sending the requests again.
+
+A cache is enabled by passing it as the ``cache`` argument of
+a geocoder, or for all geocoders at once with
+:attr:`geopy.geocoders.options.default_cache`::
+
+    from geopy.cache import MemoryCache
+    from geopy.geocoders import Nominatim
+
+    cache = MemoryCache(ttl=3600, maxsize=10000)
+    geolocator = Nominatim(user_agent="specify_your_app_name_here", cache=cache)
+    geolocator.geocode("175 5th Avenue NYC")  # sends a request
+    geolocator.geocode("175 5th Avenue NYC")  # is answered by the cache
+
+The responses are keyed by the request URL (with the query parameters
+sorted) and the request headers which might affect the response
+(all of them except ``User-Agent``). The keys are SHA-256 digests,
+so the API keys which are often passed in the URLs are not stored
+in the caches. Only the successful responses which have been parsed
+by the geocoder without errors are cached. The points of the reverse
+queries rarely repeat exactly, so they might be snapped to a grid
+with :attr:`geopy.geocoders.options.default_reverse_precision`
+to make them cacheable.
+
+The caches work the same way in both synchronous and asynchronous
+modes and might be shared between geocoders. :class:`.MemoryCache`
+lives in the memory of the process, while :class:`.SQLiteCache`
+persists the responses on disk and might be shared between processes.
+The cached responses are parsed by the geocoders exactly like
+the live ones.
+
+The "no result" outcomes (the geocoding calls returning ``None``,
+e.g. for junk addresses) are cached too, possibly for a shorter time
+(see the ``negative_ttl`` argument of the caches), so repeated queries
+which can't be geocoded don't produce the requests either.
+
+With ``stale_while_revalidate`` the expired entries are still served
+for that many seconds, while the geocoder refreshes them in the
+background (once per entry at a time), so the callers don't wait
+for the requests when the entries expire (similar to the HTTP
+``Cache-Control: stale-while-revalidate`` directive).
+
+Regardless of the caches, concurrent identical requests of a geocoder
+(e.g. made by multiple threads or asyncio tasks at the same time) are
+coalesced: a single request is sent, and its response or error is shared
+by all of them.
+
+Before caching the responses, please consult the Geocoding service ToS,
+which might limit the time the results might be stored for (or prohibit
+storing them at all).
+
+.. versionadded:: 2.6
+"""
+
+import abc
+import hashlib
+import os
+import threading
+import zlib
+from collections import OrderedDict, namedtuple
+from operator import itemgetter
+from time import monotonic, time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+__all__ = (
+    "BaseCache",
+    "CacheInfo",
+    "MemoryCache",
+    "SQLiteCache",
+)
+
+# Request headers which don't affect the responses.
+_IGNORED_HEADERS = frozenset(['user-agent'])
+
+CacheInfo = namedtuple(
+    'CacheInfo', ['hits', 'misses', 'evictions', 'currsize', 'nbytes']
+)
+CacheInfo.__doc__ = """
+Statistics of a cache: the numbers of hits, misses and evictions,
+and the current number of entries and their total size in bytes.
+"""
+
+
+def _cache_key(url, headers, is_json):
+    # Key of a request to a geocoding service, see the module docs.
+    parts = urlsplit(url)
+    # The stable sort keeps the order of the repeated parameters.
+    query = urlencode(
+        sorted(parse_qsl(parts.query, keep_blank_values=True), key=itemgetter(0))
+    )
+    url = urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path, query, '')
+    )
+    lines = ['json' if is_json else 'text', url]
+    lines.extend(sorted(
+        '%s: %s' % (name.lower(), value)
+        for name, value in headers.items()
+        if name.lower() not in _IGNORED_HEADERS
+    ))
+    return hashlib.sha256('\n'.join(lines).encode('utf-8')).hexdigest()
+
+
+def _expires(cache, negative, now):
+    # Expiration time of a new entry of `cache`.
+    ttl = cache.ttl
+    if negative and cache.negative_ttl is not None:
+        ttl = cache.negative_ttl
+    return None if ttl is None else now + ttl
+
+
+def _is_locked(error):
+    # The database is locked by another connection for longer than
+    # the timeout of `SQLiteCache`.
+    import sqlite3
+    return isinstance(error, sqlite3.OperationalError) and 'locked' in str(error)
+
+
+class BaseCache(abc.ABC):
+    """
+    Base class for the caches of the geocoding responses.
+
+    The keys and the values are strings. The values are the bodies
+    of the responses (JSON is serialized back to a string).
+
+    Implementations must be thread-safe. The methods are called from
+    the event loop in asynchronous mode, so they should be fast
+    and must not block for long.
+
+    The "no result" outcomes are stored with ``negative=True``.
+    Caches supporting the stale-while-revalidate semantics should
+    override :meth:`.lookup`.
+    """
+
+    @abc.abstractmethod
+    def get(self, key):
+        """
+        Return the cached value of ``key``, or ``None`` if there's
+        no such value (or it has expired).
+
+        :param str key: Cache key.
+        :rtype: str or ``None``
+        """
+
+    @abc.abstractmethod
+    def set(self, key, value, *, negative=False):
+        """
+        Store ``value`` for ``key``.
+
+        :param str key: Cache key.
+        :param str value: The value to store.
+        :param bool negative: Whether the value is a "no result"
+            outcome, which might be stored for a shorter time.
+        """
+
+    def lookup(self, key):
+        """
+        Return the cached value of ``key`` along with a flag which
+        is ``True`` if the value has expired but might still be served
+        while it's being refreshed. The geocoders use this method
+        instead of :meth:`.get`.
+
+        The default implementation returns ``(self.get(key), False)``.
+
+        :param str key: Cache key.
+        :rtype: tuple of (str or ``None``, bool)
+        """
+        return self.get(key), False
+
+    def cache_info(self):
+        """
+        Statistics of the cache, if the cache keeps them.
+
+        :rtype: :class:`.CacheInfo` or ``None``
+        """
+        return None
+
+
+class MemoryCache(BaseCache):
+    """
+    An in-memory LRU cache with entries expiring after ``ttl`` seconds
+    (``negative_ttl`` for the "no result" outcomes).
+
+    When the cache exceeds ``maxsize`` entries or ``max_bytes`` bytes,
+    the least recently used entries are evicted.
+
+    The statistics are available via :meth:`.cache_info`::
+
+        >>> from geopy.cache import MemoryCache
+        >>> cache = MemoryCache(ttl=60, maxsize=2)
+        >>> cache.set('a', '{"lat": 1}')
+        >>> cache.get('a')
+        '{"lat": 1}'
+        >>> cache.get('b')
+        >>> cache.cache_info()
+        CacheInfo(hits=1, misses=1, evictions=0, currsize=1, nbytes=10)
+    """
+
+    def __init__(
+            self,
+            *,
+            ttl=3600,
+            negative_ttl=None,
+            stale_while_revalidate=None,
+            maxsize=1024,
+            max_bytes=None
+    ):
+        """
+        :param float ttl: Time in seconds after which the entries expire.
+            ``None`` means that the entries never expire.
+
+        :param float negative_ttl: Time in seconds after which the
+            "no result" outcomes expire. ``None`` means the same as ``ttl``.
+
+        :param float stale_while_revalidate: Time in seconds after the
+            expiration during which the entries are still served, while
+            being refreshed in the background. ``None`` disables it.
+
+        :param int maxsize: Maximum number of the entries.
+            ``None`` means no limit.
+
+        :param int max_bytes: Maximum total size of the stored values
+            in bytes (UTF-8 encoded). Values larger than that are not
+            stored at all. ``None`` means no limit.
+        """
+        if ttl is not None and ttl <= 0:
+            raise ValueError('ttl must be positive.')
+        if negative_ttl is not None and negative_ttl <= 0:
+            raise ValueError('negative_ttl must be positive.')
+        if stale_while_revalidate is not None and stale_while_revalidate <= 0:
+            raise ValueError('stale_while_revalidate must be positive.')
+        if maxsize is not None and maxsize < 1:
+            raise ValueError('maxsize must be a positive integer.')
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError('max_bytes must be a positive integer.')
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._nbytes = 0
+        self._entries = OrderedDict()  # key -> (value, size, expires)
+        self._lock = threading.Lock()
+
+    def _clock(self):  # pragma: no cover
+        return monotonic()
+
+    def get(self, key):
+        return self._lookup(key, allow_stale=False)[0]
+
+    def lookup(self, key):
+        return self._lookup(key, allow_stale=True)
+
+    def _lookup(self, key, allow_stale):
+        with self._lock:
+            entry = self._entries.get(key)
+            stale = False
+            if entry is not None and entry[2] is not None:
+                now = self._clock()
+                if entry[2] + (self.stale_while_revalidate or 0) <= now:
+                    self._remove(key)
+                    entry = None
+                else:
+                    stale = entry[2] <= now
+            if entry is None or (stale and not allow_stale):
+                self.misses += 1
+                return None, False
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0], stale
+
+    def set(self, key, value, *, negative=False):
+        size = len(value.encode('utf-8'))
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        expires = _expires(self, negative, self._clock())
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, size, expires)
+            self._nbytes += size
+            while (
+                (self.maxsize is not None and len(self._entries) > self.maxsize) or
+                (self.max_bytes is not None and self._nbytes > self.max_bytes)
+            ):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key):
+        _, size, _ = self._entries.pop(key)
+        self._nbytes -= size
+
+    def clear(self):
+        """
+        Remove all of the entries and reset the statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def cache_info(self):
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions,
+                             len(self._entries), self._nbytes)
+
+
+class SQLiteCache(BaseCache):
+    """
+    A persistent cache stored in an SQLite database file.
+
+    The cache survives restarts and might be shared by multiple processes
+    (e.g. the workers of a web server) and threads: the database is opened
+    in the WAL mode, so the readers don't block the writer. The values
+    are compressed with zlib.
+
+    The entries expire after ``ttl`` seconds of the wall-clock time
+    (``negative_ttl`` for the "no result" outcomes).
+    When the cache exceeds ``maxsize`` entries or ``max_bytes`` bytes
+    (of the compressed values), the expired entries and then the oldest
+    ones are evicted. The disk space freed by the evictions is reused
+    by SQLite, call :meth:`.vacuum` to return it to the filesystem.
+
+    ::
+
+        from geopy.cache import SQLiteCache
+        from geopy.geocoders import Nominatim
+
+        cache = SQLiteCache("geocode-cache.sqlite", ttl=86400,
+                            max_bytes=100 * 1024 * 1024)
+        geolocator = Nominatim(user_agent="specify_your_app_name_here",
+                               cache=cache)
+
+    The hits, misses and evictions reported by :meth:`.cache_info`
+    are counted by this instance only, while the size of the cache
+    is shared by all of the processes.
+
+    The cache doesn't wait for long when the database is locked
+    by another writer (see the ``timeout`` argument): the lookup
+    is then counted as a miss, and the response is not stored.
+    In asynchronous mode the cache is called from the event loop,
+    which is blocked for the duration of the wait.
+    """
+
+    _schema = (
+        """
+        CREATE TABLE IF NOT EXISTS entries (
+            key TEXT PRIMARY KEY,
+            value BLOB NOT NULL,
+            size INTEGER NOT NULL,
+            stored REAL NOT NULL,
+            expires REAL
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS entries_stored ON entries (stored)",
+        """
+        CREATE TABLE IF NOT EXISTS totals (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            count INTEGER NOT NULL,
+            nbytes INTEGER NOT NULL
+        )
+        """,
+        "INSERT OR IGNORE INTO totals VALUES (1, 0, 0)",
+        """
+        CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries
+        BEGIN
+            UPDATE totals SET count = count + 1, nbytes = nbytes + NEW.size;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries
+        BEGIN
+            UPDATE totals SET count = count - 1, nbytes = nbytes - OLD.size;
+        END
+        """,
+    )
+
+    def __init__(
+            self,
+            path,
+            *,
+            ttl=86400,
+            negative_ttl=None,
+            stale_while_revalidate=None,
+            maxsize=None,
+            max_bytes=None,
+            compress_level=6,
+            timeout=0.1
+    ):
+        """
+        :param str path: Path to the database file. It is created
+            if it doesn't exist.
+
+        :param float ttl: Time in seconds after which the entries expire.
+            ``None`` means that the entries never expire.
+
+        :param float negative_ttl: Time in seconds after which the
+            "no result" outcomes expire. ``None`` means the same as ``ttl``.
+
+        :param float stale_while_revalidate: Time in seconds after the
+            expiration during which the entries are still served, while
+            being refreshed in the background. ``None`` disables it.
+
+        :param int maxsize: Maximum number of the entries.
+            ``None`` means no limit.
+
+        :param int max_bytes: Maximum total size of the compressed values
+            in bytes. Values larger than that are not stored at all.
+            ``None`` means no limit.
+
+        :param int compress_level: zlib compression level, from 0 (no
+            compression) to 9 (the slowest and the best compression).
+
+        :param float timeout: Time in seconds to wait for the other
+            connections to release the lock of the database. Keep it
+            short with the asynchronous adapters, which wait on the
+            event loop.
+        """
+        if ttl is not None and ttl <= 0:
+            raise ValueError('ttl must be positive.')
+        if negative_ttl is not None and negative_ttl <= 0:
+            raise ValueError('negative_ttl must be positive.')
+        if stale_while_revalidate is not None and stale_while_revalidate <= 0:
+            raise ValueError('stale_while_revalidate must be positive.')
+        if maxsize is not None and maxsize < 1:
+            raise ValueError('maxsize must be a positive integer.')
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError('max_bytes must be a positive integer.')
+        if not 0 <= compress_level <= 9:
+            raise ValueError('compress_level must be between 0 and 9.')
+        self.path = os.fspath(path)
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.compress_level = compress_level
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._conn = None
+        self._pid = None
+        with self._lock:
+            self._connect()
+
+    def _clock(self):  # pragma: no cover
+        # The expiration times are shared between processes, so the
+        # monotonic clock, which is local to a boot, can't be used.
+        return time()
+
+    def _connect(self):
+        # A connection must not be used in a forked child, so the child
+        # (e.g. a pre-forked server worker) opens its own one.
+        if self._conn is not None and self._pid == os.getpid():
+            return self._conn
+        # Imported here, because Python might be built without sqlite3,
+        # and this module is imported by the geocoders.
+        import sqlite3
+        conn = sqlite3.connect(self.path, timeout=self.timeout,
+                               isolation_level=None, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        with conn:
+            for statement in self._schema:
+                conn.execute(statement)
+        self._conn, self._pid = conn, os.getpid()
+        return conn
+
+    def _retention(self, now):
+        # The entries expired before that time can't be served anymore.
+        return now - (self.stale_while_revalidate or 0)
+
+    def get(self, key):
+        return self._lookup(key, allow_stale=False)[0]
+
+    def lookup(self, key):
+        return self._lookup(key, allow_stale=True)
+
+    def _lookup(self, key, allow_stale):
+        now = self._clock()
+        with self._lock:
+            try:
+                row = self._connect().execute(
+                    'SELECT value, expires FROM entries '
+                    'WHERE key = ? AND (expires IS NULL OR expires > ?)',
+                    (key, self._retention(now) if allow_stale else now),
+                ).fetchone()
+            except Exception as error:
+                if not _is_locked(error):
+                    raise
+                row = None
+            if row is None:
+                self.misses += 1
+                return None, False
+            self.hits += 1
+        stale = row[1] is not None and row[1] <= now
+        return zlib.decompress(row[0]).decode('utf-8'), stale
+
+    def set(self, key, value, *, negative=False):
+        data = zlib.compress(value.encode('utf-8'), self.compress_level)
+        if self.max_bytes is not None and len(data) > self.max_bytes:
+            return
+        now = self._clock()
+        expires = _expires(self, negative, now)
+        with self._lock:
+            # BEGIN IMMEDIATE takes the write lock right away, so the
+            # limits are checked consistently with the other processes.
+            try:
+                conn = self._connect()
+                conn.execute('BEGIN IMMEDIATE')
+            except Exception as error:
+                if not _is_locked(error):
+                    raise
+                return
+            try:
+                conn.execute('DELETE FROM entries WHERE key = ?', (key,))
+                conn.execute(
+                    'INSERT INTO entries VALUES (?, ?, ?, ?, ?)',
+                    (key, data, len(data), now, expires),
+                )
+                self._evict(conn, now)
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+            conn.execute('COMMIT')
+
+    def _evict(self, conn, now):
+        count, nbytes = conn.execute(
+            'SELECT count, nbytes FROM totals'
+        ).fetchone()
+        extra_count = 0 if self.maxsize is None else count - self.maxsize
+        extra_bytes = 0 if self.max_bytes is None else nbytes - self.max_bytes
+        if extra_count <= 0 and extra_bytes <= 0:
+            return
+        evicted = conn.execute(
+            'DELETE FROM entries WHERE expires <= ?', (self._retention(now),)
+        ).rowcount
+        if evicted:
+            count, nbytes = conn.execute(
+                'SELECT count, nbytes FROM totals'
+            ).fetchone()
+            extra_count = 0 if self.maxsize is None else count - self.maxsize
+            extra_bytes = 0 if self.max_bytes is None else nbytes - self.max_bytes
+        keys = []
+        for key, size in conn.execute(
+            'SELECT key, size FROM entries ORDER BY stored'
+        ):
+            if extra_count <= 0 and extra_bytes <= 0:
+                break
+            keys.append((key,))
+            extra_count -= 1
+            extra_bytes -= size
+        conn.executemany('DELETE FROM entries WHERE key = ?', keys)
+        self.evictions += evicted + len(keys)
+
+    def vacuum(self):
+        """
+        Remove the expired entries (which can't be served stale anymore)
+        and compact the database file,
+        returning the free space to the filesystem.
+
+        Compaction rewrites the whole database and blocks the other
+        processes using it, so it's better to run it periodically
+        during low load (e.g. from a cron job) rather than while serving
+        the requests.
+        """
+        with self._lock:
+            conn = self._connect()
+            conn.execute('DELETE FROM entries WHERE expires <= ?',
+                         (self._retention(self._clock()),))
+            conn.execute('VACUUM')
+            conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+
+    def clear(self):
+        """
+        Remove all of the entries and reset the statistics.
+        """
+        with self._lock:
+            self._connect().execute('DELETE FROM entries')
+            self.hits = self.misses = self.evictions = 0
+
+    def close(self):
+        """
+        Close the database connection. The cache might still be used
+        afterwards: the connection is reopened when needed.
+        """
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+
+    def cache_info(self):
+        with self._lock:
+            count, nbytes = self._connect().execute(
+                'SELECT count, nbytes FROM totals'
+            ).fetchone()
+            return CacheInfo(self.hits, self.misses, self.evictions,
+                             count, nbytes)
@@ -23,6 +23,15 @@ this is accurate to round-off and always converges.
 
 ``geopy.distance.distance`` currently uses :class:`.geodesic`.
 
+When speed matters more than accuracy, e.g. for short distances in
+large batches, there are faster approximations: :class:`.equirectangular`,
+:class:`.local_projection` and :class:`.andoyer_lambert`. They support
+the same arithmetic and :meth:`.Distance.destination`, and their
+documentation lists their maximum errors relative to :class:`.geodesic`.
+Plain ``(latitude, longitude)`` tuples of floats within the
+[-90; 90] and [-180; 180] ranges are measured without creating
+:class:`.Point` instances, which is noticeably faster in tight loops.
+
 There are multiple popular ellipsoidal models,
 and which one will be the most accurate depends on where your points are
 located on the earth.  The default is the WGS-84 ellipsoid, which is the
@@ -115,15 +124,52 @@ a suitable approximation::
 An attempt to calculate distances between points with different altitudes
 would result in a :class:`ValueError` exception.
 
+.. _distance_processes:
+
+Batch computations (:meth:`.Distance.measure_many`, :func:`.distance_matrix`)
+are CPU-bound, and :class:`.geodesic` is implemented in pure Python,
+so a single process cannot use more than one CPU core for them.
+The ``processes`` argument spreads the work across a pool of worker
+processes. The coordinates and the resulting array are placed to
+:mod:`multiprocessing.shared_memory` once, so only the bounds of
+each chunk are sent to the workers. The results are exactly the same
+for any number of processes::
+
+    >>> import numpy as np
+    >>> from geopy.distance import distance_matrix
+    >>> points = np.random.uniform([-60, -180], [60, 180], size=(20000, 2))
+    >>> matrix = distance_matrix(points, processes=64, chunk_size=512)
+
+As with any :mod:`multiprocessing` code, the entry point of the program
+must be guarded with ``if __name__ == "__main__":`` on the platforms
+where the worker processes are spawned rather than forked.
+
 """
-from math import asin, atan2, cos, sin, sqrt
+import hashlib
+import heapq
+import os
+import threading
+from collections import OrderedDict, namedtuple
+from itertools import islice
+from math import asin, atan, atan2, ceil, cos, sin, sqrt, tan
 
 from geographiclib.geodesic import Geodesic
+from geographiclib.polygonarea import PolygonArea
 
 from geopy import units, util
-from geopy.point import Point
+from geopy.point import (
+    Point,
+    PointArray,
+    _normalize_angle,
+    _normalize_coordinate_arrays,
+)
 from geopy.units import radians
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # IUGG mean earth radius in kilometers, from
 # https://en.wikipedia.org/wiki/Earth_radius#Mean_radius.  Using a
 # sphere with this radius results in an error of up to about 0.5%.
@@ -187,6 +233,129 @@ def _ensure_same_altitude(a, b):
     # it won't give much error.
 
 
+def _ensure_same_altitude_arrays(a, b):
+    if (np.abs(a - b) > 1e-6).any():
+        raise ValueError(
+            'Calculating distance between points with different altitudes '
+            'is not supported'
+        )
+
+
+def _ensure_same_altitude_sets(a, b):
+    # Every altitude of `a` must be equal to every altitude of `b`.
+    if not a.size or not b.size:
+        return
+    _ensure_same_altitude_arrays(
+        np.array([a.max(), b.max()]), np.array([b.min(), a.min()])
+    )
+
+
+def _is_single_point(value):
+    if isinstance(value, (Point, str)):
+        return True
+    return (
+        isinstance(value, (tuple, list))
+        and bool(value)
+        and isinstance(value[0], util.NUMBER_TYPES)
+    )
+
+
+def _points_to_arrays(points, any_shape=False):
+    """
+    Convert points to ``(latitudes, longitudes, altitudes)`` 1-d arrays.
+
+    ``points`` is either a :class:`.PointArray` (its coordinates are
+    used without copying), a numeric numpy array of ``(n, 2)`` or
+    ``(n, 3)`` shape, or an iterable of anything accepted by :class:`.Point`.
+
+    With ``any_shape``, the numpy array might have any number of leading
+    dimensions (its last axis must still hold the coordinates), and
+    a single point (a :class:`.Point`, a string or a sequence of numbers)
+    results in 0-d arrays.
+    """
+    util.ensure_numpy_is_installed()
+    if isinstance(points, PointArray):
+        return points.latitudes, points.longitudes, points.altitudes
+    if isinstance(points, np.ndarray) and points.dtype != object:
+        if any_shape:
+            valid = points.ndim >= 1 and points.shape[-1] in (2, 3)
+        else:
+            valid = points.ndim == 2 and points.shape[1] in (2, 3)
+        if not valid:
+            raise ValueError(
+                'An array of points must have an (n, 2) or (n, 3) shape, '
+                'got %r.' % (points.shape,)
+            )
+        return _normalize_coordinate_arrays(*np.moveaxis(points, -1, 0))
+    if any_shape and _is_single_point(points):
+        point = Point(points)
+        return tuple(np.array(x, dtype=np.float64) for x in point)
+    points = [Point(p) for p in points]
+    return (
+        np.array([p.latitude for p in points], dtype=np.float64),
+        np.array([p.longitude for p in points], dtype=np.float64),
+        np.array([p.altitude for p in points], dtype=np.float64),
+    )
+
+
+def _plain_pair(a, b):
+    """
+    Fast path of ``measure`` for plain ``(latitude, longitude)`` tuples
+    with the coordinates already within the normalized ranges: return
+    ``(lat1, lon1, lat2, lon2)`` floats without creating the Points,
+    or None if the points have to go through :class:`.Point`.
+
+    The result is the same as of the normalization done by
+    :class:`.Point`. Anything else, including the invalid coordinates
+    (which fail the range checks, NaN included), falls back to it,
+    so the same errors are raised.
+    """
+    if type(a) is not tuple or type(b) is not tuple or len(a) != 2 or len(b) != 2:
+        return None
+    try:
+        lat1, lon1, lat2, lon2 = float(a[0]), float(a[1]), float(b[0]), float(b[1])
+    except (TypeError, ValueError):
+        return None
+    if (abs(lat1) <= 90 and abs(lat2) <= 90 and
+            abs(lon1) <= 180 and abs(lon2) <= 180):
+        return lat1, lon1, lat2, lon2
+    return None
+
+
+# `Geodesic` instances shared by all `geodesic` distances, keyed by
+# `(major, flattening)`. Constructing a `Geodesic` precomputes a few
+# dozens of series coefficients, which would otherwise be repeated for
+# every new distance instance. `Geodesic` objects are immutable, so
+# sharing them is safe, including across threads.
+_GEODESICS = {}
+
+
+def _shared_geodesic(major, f):
+    key = (major, f)
+    try:
+        return _GEODESICS[key]
+    except KeyError:
+        geod = _GEODESICS[key] = Geodesic(major, f)
+        return geod
+
+
+def _get_distance_instance(method):
+    if isinstance(method, type) and issubclass(method, Distance):
+        return method()
+    if isinstance(method, Distance):
+        return method
+    raise TypeError(
+        'method must be a Distance subclass or instance, got %r.' % (method,)
+    )
+
+
+def _normalize_pairs(lat1, lon1, lat2, lon2, alt1=None, alt2=None):
+    lat1, lon1, alt1 = _normalize_coordinate_arrays(lat1, lon1, alt1)
+    lat2, lon2, alt2 = _normalize_coordinate_arrays(lat2, lon2, alt2)
+    _ensure_same_altitude_arrays(alt1, alt2)
+    return np.broadcast_arrays(lat1, lon1, lat2, lon2)
+
+
 class Distance:
     """
     Base class for other distance algorithms. Represents a distance.
@@ -281,6 +450,9 @@ class Distance:
     def __add__(self, other):
         if isinstance(other, Distance):
             return self.__class__(self.kilometers + other.kilometers)
+        elif isinstance(other, DistanceArray):
+            # Let `DistanceArray.__radd__` handle it.
+            return NotImplemented
         else:
             raise TypeError(
                 "Distance instance must be added with Distance instance."
@@ -290,9 +462,13 @@ class Distance:
         return self.__class__(-self.kilometers)
 
     def __sub__(self, other):
+        if isinstance(other, DistanceArray):
+            return NotImplemented
         return self + -other
 
     def __mul__(self, other):
+        if isinstance(other, DistanceArray):
+            return NotImplemented
         if isinstance(other, Distance):
             raise TypeError(
                 "Distance instance must be multiplicated with numbers."
@@ -301,6 +477,8 @@ class Distance:
             return self.__class__(self.kilometers * other)
 
     def __rmul__(self, other):
+        if isinstance(other, DistanceArray):
+            return NotImplemented
         if isinstance(other, Distance):
             raise TypeError(
                 "Distance instance must be multiplicated with numbers."
@@ -309,12 +487,16 @@ class Distance:
             return self.__class__(other * self.kilometers)
 
     def __truediv__(self, other):
+        if isinstance(other, DistanceArray):
+            return NotImplemented
         if isinstance(other, Distance):
             return self.kilometers / other.kilometers
         else:
             return self.__class__(self.kilometers / other)
 
     def __floordiv__(self, other):
+        if isinstance(other, DistanceArray):
+            return NotImplemented
         if isinstance(other, Distance):
             return self.kilometers // other.kilometers
         else:
@@ -331,6 +513,136 @@ class Distance:
         # to be used directly.
         raise NotImplementedError("Distance is an abstract class")
 
+    def measure_many(self, lat1, lon1, lat2, lon2, alt1=None, alt2=None, *,
+                     processes=None, chunk_size=65536):
+        """
+        Calculate distances between many pairs of points at once.
+        This method works for non-abstract distances only and
+        requires numpy.
+
+        The coordinates are validated and normalized exactly like
+        :class:`geopy.point.Point` does, and the altitudes must be equal
+        just like for the single-pair distances
+        (see :ref:`distance_altitudes`).
+
+        Example::
+
+            >>> import numpy as np
+            >>> from geopy.distance import geodesic
+            >>> lat1, lon1 = np.array([41.49008, 40.0]), np.array([-71.312796, 160])
+            >>> lat2, lon2 = np.array([41.499498, 40.1]), np.array([-81.695391, 160.1])
+            >>> geodesic().measure_many(lat1, lon1, lat2, lon2)
+            array([866.45543291,  14.0037025 ])
+
+        .. versionadded:: 2.6
+
+        :param lat1: Latitudes of the first points of the pairs.
+        :type lat1: numpy array, sequence or any object supporting
+            the buffer protocol.
+
+        :param lon1: Longitudes of the first points of the pairs.
+
+        :param lat2: Latitudes of the second points of the pairs.
+
+        :param lon2: Longitudes of the second points of the pairs.
+
+        :param alt1: Optional altitudes of the first points (in km).
+
+        :param alt2: Optional altitudes of the second points (in km).
+
+        :param int processes: Number of worker processes to spread
+            the computation across. By default everything is calculated
+            in the current process. See :ref:`distance_processes`.
+
+        :param int chunk_size: Number of pairs in a single task sent
+            to a worker process. Ignored without ``processes``.
+
+        :return: Distances in kilometers, shaped as the broadcast inputs.
+        :rtype: numpy float64 array
+        """
+        lat1, lon1, lat2, lon2 = _normalize_pairs(lat1, lon1, lat2, lon2,
+                                                  alt1, alt2)
+        if not _use_processes(processes, chunk_size):
+            return self._measure_arrays(lat1, lon1, lat2, lon2)
+        shape = lat1.shape
+        inputs = [np.ascontiguousarray(x).ravel() for x in (lat1, lon1, lat2, lon2)]
+        out = np.empty(inputs[0].shape, dtype=np.float64)
+        size = out.size
+        tasks = [
+            (start, min(start + chunk_size, size))
+            for start in range(0, size, chunk_size)
+        ]
+        _run_in_processes(processes, _measure_worker, tasks, self, inputs, out)
+        return out.reshape(shape)
+
+    def _measure_arrays(self, lat1, lon1, lat2, lon2):
+        # Same as `measure_many`, but the arguments are expected to be
+        # already normalized arrays of the same shape.
+        raise NotImplementedError("Distance is an abstract class")
+
+    def inverse(self, a, b):
+        """
+        Calculate the distance between two points along with the bearings
+        of the path between them at both ends. This method works for
+        non-abstract distances only.
+
+        This is cheaper than calculating the distance and the bearings
+        separately::
+
+            >>> from geopy.distance import geodesic
+            >>> newport_ri = (41.49008, -71.312796)
+            >>> cleveland_oh = (41.499498, -81.695391)
+            >>> geodesic().inverse(newport_ri, cleveland_oh)
+            (866.4554329098685, -86.48625264954396, -93.3758735015122)
+
+        .. versionadded:: 2.6
+
+        :param a: The first point.
+        :type a: :class:`geopy.point.Point`, list or tuple of ``(latitude,
+            longitude)``, or string as ``"%(latitude)s, %(longitude)s"``.
+
+        :param b: The second point.
+
+        :return: ``(distance, azi1, azi2)``: the distance in kilometers,
+            the bearing from ``a`` towards ``b`` and the bearing of the
+            path when it arrives to ``b`` (i.e. the direction of travel at
+            ``b``, not the bearing from ``b`` back to ``a``), in degrees
+            within the [-180; 180] range.
+        :rtype: tuple of three floats
+        """
+        raise NotImplementedError("Distance is an abstract class")
+
+    def inverse_many(self, lat1, lon1, lat2, lon2, alt1=None, alt2=None):
+        """
+        Vectorized :meth:`.inverse`: calculate distances and bearings
+        between many pairs of points at once. This method works for
+        non-abstract distances only and requires numpy.
+
+        The arguments are the same as of :meth:`.measure_many`::
+
+            >>> from geopy.distance import great_circle
+            >>> distances, azi1, azi2 = great_circle().inverse_many(
+            ...     [41.49008, 0], [-71.312796, 0], [41.499498, 0], [-81.695391, 1]
+            ... )
+            >>> azi1
+            array([-86.48601156,  90.        ])
+
+        .. versionadded:: 2.6
+
+        :return: Distances in kilometers, bearings at the first points
+            and bearings at the second points, shaped as the broadcast
+            inputs.
+        :rtype: tuple of three numpy float64 arrays
+        """
+        lat1, lon1, lat2, lon2 = _normalize_pairs(lat1, lon1, lat2, lon2,
+                                                  alt1, alt2)
+        return self._inverse_arrays(lat1, lon1, lat2, lon2)
+
+    def _inverse_arrays(self, lat1, lon1, lat2, lon2):
+        # Same as `inverse_many`, but the arguments are expected to be
+        # already normalized arrays of the same shape.
+        raise NotImplementedError("Distance is an abstract class")
+
     def destination(self, point, bearing, distance=None):
         """
         Calculate destination point using a starting point, bearing
@@ -363,6 +675,71 @@ distance=Distance(100))
         """
         raise NotImplementedError("Distance is an abstract class")
 
+    def destination_many(self, points, bearings, distances=None):
+        """
+        Calculate many destination points at once, see :meth:`.destination`.
+        This method works for non-abstract distances only and
+        requires numpy.
+
+        ``points``, ``bearings`` and ``distances`` are broadcast
+        against each other following the numpy rules, where ``points``
+        count as an array of their leading dimensions. For example,
+        360-vertex rings around many sites::
+
+            >>> import numpy as np
+            >>> from geopy.distance import geodesic
+            >>> sites = np.array([[34, 148], [-41.32, 174.81]])
+            >>> bearings = np.arange(0, 360, 1.0)
+            >>> lat, lon = geodesic().destination_many(
+            ...     sites[:, None, :], bearings, distances=10
+            ... )
+            >>> lat.shape
+            (2, 360)
+
+        .. versionadded:: 2.6
+
+        :param points: Starting points: a single point (e.g.
+            a :class:`geopy.point.Point` or a ``(latitude, longitude)``
+            tuple), an iterable of anything accepted by
+            :class:`geopy.point.Point`, a :class:`geopy.point.PointArray`,
+            or a numpy array with the last axis holding
+            ``(latitude, longitude[, altitude])``.
+
+        :param bearings: Bearings in degrees.
+
+        :param distances: Distances in kilometers, or a :class:`.Distance`.
+            Defaults to this instance.
+
+        :return: Latitudes and longitudes of the destination points.
+        :rtype: tuple of two numpy float64 arrays
+        """
+        lat1, lon1, _ = _points_to_arrays(points, any_shape=True)
+        if distances is None:
+            distances = self
+        if isinstance(distances, Distance):
+            distances = distances.kilometers
+        lat1, lon1, bearings, distances = np.broadcast_arrays(
+            lat1, lon1,
+            np.asarray(bearings, dtype=np.float64),
+            np.asarray(distances, dtype=np.float64),
+        )
+        lat2, lon2 = self._destination_arrays(lat1, lon1, bearings, distances)
+        lat2, lon2, _ = _normalize_coordinate_arrays(lat2, lon2)
+        return lat2, lon2
+
+    def _destination_arrays(self, lat1, lon1, bearings, distances):
+        # Same as `destination_many`, but the arguments are expected
+        # to be normalized arrays of the same shape.
+        raise NotImplementedError("Distance is an abstract class")
+
+    def _radian_bounds(self):
+        # Lower and upper bounds of the distance (in km) per one radian
+        # of the central angle between the points placed on a sphere
+        # by their latitudes and longitudes. Used to prune candidates
+        # in spatial searches, see `geopy.index`. Approximate distances
+        # which cannot be bounded like that return None.
+        raise NotImplementedError("Distance is an abstract class")
+
     def __repr__(self):  # pragma: no cover
         return 'Distance(%s)' % self.kilometers
 
@@ -379,21 +756,33 @@ distance=Distance(100))
         return hash(self.kilometers)
 
     def __eq__(self, other):
+        if isinstance(other, DistanceArray):
+            return NotImplemented
         return self.__cmp__(other) == 0
 
     def __ne__(self, other):
+        if isinstance(other, DistanceArray):
+            return NotImplemented
         return self.__cmp__(other) != 0
 
     def __gt__(self, other):
+        if isinstance(other, DistanceArray):
+            return NotImplemented
         return self.__cmp__(other) > 0
 
     def __lt__(self, other):
+        if isinstance(other, DistanceArray):
+            return NotImplemented
         return self.__cmp__(other) < 0
 
     def __ge__(self, other):
+        if isinstance(other, DistanceArray):
+            return NotImplemented
         return self.__cmp__(other) >= 0
 
     def __le__(self, other):
+        if isinstance(other, DistanceArray):
+            return NotImplemented
         return self.__cmp__(other) <= 0
 
     @property
@@ -461,11 +850,13 @@ class great_circle(Distance):
         super().__init__(*args, **kwargs)
 
     def measure(self, a, b):
-        a, b = Point(a), Point(b)
-        _ensure_same_altitude(a, b)
+        pair = _plain_pair(a, b)
+        if pair is None:
+            a, b = Point(a), Point(b)
+            _ensure_same_altitude(a, b)
+            pair = a.latitude, a.longitude, b.latitude, b.longitude
 
-        lat1, lng1 = radians(degrees=a.latitude), radians(degrees=a.longitude)
-        lat2, lng2 = radians(degrees=b.latitude), radians(degrees=b.longitude)
+        lat1, lng1, lat2, lng2 = map(radians, pair)
 
         sin_lat1, cos_lat1 = sin(lat1), cos(lat1)
         sin_lat2, cos_lat2 = sin(lat2), cos(lat2)
@@ -480,6 +871,71 @@ class great_circle(Distance):
 
         return self.RADIUS * d
 
+    def _measure_arrays(self, lat1, lon1, lat2, lon2):
+        lat1, lng1 = np.radians(lat1), np.radians(lon1)
+        lat2, lng2 = np.radians(lat2), np.radians(lon2)
+
+        sin_lat1, cos_lat1 = np.sin(lat1), np.cos(lat1)
+        sin_lat2, cos_lat2 = np.sin(lat2), np.cos(lat2)
+
+        delta_lng = lng2 - lng1
+        cos_delta_lng, sin_delta_lng = np.cos(delta_lng), np.sin(delta_lng)
+
+        d = np.arctan2(np.hypot(cos_lat2 * sin_delta_lng,
+                                cos_lat1 * sin_lat2 -
+                                sin_lat1 * cos_lat2 * cos_delta_lng),
+                       sin_lat1 * sin_lat2 + cos_lat1 * cos_lat2 * cos_delta_lng)
+
+        return self.RADIUS * d
+
+    def inverse(self, a, b):
+        a, b = Point(a), Point(b)
+        _ensure_same_altitude(a, b)
+
+        lat1, lng1 = radians(degrees=a.latitude), radians(degrees=a.longitude)
+        lat2, lng2 = radians(degrees=b.latitude), radians(degrees=b.longitude)
+
+        sin_lat1, cos_lat1 = sin(lat1), cos(lat1)
+        sin_lat2, cos_lat2 = sin(lat2), cos(lat2)
+
+        delta_lng = lng2 - lng1
+        cos_delta_lng, sin_delta_lng = cos(delta_lng), sin(delta_lng)
+
+        # Components of the initial direction, which are also
+        # the terms of the distance formula.
+        y = cos_lat2 * sin_delta_lng
+        x = cos_lat1 * sin_lat2 - sin_lat1 * cos_lat2 * cos_delta_lng
+
+        d = atan2(sqrt(y ** 2 + x ** 2),
+                  sin_lat1 * sin_lat2 + cos_lat1 * cos_lat2 * cos_delta_lng)
+        azi1 = atan2(y, x)
+        azi2 = atan2(cos_lat1 * sin_delta_lng,
+                     sin_lat2 * cos_lat1 * cos_delta_lng - cos_lat2 * sin_lat1)
+
+        return (self.RADIUS * d, units.degrees(radians=azi1),
+                units.degrees(radians=azi2))
+
+    def _inverse_arrays(self, lat1, lon1, lat2, lon2):
+        lat1, lng1 = np.radians(lat1), np.radians(lon1)
+        lat2, lng2 = np.radians(lat2), np.radians(lon2)
+
+        sin_lat1, cos_lat1 = np.sin(lat1), np.cos(lat1)
+        sin_lat2, cos_lat2 = np.sin(lat2), np.cos(lat2)
+
+        delta_lng = lng2 - lng1
+        cos_delta_lng, sin_delta_lng = np.cos(delta_lng), np.sin(delta_lng)
+
+        y = cos_lat2 * sin_delta_lng
+        x = cos_lat1 * sin_lat2 - sin_lat1 * cos_lat2 * cos_delta_lng
+
+        d = np.arctan2(np.hypot(y, x),
+                       sin_lat1 * sin_lat2 + cos_lat1 * cos_lat2 * cos_delta_lng)
+        azi1 = np.arctan2(y, x)
+        azi2 = np.arctan2(cos_lat1 * sin_delta_lng,
+                          sin_lat2 * cos_lat1 * cos_delta_lng - cos_lat2 * sin_lat1)
+
+        return self.RADIUS * d, np.degrees(azi1), np.degrees(azi2)
+
     def destination(self, point, bearing, distance=None):
         point = Point(point)
         lat1 = units.radians(degrees=point.latitude)
@@ -505,6 +961,23 @@ class great_circle(Distance):
 
         return Point(units.degrees(radians=lat2), units.degrees(radians=lng2))
 
+    def _radian_bounds(self):
+        return self.RADIUS, self.RADIUS
+
+    def _destination_arrays(self, lat1, lon1, bearings, distances):
+        lat1, lng1 = np.radians(lat1), np.radians(lon1)
+        bearings = np.radians(bearings)
+        d_div_r = distances / self.RADIUS
+        sin_lat1, cos_lat1 = np.sin(lat1), np.cos(lat1)
+        sin_d, cos_d = np.sin(d_div_r), np.cos(d_div_r)
+
+        lat2 = np.arcsin(sin_lat1 * cos_d + cos_lat1 * sin_d * np.cos(bearings))
+        lng2 = lng1 + np.arctan2(
+            np.sin(bearings) * sin_d * cos_lat1,
+            cos_d - sin_lat1 * np.sin(lat2)
+        )
+        return np.degrees(lat2), np.degrees(lng2)
+
 
 GreatCircleDistance = great_circle
 
@@ -552,21 +1025,55 @@ class geodesic(Distance):
             self.ELLIPSOID = ellipsoid
             self.ellipsoid_key = None
 
+    def _get_geod(self):
+        geod = self.geod
+        major, _, f = self.ELLIPSOID
+        if not (isinstance(geod, Geodesic) and geod.a == major and geod.f == f):
+            self.geod = geod = _shared_geodesic(major, f)
+        return geod
+
     def measure(self, a, b):
+        pair = _plain_pair(a, b)
+        if pair is None:
+            a, b = Point(a), Point(b)
+            _ensure_same_altitude(a, b)
+            pair = a.latitude, a.longitude, b.latitude, b.longitude
+
+        return self._get_geod().Inverse(*pair, outmask=Geodesic.DISTANCE)['s12']
+
+    def _measure_arrays(self, lat1, lon1, lat2, lon2):
+        inverse = self._get_geod().Inverse
+        # geographiclib is pure Python, so plain floats are much faster
+        # to work with than numpy scalars.
+        s12 = [
+            inverse(*pair, outmask=Geodesic.DISTANCE)['s12']
+            for pair in zip(lat1.ravel().tolist(), lon1.ravel().tolist(),
+                            lat2.ravel().tolist(), lon2.ravel().tolist())
+        ]
+        return np.array(s12, dtype=np.float64).reshape(lat1.shape)
+
+    def inverse(self, a, b):
         a, b = Point(a), Point(b)
         _ensure_same_altitude(a, b)
-        lat1, lon1 = a.latitude, a.longitude
-        lat2, lon2 = b.latitude, b.longitude
-
-        if not (isinstance(self.geod, Geodesic) and
-                self.geod.a == self.ELLIPSOID[0] and
-                self.geod.f == self.ELLIPSOID[2]):
-            self.geod = Geodesic(self.ELLIPSOID[0], self.ELLIPSOID[2])
 
-        s12 = self.geod.Inverse(lat1, lon1, lat2, lon2,
-                                Geodesic.DISTANCE)['s12']
-
-        return s12
+        r = self._get_geod().Inverse(a.latitude, a.longitude,
+                                     b.latitude, b.longitude,
+                                     Geodesic.DISTANCE | Geodesic.AZIMUTH)
+
+        return r['s12'], r['azi1'], r['azi2']
+
+    def _inverse_arrays(self, lat1, lon1, lat2, lon2):
+        inverse = self._get_geod().Inverse
+        outmask = Geodesic.DISTANCE | Geodesic.AZIMUTH
+        result = np.empty((3,) + lat1.shape, dtype=np.float64)
+        s12, azi1, azi2 = result
+        for i, pair in enumerate(zip(lat1.ravel().tolist(), lon1.ravel().tolist(),
+                                     lat2.ravel().tolist(), lon2.ravel().tolist())):
+            r = inverse(*pair, outmask=outmask)
+            s12.flat[i] = r['s12']
+            azi1.flat[i] = r['azi1']
+            azi2.flat[i] = r['azi2']
+        return s12, azi1, azi2
 
     def destination(self, point, bearing, distance=None):
         point = Point(point)
@@ -579,18 +1086,1832 @@ class geodesic(Distance):
         if isinstance(distance, Distance):
             distance = distance.kilometers
 
-        if not (isinstance(self.geod, Geodesic) and
-                self.geod.a == self.ELLIPSOID[0] and
-                self.geod.f == self.ELLIPSOID[2]):
-            self.geod = Geodesic(self.ELLIPSOID[0], self.ELLIPSOID[2])
-
-        r = self.geod.Direct(lat1, lon1, azi1, distance,
-                             Geodesic.LATITUDE | Geodesic.LONGITUDE)
+        r = self._get_geod().Direct(lat1, lon1, azi1, distance,
+                                    Geodesic.LATITUDE | Geodesic.LONGITUDE)
 
         return Point(r['lat2'], r['lon2'])
 
+    def _radian_bounds(self):
+        # The meridional and the prime vertical radii of curvature
+        # range between a * (1 - e2) and a / sqrt(1 - e2), so the length
+        # of any path on the ellipsoid is within these factors of the
+        # length of the same path on the unit sphere.
+        major, _, f = self.ELLIPSOID
+        e2 = f * (2 - f)
+        radii = (major * (1 - e2), major / sqrt(1 - e2))
+        return min(radii), max(radii)
+
+    def _destination_arrays(self, lat1, lon1, bearings, distances):
+        direct = self._get_geod().Direct
+        outmask = Geodesic.LATITUDE | Geodesic.LONGITUDE
+        lat2 = np.empty(lat1.shape, dtype=np.float64)
+        lon2 = np.empty(lat1.shape, dtype=np.float64)
+        # geographiclib is pure Python, so plain floats are much faster
+        # to work with than numpy scalars.
+        for i, args in enumerate(zip(lat1.ravel().tolist(), lon1.ravel().tolist(),
+                                     bearings.ravel().tolist(),
+                                     distances.ravel().tolist())):
+            r = direct(*args, outmask=outmask)
+            lat2.flat[i] = r['lat2']
+            lon2.flat[i] = r['lon2']
+        return lat2, lon2
+
+    def _line_positions(self, line, segments):
+        """
+        Split a ``GeodesicLine`` into ``segments`` equal parts and return
+        the latitudes and the longitudes of the inner split points.
+        """
+        position, step = line.Position, line.s13 / segments
+        outmask = Geodesic.LATITUDE | Geodesic.LONGITUDE
+        latitudes, longitudes = [], []
+        for i in range(1, segments):
+            r = position(step * i, outmask)
+            latitudes.append(r['lat2'])
+            longitudes.append(r['lon2'])
+        return latitudes, longitudes
+
+    def interpolate(self, a, b, n):
+        """
+        Return ``n`` points evenly spaced along the geodesic between
+        ``a`` and ``b``, including both of them. Requires numpy.
+
+        The geodesic is solved only once, the points are then placed
+        along it, which is much faster than calling :meth:`.destination`
+        for each of them::
+
+            >>> from geopy.distance import geodesic
+            >>> latitudes, longitudes = geodesic().interpolate((0, 0), (0, 10), 3)
+            >>> latitudes, longitudes
+            (array([0., 0., 0.]), array([ 0.,  5., 10.]))
+
+        .. versionadded:: 2.6
+
+        :param a: The first point.
+        :type a: :class:`geopy.point.Point`, list or tuple of ``(latitude,
+            longitude)``, or string as ``"%(latitude)s, %(longitude)s"``.
+
+        :param b: The last point.
+
+        :param int n: Number of the points, at least 2.
+
+        :return: Latitudes and longitudes of the points.
+        :rtype: tuple of two numpy arrays
+        """
+        util.ensure_numpy_is_installed()
+        if n < 2:
+            raise ValueError('n must be at least 2.')
+        a, b = Point(a), Point(b)
+        _ensure_same_altitude(a, b)
+        line = self._get_geod().InverseLine(
+            a.latitude, a.longitude, b.latitude, b.longitude
+        )
+        latitudes, longitudes = self._line_positions(line, n - 1)
+        return (
+            np.array([a.latitude] + latitudes + [b.latitude], dtype=np.float64),
+            np.array([a.longitude] + longitudes + [b.longitude], dtype=np.float64),
+        )
+
+    def densify(self, path, max_segment):
+        """
+        Insert points into the segments of a path, so that no segment
+        is longer than ``max_segment``. Requires numpy.
+
+        Each segment is split into the minimal number of equal parts
+        along its geodesic. The vertices of the path are kept::
+
+            >>> from geopy.distance import geodesic
+            >>> latitudes, longitudes = geodesic().densify(
+            ...     [(0, 0), (0, 1), (0, 3)], max_segment=150)
+            >>> latitudes, longitudes
+            (array([0., 0., 0., 0.]), array([0., 1., 2., 3.]))
+
+        .. versionadded:: 2.6
+
+        :param path: Vertices of the path: an iterable of anything
+            accepted by :class:`geopy.point.Point`, a
+            :class:`geopy.point.PointArray`, or a numpy array of ``(n, 2)``
+            or ``(n, 3)`` shape of ``(latitude, longitude[, altitude])``
+            rows. Adjacent vertices must have the same altitude
+            (see :ref:`distance_altitudes`).
+
+        :param max_segment: Maximum length of the resulting segments
+            in kilometers.
+        :type max_segment: float or :class:`geopy.distance.Distance`
+
+        :return: Latitudes and longitudes of the resulting path.
+        :rtype: tuple of two numpy arrays
+        """
+        if isinstance(max_segment, Distance):
+            max_segment = max_segment.kilometers
+        if not max_segment > 0:
+            raise ValueError('max_segment must be positive.')
+        latitudes, longitudes, altitudes = _points_to_arrays(path)
+        _ensure_same_altitude_arrays(altitudes[:-1], altitudes[1:])
+        inverse_line = self._get_geod().InverseLine
+        lat_list, lon_list = latitudes.tolist(), longitudes.tolist()
+        result_lat, result_lon = lat_list[:1], lon_list[:1]
+        for i in range(len(lat_list) - 1):
+            line = inverse_line(lat_list[i], lon_list[i],
+                                lat_list[i + 1], lon_list[i + 1])
+            segments = max(ceil(line.s13 / max_segment), 1)
+            inner_lat, inner_lon = self._line_positions(line, segments)
+            result_lat.extend(inner_lat)
+            result_lon.extend(inner_lon)
+            result_lat.append(lat_list[i + 1])
+            result_lon.append(lon_list[i + 1])
+        return (
+            np.array(result_lat, dtype=np.float64),
+            np.array(result_lon, dtype=np.float64),
+        )
+
+    def polygon_area(self, points, signed=False):
+        """
+        Calculate the area and the perimeter of a geodesic polygon.
+
+        The edges of the polygon are geodesics. The polygon is closed
+        implicitly, repeating its first vertex at the end is allowed::
+
+            >>> from geopy.distance import geodesic
+            >>> geodesic().polygon_area([(0, 0), (0, 1), (1, 1), (1, 0)])
+            (12308.77836146945, 443.77091724830194)
+
+        .. versionadded:: 2.6
+
+        :param points: Vertices of the polygon, an iterable of anything
+            accepted by :class:`geopy.point.Point`.
+
+        :param bool signed: Return a negative area for a polygon
+            traversed clockwise. By default the area is returned
+            regardless of the direction of the traversal.
+
+        :return: The area in square kilometers and the perimeter
+            in kilometers.
+        :rtype: tuple of two floats
+        """
+        polygon = PolygonArea(self._get_geod())
+        for point in points:
+            point = Point(point)
+            polygon.AddPoint(point.latitude, point.longitude)
+        _, perimeter, area = polygon.Compute(False, True)
+        return (area if signed else abs(area)), perimeter
+
+    def polygon_area_many(self, coordinates, offsets, signed=False):
+        """
+        Vectorized :meth:`.polygon_area` for many polygons, which are
+        passed as a flat coordinate buffer and ring offsets. Requires numpy.
+
+        The vertices of the polygon ``i`` are
+        ``coordinates[offsets[i]:offsets[i + 1]]``::
+
+            >>> from geopy.distance import geodesic
+            >>> coordinates = [0, 0, 0, 1, 1, 1, 1, 0,  10, 10, 11, 10, 10, 11]
+            >>> areas, perimeters = geodesic().polygon_area_many(
+            ...     coordinates, [0, 4, 7])
+            >>> areas
+            array([12308.77836147,  6063.96329072])
+            >>> perimeters
+            array([443.77091725, 375.87071041])
+
+        .. versionadded:: 2.6
+
+        :param coordinates: Vertices of all the polygons: a numpy array
+            of ``(n, 2)`` shape of ``(latitude, longitude)`` rows, a flat
+            sequence or any object supporting the buffer protocol with
+            ``latitude, longitude`` pairs, or a
+            :class:`geopy.point.PointArray`.
+
+        :param offsets: ``m + 1`` non-decreasing indices of the vertices
+            where the ``m`` polygons start, the last one is the end of
+            the last polygon.
+        :type offsets: numpy array, sequence or any object supporting
+            the buffer protocol.
+
+        :param bool signed: Return negative areas for polygons
+            traversed clockwise.
+
+        :return: Areas in square kilometers and perimeters in kilometers.
+        :rtype: tuple of two numpy arrays
+        """
+        util.ensure_numpy_is_installed()
+        if isinstance(coordinates, PointArray):
+            latitudes, longitudes = coordinates.latitudes, coordinates.longitudes
+        else:
+            coordinates = np.asarray(coordinates, dtype=np.float64)
+            if not (coordinates.ndim == 2 and coordinates.shape[1] == 2
+                    or coordinates.ndim == 1 and coordinates.size % 2 == 0):
+                raise ValueError(
+                    'Coordinates must be an (n, 2) array or a flat sequence '
+                    'of latitude, longitude pairs, got %r shape.'
+                    % (coordinates.shape,)
+                )
+            coordinates = coordinates.reshape(-1, 2)
+            latitudes, longitudes, _ = _normalize_coordinate_arrays(
+                coordinates[:, 0], coordinates[:, 1]
+            )
+        offsets = np.asarray(offsets)
+        if offsets.ndim != 1 or not len(offsets):
+            raise ValueError('Offsets must be a non-empty 1-d sequence.')
+        if offsets.dtype.kind not in 'iu':
+            raise TypeError('Offsets must be integers.')
+        if (offsets[0] < 0 or offsets[-1] > len(latitudes)
+                or (np.diff(offsets) < 0).any()):
+            raise ValueError(
+                'Offsets must be non-decreasing and within the coordinates.'
+            )
+
+        polygon = PolygonArea(self._get_geod())
+        add_point, compute, clear = polygon.AddPoint, polygon.Compute, polygon.Clear
+        # geographiclib is pure Python, so plain floats are much faster
+        # to work with than numpy scalars.
+        lat_list, lon_list = latitudes.tolist(), longitudes.tolist()
+        offsets = offsets.tolist()
+        areas = np.empty(len(offsets) - 1, dtype=np.float64)
+        perimeters = np.empty(len(offsets) - 1, dtype=np.float64)
+        for i, (start, end) in enumerate(zip(offsets, offsets[1:])):
+            clear()
+            for j in range(start, end):
+                add_point(lat_list[j], lon_list[j])
+            _, perimeters[i], areas[i] = compute(False, True)
+        if not signed:
+            areas = np.abs(areas)
+        return areas, perimeters
+
 
 GeodesicDistance = geodesic
 
 # Set the default distance formula
 distance = GeodesicDistance
+
+
+def _wrap_longitudes(delta):
+    # Vectorized `_normalize_angle(delta, 180)`.
+    return (delta + 180.0) % 360.0 - 180.0
+
+
+class equirectangular(Distance):
+    """
+    Approximate the distance between points by projecting them
+    to a plane (the equirectangular projection), which is much faster
+    than :class:`.great_circle`.
+
+    The longitude difference is scaled by the cosine of the middle
+    latitude of the points, and the earth is a sphere of ``radius``
+    kilometers, like in :class:`.great_circle`.
+
+    Compared to :class:`.geodesic` on WGS-84, the error comes mostly from
+    the spherical model: it is within 1% for distances up to 1000 km
+    between latitudes of -70..70 degrees. It grows quickly with longer
+    distances (over 50% for 5000 km at 60 degrees) and closer to
+    the poles (10% for 100 km at 89 degrees), and :meth:`.destination`
+    fails for paths crossing a pole.
+
+    Example::
+
+        >>> from geopy.distance import equirectangular
+        >>> newport_ri = (41.49008, -71.312796)
+        >>> cleveland_oh = (41.499498, -81.695391)
+        >>> print(equirectangular(newport_ri, cleveland_oh).miles)
+        537.32125164
+
+    .. versionadded:: 2.6
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.RADIUS = kwargs.pop('radius', EARTH_RADIUS)
+        super().__init__(*args, **kwargs)
+
+    def measure(self, a, b):
+        a, b = Point(a), Point(b)
+        _ensure_same_altitude(a, b)
+
+        mid_lat = radians(degrees=(a.latitude + b.latitude) / 2)
+        x = radians(degrees=_normalize_angle(b.longitude - a.longitude, 180.0))
+        y = radians(degrees=b.latitude - a.latitude)
+        return self.RADIUS * sqrt((x * cos(mid_lat)) ** 2 + y ** 2)
+
+    def _measure_arrays(self, lat1, lon1, lat2, lon2):
+        mid_lat = np.radians((lat1 + lat2) / 2)
+        x = np.radians(_wrap_longitudes(lon2 - lon1)) * np.cos(mid_lat)
+        y = np.radians(lat2 - lat1)
+        return self.RADIUS * np.hypot(x, y)
+
+    def destination(self, point, bearing, distance=None):
+        point = Point(point)
+        bearing = radians(degrees=bearing)
+
+        if distance is None:
+            distance = self
+        if isinstance(distance, Distance):
+            distance = distance.kilometers
+
+        d_div_r = float(distance) / self.RADIUS
+        lat2 = point.latitude + units.degrees(radians=d_div_r * cos(bearing))
+        mid_lat = radians(degrees=(point.latitude + lat2) / 2)
+        lng2 = point.longitude + units.degrees(
+            radians=d_div_r * sin(bearing) / cos(mid_lat)
+        )
+        return Point(lat2, lng2)
+
+    def _destination_arrays(self, lat1, lon1, bearings, distances):
+        bearings = np.radians(bearings)
+        d_div_r = distances / self.RADIUS
+        lat2 = lat1 + np.degrees(d_div_r * np.cos(bearings))
+        mid_lat = np.radians((lat1 + lat2) / 2)
+        lon2 = lon1 + np.degrees(d_div_r * np.sin(bearings) / np.cos(mid_lat))
+        return lat2, lon2
+
+    def _radian_bounds(self):
+        return None
+
+
+class local_projection(geodesic):
+    """
+    Approximate the distance between points on the ellipsoid by
+    projecting them to a plane tangent at a reference latitude.
+    This is as fast as :class:`.equirectangular`, but much more
+    accurate for short distances.
+
+    The scale factors of the plane are the radii of curvature of the
+    ellipsoid (see :class:`.geodesic` for the ``ellipsoid`` argument)
+    at the reference latitude. By default it is the middle latitude
+    of each pair of points. A fixed ``reference_latitude`` (e.g. of
+    the center of a city) makes the factors computed just once, which
+    is faster still, but only accurate near that latitude.
+
+    Compared to :class:`.geodesic`, with the default middle latitude
+    the relative error is within 1e-6 (1 mm per km) for distances up
+    to 10 km, 1e-4 for distances up to 100 km and 1.5% for 1000 km
+    between latitudes of -70..70 degrees. Closer to the poles the error
+    grows (1.6% for 100 km at 89 degrees). With a fixed
+    ``reference_latitude``, the east-west scale is additionally off by
+    about the tangent of the latitude times the latitude difference
+    (in radians) from it: 0.16% for points 10 km north of a reference
+    latitude of 45 degrees.
+
+    :meth:`.inverse` is inherited from :class:`.geodesic` and is exact.
+
+    Example::
+
+        >>> from geopy.distance import local_projection
+        >>> a = (52.5163, 13.3777)
+        >>> b = (52.5096, 13.3761)
+        >>> local_projection(a, b).m
+        753.4279318855623
+        >>> local_projection(a, b, reference_latitude=52.52).m
+        753.4263098357385
+
+    .. versionadded:: 2.6
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.reference_latitude = kwargs.pop('reference_latitude', None)
+        self._factors = None
+        super().__init__(*args, **kwargs)
+
+    def _scale_factors(self, latitude):
+        # Kilometers per radian of longitude and latitude.
+        major, _, f = self.ELLIPSOID
+        e2 = f * (2 - f)
+        w = 1 - e2 * sin(latitude) ** 2
+        return major / sqrt(w) * cos(latitude), major * (1 - e2) / w ** 1.5
+
+    def _fixed_scale_factors(self):
+        key = (self.reference_latitude, self.ELLIPSOID)
+        if self._factors is None or self._factors[0] != key:
+            factors = self._scale_factors(radians(degrees=self.reference_latitude))
+            self._factors = (key, factors)
+        return self._factors[1]
+
+    def _scale_factor_arrays(self, latitudes):
+        major, _, f = self.ELLIPSOID
+        e2 = f * (2 - f)
+        w = 1 - e2 * np.sin(latitudes) ** 2
+        return major / np.sqrt(w) * np.cos(latitudes), major * (1 - e2) / w ** 1.5
+
+    def measure(self, a, b):
+        a, b = Point(a), Point(b)
+        _ensure_same_altitude(a, b)
+
+        if self.reference_latitude is None:
+            kx, ky = self._scale_factors(
+                radians(degrees=(a.latitude + b.latitude) / 2)
+            )
+        else:
+            kx, ky = self._fixed_scale_factors()
+        x = radians(degrees=_normalize_angle(b.longitude - a.longitude, 180.0))
+        y = radians(degrees=b.latitude - a.latitude)
+        return sqrt((kx * x) ** 2 + (ky * y) ** 2)
+
+    def _measure_arrays(self, lat1, lon1, lat2, lon2):
+        if self.reference_latitude is None:
+            kx, ky = self._scale_factor_arrays(np.radians((lat1 + lat2) / 2))
+        else:
+            kx, ky = self._fixed_scale_factors()
+        x = np.radians(_wrap_longitudes(lon2 - lon1))
+        y = np.radians(lat2 - lat1)
+        return np.hypot(kx * x, ky * y)
+
+    def destination(self, point, bearing, distance=None):
+        point = Point(point)
+        bearing = radians(degrees=bearing)
+
+        if distance is None:
+            distance = self
+        if isinstance(distance, Distance):
+            distance = distance.kilometers
+        distance = float(distance)
+
+        lat1 = radians(degrees=point.latitude)
+        if self.reference_latitude is None:
+            # The middle latitude depends on the destination, refine it
+            # with a few fixed-point iterations.
+            mid_lat = lat1
+            for _ in range(3):
+                kx, ky = self._scale_factors(mid_lat)
+                mid_lat = lat1 + distance * cos(bearing) / ky / 2
+        else:
+            kx, ky = self._fixed_scale_factors()
+        lat2 = point.latitude + units.degrees(radians=distance * cos(bearing) / ky)
+        lng2 = point.longitude + units.degrees(radians=distance * sin(bearing) / kx)
+        return Point(lat2, lng2)
+
+    def _destination_arrays(self, lat1, lon1, bearings, distances):
+        bearings = np.radians(bearings)
+        if self.reference_latitude is None:
+            lat1_rad = np.radians(lat1)
+            mid_lat = lat1_rad
+            for _ in range(3):
+                kx, ky = self._scale_factor_arrays(mid_lat)
+                mid_lat = lat1_rad + distances * np.cos(bearings) / ky / 2
+        else:
+            kx, ky = self._fixed_scale_factors()
+        lat2 = lat1 + np.degrees(distances * np.cos(bearings) / ky)
+        lon2 = lon1 + np.degrees(distances * np.sin(bearings) / kx)
+        return lat2, lon2
+
+    def _radian_bounds(self):
+        return None
+
+
+class andoyer_lambert(geodesic):
+    """
+    Approximate the geodesic distance on the ellipsoid with the
+    Andoyer-Lambert formula: the great-circle distance between the
+    points on the auxiliary sphere (using reduced latitudes) with
+    a first-order correction for the flattening.
+
+    It is several times faster than :class:`.geodesic` and accepts
+    the same ``ellipsoid`` argument. Compared to :class:`.geodesic` on
+    WGS-84, the relative error is within 2e-6 (2 mm per km) for distances
+    up to 5000 km and within 3e-5 (up to about 0.5 km) for longer ones.
+    Nearly antipodal points (more than about 18700 km apart), where the
+    formula breaks down, are measured with :class:`.geodesic`.
+    :meth:`.destination` and :meth:`.inverse` are inherited from
+    :class:`.geodesic` and are exact.
+
+    Example::
+
+        >>> from geopy.distance import andoyer_lambert
+        >>> newport_ri = (41.49008, -71.312796)
+        >>> cleveland_oh = (41.499498, -81.695391)
+        >>> print(andoyer_lambert(newport_ri, cleveland_oh).miles)
+        538.390447916
+
+    .. versionadded:: 2.6
+    """
+
+    # Below this value of cos(sigma / 2) (which is sigma of about 168.5
+    # degrees) the points are considered to be nearly antipodal.
+    _ANTIPODAL_COS = 0.1
+
+    def measure(self, a, b):
+        a, b = Point(a), Point(b)
+        _ensure_same_altitude(a, b)
+
+        major, _, f = self.ELLIPSOID
+        beta1 = atan((1 - f) * tan(radians(degrees=a.latitude)))
+        beta2 = atan((1 - f) * tan(radians(degrees=b.latitude)))
+        delta_lng = radians(degrees=b.longitude - a.longitude)
+
+        hav = (sin((beta2 - beta1) / 2) ** 2 +
+               cos(beta1) * cos(beta2) * sin(delta_lng / 2) ** 2)
+        sigma = 2 * asin(sqrt(min(hav, 1.0)))
+        if sigma == 0:
+            return 0.0
+        if cos(sigma / 2) < self._ANTIPODAL_COS:
+            return super().measure(a, b)
+
+        p, q = (beta1 + beta2) / 2, (beta2 - beta1) / 2
+        x = ((sigma - sin(sigma)) * sin(p) ** 2 * cos(q) ** 2 /
+             cos(sigma / 2) ** 2)
+        y = ((sigma + sin(sigma)) * cos(p) ** 2 * sin(q) ** 2 /
+             sin(sigma / 2) ** 2)
+        return major * (sigma - f / 2 * (x + y))
+
+    def _measure_arrays(self, lat1, lon1, lat2, lon2):
+        major, _, f = self.ELLIPSOID
+        beta1 = np.arctan((1 - f) * np.tan(np.radians(lat1)))
+        beta2 = np.arctan((1 - f) * np.tan(np.radians(lat2)))
+        delta_lng = np.radians(lon2 - lon1)
+
+        hav = (np.sin((beta2 - beta1) / 2) ** 2 +
+               np.cos(beta1) * np.cos(beta2) * np.sin(delta_lng / 2) ** 2)
+        sigma = 2 * np.arcsin(np.sqrt(np.minimum(hav, 1.0)))
+        p, q = (beta1 + beta2) / 2, (beta2 - beta1) / 2
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x = ((sigma - np.sin(sigma)) * np.sin(p) ** 2 * np.cos(q) ** 2 /
+                 np.cos(sigma / 2) ** 2)
+            y = ((sigma + np.sin(sigma)) * np.cos(p) ** 2 * np.sin(q) ** 2 /
+                 np.sin(sigma / 2) ** 2)
+            result = major * (sigma - f / 2 * (x + y))
+        result[sigma == 0] = 0.0
+
+        antipodal = np.flatnonzero(np.cos(sigma / 2) < self._ANTIPODAL_COS)
+        if antipodal.size:
+            result.flat[antipodal] = super()._measure_arrays(
+                lat1.flat[antipodal], lon1.flat[antipodal],
+                lat2.flat[antipodal], lon2.flat[antipodal],
+            )
+        return result
+
+    def _radian_bounds(self):
+        return None
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+def _model_key(method):
+    # Parameters of the earth model of a distance, so the cached
+    # results are not reused after e.g. `set_ellipsoid`.
+    ellipsoid = getattr(method, 'ELLIPSOID', None)
+    return (
+        type(method),
+        None if ellipsoid is None else tuple(ellipsoid),
+        getattr(method, 'RADIUS', None),
+        getattr(method, 'reference_latitude', None),
+    )
+
+
+class DistanceCache:
+    """
+    Memoize the distances between pairs of points, e.g. for route
+    optimizers which measure the same pairs over and over::
+
+        >>> from geopy.distance import DistanceCache, geodesic
+        >>> cache = DistanceCache(geodesic(ellipsoid='GRS-80'))
+        >>> newport_ri = (41.49008, -71.312796)
+        >>> cleveland_oh = (41.499498, -81.695391)
+        >>> cache(newport_ri, cleveland_oh)
+        Distance(866.455432916117)
+        >>> cache.measure(cleveland_oh, newport_ri)
+        866.455432916117
+        >>> cache.cache_info()
+        CacheInfo(hits=1, misses=1, maxsize=65536, currsize=1)
+
+    The pairs are keyed on the coordinates rounded to ``precision``
+    decimal places (6 decimal places of a degree are about 0.1 m),
+    and the distances are calculated between the rounded points, so
+    a result doesn't depend on which of the nearby points was measured
+    first. The key also includes the earth model of ``method`` (e.g.
+    its ellipsoid), so changing it doesn't return stale distances.
+    The least recently used pairs are evicted when there are more than
+    ``maxsize`` of them.
+
+    The cache is thread-safe. Distances are calculated outside the lock,
+    so two threads missing the same pair at once would both calculate it.
+
+    .. versionadded:: 2.6
+    """
+
+    def __init__(self, method=geodesic, maxsize=65536, precision=6,
+                 symmetric=True):
+        """
+        :param method: Distance algorithm: either a :class:`.Distance`
+            subclass, such as :class:`.geodesic` or :class:`.great_circle`,
+            or its instance.
+
+        :param int maxsize: Maximum number of the cached pairs.
+
+        :param int precision: Number of decimal places the coordinates
+            (in degrees) are rounded to.
+
+        :param bool symmetric: Whether ``(a, b)`` and ``(b, a)`` share
+            a cache entry. All of the :mod:`geopy.distance` algorithms
+            are symmetric, so it is safe to leave it on unless ``method``
+            is a custom asymmetric distance.
+        """
+        if maxsize < 1:
+            raise ValueError('maxsize must be a positive integer.')
+        self.method = _get_distance_instance(method)
+        self.maxsize = maxsize
+        self.precision = precision
+        self.symmetric = symmetric
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __call__(self, *points):
+        """
+        Calculate the distance between two or more points (the sum of
+        the distances between the consecutive ones), like calling
+        ``method`` with the points would.
+
+        :rtype: :class:`.Distance`
+        """
+        kilometers = 0
+        for a, b in util.pairwise(points):
+            kilometers += self.measure(a, b)
+        return type(self.method)(kilometers)
+
+    def measure(self, a, b):
+        """
+        Calculate the distance between two points.
+
+        :param a: The first point.
+        :type a: :class:`geopy.point.Point`, list or tuple of ``(latitude,
+            longitude)``, or string as ``"%(latitude)s, %(longitude)s"``.
+
+        :param b: The second point.
+
+        :return: The distance in kilometers.
+        :rtype: float
+        """
+        a, b = Point(a), Point(b)
+        _ensure_same_altitude(a, b)
+        precision = self.precision
+        a = (round(a.latitude, precision), round(a.longitude, precision))
+        b = (round(b.latitude, precision), round(b.longitude, precision))
+        if self.symmetric and b < a:
+            a, b = b, a
+        key = (_model_key(self.method), a, b)
+
+        with self._lock:
+            try:
+                kilometers = self._cache[key]
+            except KeyError:
+                self.misses += 1
+            else:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return kilometers
+
+        kilometers = self.method.measure(a, b)
+        with self._lock:
+            self._cache[key] = kilometers
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        return kilometers
+
+    def cache_info(self):
+        """
+        Statistics of the cache, like :func:`functools.lru_cache` has.
+
+        :rtype: ``CacheInfo(hits, misses, maxsize, currsize)`` named tuple
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize,
+                             len(self._cache))
+
+    def cache_clear(self):
+        """
+        Remove all of the cached distances and reset the statistics.
+        """
+        with self._lock:
+            self._cache.clear()
+            self.hits = self.misses = 0
+
+
+def _unit_to_kilometers(unit, value):
+    # Array-friendly `units.kilometers(**{unit: value})`, performing
+    # the same floating point operations, so the results are equal
+    # to the ones of `Distance`.
+    if unit == 'kilometers':
+        return value
+    if unit == 'miles':
+        return value * units.kilometers(miles=1.)
+    if unit in ('meters', 'feet', 'nautical'):
+        return value / getattr(units, unit)(kilometers=1.)
+    raise TypeError('Unexpected unit %r.' % (unit,))
+
+
+class DistanceArray:
+    """
+    An array of distances: the vectorized counterpart of :class:`.Distance`,
+    which wraps a numpy float64 array of kilometers instead of creating
+    a Python object per distance. Requires numpy.
+
+    It has the same unit properties (``km``, ``m``, ``miles``, ``ft``,
+    ``nm`` and so on), which return numpy arrays::
+
+        >>> from geopy.distance import DistanceArray, geodesic
+        >>> distances = DistanceArray(geodesic().measure_many(
+        ...     [41.49008, 40.0], [-71.312796, 160], [41.499498, 40.1],
+        ...     [-81.695391, 160.1]
+        ... ))
+        >>> distances
+        DistanceArray([866.45543291,  14.0037025 ])
+        >>> distances.miles
+        array([538.39044537,   8.70149732])
+
+    The arithmetic and the comparisons follow the ones of
+    :class:`.Distance` element-wise. Comparisons with another distance,
+    an array of distances or a number (of kilometers) result in boolean
+    numpy arrays, which can be used as masks::
+
+        >>> distances + geodesic(kilometers=1)
+        DistanceArray([867.45543291,  15.0037025 ])
+        >>> distances * 2
+        DistanceArray([1732.91086582,   28.007405  ])
+        >>> distances / geodesic(kilometers=2)
+        array([433.22771645,   7.00185125])
+        >>> distances[distances < geodesic(miles=10)]
+        DistanceArray([14.0037025])
+
+    Reductions and indexing by an integer produce :class:`.Distance`
+    instances, while slices and masks produce distance arrays::
+
+        >>> distances.sum()
+        Distance(880.4591354079747)
+        >>> distances.argmin()
+        1
+        >>> distances[0]
+        Distance(866.4554329098685)
+
+    Distance arrays are immutable and don't copy the wrapped array
+    when it already has the float64 dtype.
+
+    .. versionadded:: 2.6
+    """
+
+    # Make numpy defer to the reflected operators of this class
+    # instead of treating it as an object to broadcast.
+    __array_ufunc__ = None
+
+    def __init__(self, kilometers=0, **kwargs):
+        """
+        :param kilometers: Distances in kilometers: a numpy array,
+            a sequence of numbers or of :class:`.Distance` instances,
+            or a :class:`.DistanceArray`.
+
+        :param kwargs: Distances in other units, added to ``kilometers``:
+            ``meters``, ``miles``, ``feet`` or ``nautical``.
+        """
+        util.ensure_numpy_is_installed()
+        if isinstance(kilometers, DistanceArray):
+            kilometers = kilometers.kilometers
+        elif not isinstance(kilometers, (np.ndarray,) + util.NUMBER_TYPES):
+            kilometers = [
+                x.kilometers if isinstance(x, Distance) else x for x in kilometers
+            ]
+        kilometers = np.asarray(kilometers, dtype=np.float64)
+        for unit, value in kwargs.items():
+            value = np.asarray(value, dtype=np.float64)
+            kilometers = kilometers + _unit_to_kilometers(unit, value)
+        kilometers = kilometers.view()
+        kilometers.flags.writeable = False
+        self.__kilometers = kilometers
+
+    @staticmethod
+    def _other_kilometers(other):
+        if isinstance(other, (Distance, DistanceArray)):
+            return other.kilometers
+        return None
+
+    def __add__(self, other):
+        other = self._other_kilometers(other)
+        if other is None:
+            raise TypeError(
+                "DistanceArray instance must be added with Distance or "
+                "DistanceArray instance."
+            )
+        return DistanceArray(self.kilometers + other)
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return DistanceArray(-self.kilometers)
+
+    def __sub__(self, other):
+        return self + -other
+
+    def __rsub__(self, other):
+        return -self + other
+
+    def __mul__(self, other):
+        if self._other_kilometers(other) is not None:
+            raise TypeError(
+                "DistanceArray instance must be multiplicated with numbers."
+            )
+        return DistanceArray(self.kilometers * np.asarray(other))
+
+    def __rmul__(self, other):
+        if self._other_kilometers(other) is not None:
+            raise TypeError(
+                "DistanceArray instance must be multiplicated with numbers."
+            )
+        return DistanceArray(np.asarray(other) * self.kilometers)
+
+    def __truediv__(self, other):
+        kilometers = self._other_kilometers(other)
+        if kilometers is not None:
+            return self.kilometers / kilometers
+        return DistanceArray(self.kilometers / np.asarray(other))
+
+    def __rtruediv__(self, other):
+        if isinstance(other, Distance):
+            return other.kilometers / self.kilometers
+        return NotImplemented
+
+    def __floordiv__(self, other):
+        kilometers = self._other_kilometers(other)
+        if kilometers is not None:
+            return self.kilometers // kilometers
+        return DistanceArray(self.kilometers // np.asarray(other))
+
+    def __rfloordiv__(self, other):
+        if isinstance(other, Distance):
+            return other.kilometers // self.kilometers
+        return NotImplemented
+
+    def __abs__(self):
+        return DistanceArray(np.abs(self.kilometers))
+
+    def _compare_with(self, other):
+        kilometers = self._other_kilometers(other)
+        return np.asarray(other) if kilometers is None else kilometers
+
+    def __eq__(self, other):
+        return self.kilometers == self._compare_with(other)
+
+    def __ne__(self, other):
+        return self.kilometers != self._compare_with(other)
+
+    def __gt__(self, other):
+        return self.kilometers > self._compare_with(other)
+
+    def __lt__(self, other):
+        return self.kilometers < self._compare_with(other)
+
+    def __ge__(self, other):
+        return self.kilometers >= self._compare_with(other)
+
+    def __le__(self, other):
+        return self.kilometers <= self._compare_with(other)
+
+    __hash__ = None
+
+    def _wrap(self, kilometers):
+        if np.ndim(kilometers):
+            return DistanceArray(kilometers)
+        return Distance(float(kilometers))
+
+    def __len__(self):
+        if not self.kilometers.ndim:
+            raise TypeError('len() of unsized object')
+        return len(self.kilometers)
+
+    def __getitem__(self, index):
+        if isinstance(index, DistanceArray):
+            raise TypeError('DistanceArray cannot be indexed with distances.')
+        return self._wrap(self.kilometers[index])
+
+    def __iter__(self):
+        for kilometers in self.kilometers:
+            yield self._wrap(kilometers)
+
+    def __array__(self, dtype=None, copy=None):
+        if copy:
+            return np.array(self.kilometers, dtype=dtype)
+        return np.asarray(self.kilometers, dtype=dtype)
+
+    def __repr__(self):
+        return 'DistanceArray(%s)' % np.array2string(
+            self.kilometers, separator=', ', prefix='DistanceArray(',
+        )
+
+    def __str__(self):
+        return '%s km' % self.kilometers
+
+    @property
+    def shape(self):
+        return self.kilometers.shape
+
+    def sum(self, axis=None):
+        """
+        Sum of the distances, a :class:`.Distance` unless ``axis`` is given.
+        """
+        return self._wrap(self.kilometers.sum(axis=axis))
+
+    def min(self, axis=None):
+        """
+        The shortest distance, a :class:`.Distance` unless ``axis`` is given.
+        """
+        return self._wrap(self.kilometers.min(axis=axis))
+
+    def max(self, axis=None):
+        """
+        The longest distance, a :class:`.Distance` unless ``axis`` is given.
+        """
+        return self._wrap(self.kilometers.max(axis=axis))
+
+    def argmin(self, axis=None):
+        """
+        Index of the shortest distance, see :meth:`numpy.ndarray.argmin`.
+        """
+        return self._index(self.kilometers.argmin(axis=axis))
+
+    def argmax(self, axis=None):
+        """
+        Index of the longest distance, see :meth:`numpy.ndarray.argmax`.
+        """
+        return self._index(self.kilometers.argmax(axis=axis))
+
+    @staticmethod
+    def _index(index):
+        return index if np.ndim(index) else int(index)
+
+    @property
+    def feet(self):
+        return units.feet(miles=self.miles)
+
+    @property
+    def ft(self):
+        return self.feet
+
+    @property
+    def kilometers(self):
+        return self.__kilometers
+
+    @property
+    def km(self):
+        return self.kilometers
+
+    @property
+    def m(self):
+        return self.meters
+
+    @property
+    def meters(self):
+        return units.meters(kilometers=self.kilometers)
+
+    @property
+    def mi(self):
+        return self.miles
+
+    @property
+    def miles(self):
+        return units.miles(kilometers=self.kilometers)
+
+    @property
+    def nautical(self):
+        return units.nautical(kilometers=self.kilometers)
+
+    @property
+    def nm(self):
+        return self.nautical
+
+
+def _matrix_tiles(n, m, chunk_size, symmetric):
+    for i0 in range(0, n, chunk_size):
+        i1 = min(i0 + chunk_size, n)
+        for j0 in range(i0 if symmetric else 0, m, chunk_size):
+            yield i0, i1, j0, min(j0 + chunk_size, m)
+
+
+def _fill_matrix_tile(out, method, coords, tile, symmetric, skip_computed=False):
+    lat1, lon1, lat2, lon2 = coords
+    i0, i1, j0, j1 = tile
+    if skip_computed:
+        # Not yet computed cells are NaN, see `write_distance_matrix`.
+        pending = np.isnan(out[i0:i1, j0:j1]).any()
+        if symmetric and j0 != i0:
+            pending = pending or np.isnan(out[j0:j1, i0:i1]).any()
+        if not pending:
+            return
+    values = method._measure_arrays(*np.broadcast_arrays(
+        lat1[i0:i1, None], lon1[i0:i1, None], lat2[None, j0:j1], lon2[None, j0:j1]
+    ))
+    if symmetric and j0 == i0:
+        # Tiles on the diagonal are calculated in full,
+        # make them exactly symmetric too.
+        values = np.triu(values) + np.triu(values, 1).T
+    out[i0:i1, j0:j1] = values
+    if symmetric and j0 != i0:
+        out[j0:j1, i0:i1] = values.T
+
+
+def _prepare_matrix(origins, destinations, method, chunk_size):
+    symmetric = destinations is None or destinations is origins
+    method = _get_distance_instance(method)
+    lat1, lon1, alt1 = _points_to_arrays(origins)
+    if symmetric:
+        lat2, lon2, alt2 = lat1, lon1, alt1
+    else:
+        lat2, lon2, alt2 = _points_to_arrays(destinations)
+    _ensure_same_altitude_sets(alt1, alt2)
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be a positive integer.')
+    return method, (lat1, lon1, lat2, lon2), symmetric
+
+
+def _fill_matrix(out, method, coords, symmetric, chunk_size, skip_computed=False,
+                 processes=None):
+    n, m = len(coords[0]), len(coords[2])
+    if out.shape != (n, m):
+        raise ValueError(
+            'out must have a %r shape, got %r.' % ((n, m), out.shape)
+        )
+    if _use_processes(processes, chunk_size):
+        tiles = list(_matrix_tiles(n, m, chunk_size, symmetric))
+        _run_in_processes(processes, _matrix_worker, tiles, method, coords, out,
+                          options=(symmetric, skip_computed))
+        return out
+    flush = getattr(out, 'flush', None)
+    for tile in _matrix_tiles(n, m, chunk_size, symmetric):
+        _fill_matrix_tile(out, method, coords, tile, symmetric, skip_computed)
+        if flush is not None and tile[3] == m:
+            # The end of a row of tiles.
+            flush()
+    return out
+
+
+def distance_matrix(origins, destinations=None, method=geodesic,
+                    chunk_size=1024, out=None, processes=None):
+    """
+    Calculate a dense matrix of distances between each of the ``origins``
+    and each of the ``destinations``. Requires numpy.
+
+    The matrix is computed in square tiles of ``chunk_size`` rows and
+    columns, so the temporary arrays never exceed the size of a single
+    tile regardless of the size of the matrix. When ``destinations`` is
+    omitted (or is the same object as ``origins``), the matrix is
+    symmetric and only its upper triangle is calculated.
+
+    Example::
+
+        >>> from geopy.distance import distance_matrix, great_circle
+        >>> depots = [(41.49008, -71.312796), (41.499498, -81.695391)]
+        >>> customers = [(40.7128, -74.006), (42.3601, -71.0589), (41.8781, -87.6298)]
+        >>> distance_matrix(depots, customers, method=great_circle)
+        array([[ 241.63688091,   98.99591237, 1353.65916031],
+               [ 649.9412642 ,  884.5037364 ,  494.47011348]])
+
+    Matrices which don't fit in memory can be written directly to
+    a :class:`numpy.memmap` passed as ``out``, see also
+    :func:`.write_distance_matrix`.
+
+    .. versionadded:: 2.6
+
+    :param origins: Points of the matrix rows: an iterable of anything
+        accepted by :class:`geopy.point.Point`, a
+        :class:`geopy.point.PointArray`, or a numpy array
+        of ``(n, 2)`` or ``(n, 3)`` shape of
+        ``(latitude, longitude[, altitude])`` rows.
+
+    :param destinations: Points of the matrix columns, same
+        format as ``origins``. Defaults to ``origins``.
+
+    :param method: Distance algorithm: either a :class:`.Distance`
+        subclass, such as :class:`.geodesic` or :class:`.great_circle`,
+        or its instance, e.g. ``geodesic(ellipsoid='GRS-80')``.
+
+    :param int chunk_size: Number of rows and columns in a single tile.
+
+    :param out: A writable array of ``(len(origins), len(destinations))``
+        shape to store the result in, e.g. a float32 :class:`numpy.memmap`.
+        If it has a ``flush`` method, it is called after each row
+        of tiles.
+
+    :param int processes: Number of worker processes to spread the tiles
+        across. By default everything is calculated in the current
+        process. See :ref:`distance_processes`.
+
+    :return: Distances in kilometers of ``(len(origins), len(destinations))``
+        shape. This is ``out`` if it has been passed.
+    :rtype: numpy array
+    """
+    method, coords, symmetric = _prepare_matrix(
+        origins, destinations, method, chunk_size
+    )
+    if out is None:
+        out = np.empty((len(coords[0]), len(coords[2])), dtype=np.float64)
+    return _fill_matrix(out, method, coords, symmetric, chunk_size,
+                        processes=processes)
+
+
+def _matrix_fingerprint(method, coords):
+    # Digest of the inputs of a distance matrix, so a file computed
+    # for other inputs is not resumed.
+    digest = hashlib.sha256()
+    model = _model_key(method)
+    digest.update(repr(
+        (model[0].__module__, model[0].__qualname__) + model[1:]
+    ).encode('utf-8'))
+    for array in coords:
+        digest.update(np.ascontiguousarray(array, dtype=np.float64).tobytes())
+    return digest.hexdigest()
+
+
+def write_distance_matrix(path, origins, destinations=None, method=geodesic,
+                          chunk_size=1024, dtype='float64', processes=None):
+    """
+    Calculate a distance matrix like :func:`.distance_matrix` does,
+    but write it directly to a file instead of keeping it in memory.
+    Requires numpy.
+
+    The file is in the `.npy format
+    <https://numpy.org/doc/stable/reference/generated/numpy.lib.format.html>`_:
+    a short header followed by the raw row-major values, so it can be
+    memory-mapped back without copying::
+
+        >>> import numpy as np
+        >>> from geopy.distance import write_distance_matrix
+        >>> points = [(41.49008, -71.312796), (41.499498, -81.695391)]
+        >>> write_distance_matrix('matrix.npy', points, dtype='float32').shape
+        (2, 2)
+        >>> matrix = np.load('matrix.npy', mmap_mode='r')
+
+    Cells which haven't been computed yet contain NaN. If the file
+    already exists (e.g. the previous run has been interrupted), it is
+    resumed: only the tiles containing NaN values are computed again.
+    The existing file must have the same shape and dtype, and must have
+    been computed for the same points and ``method``: a digest of them
+    is stored next to the matrix, in the ``<path>.inputs`` file.
+    The new file is initialized under the ``<path>.partial`` name and
+    is renamed to ``path`` once it's filled with NaN, so an interrupted
+    initialization is started over rather than resumed.
+
+    .. versionadded:: 2.6
+
+    :param str path: Path to the ``.npy`` file.
+
+    :param origins: See :func:`.distance_matrix`.
+
+    :param destinations: See :func:`.distance_matrix`.
+
+    :param method: See :func:`.distance_matrix`.
+
+    :param int chunk_size: See :func:`.distance_matrix`.
+
+    :param dtype: Floating point type of the values in the file:
+        ``float64`` or ``float32`` (which halves the file size at the
+        cost of precision of about a meter for the largest distances).
+
+    :param int processes: See :func:`.distance_matrix`. The worker
+        processes write directly to the file.
+
+    :return: The matrix, memory-mapped in read-write mode.
+    :rtype: :class:`numpy.memmap`
+    """
+    method, coords, symmetric = _prepare_matrix(
+        origins, destinations, method, chunk_size
+    )
+    shape = (len(coords[0]), len(coords[2]))
+    dtype = np.dtype(dtype)
+    if dtype.kind != 'f':
+        raise ValueError('dtype must be a floating point type, got %r.' % dtype)
+
+    path = os.fspath(path)
+    inputs_path = path + '.inputs'
+    fingerprint = _matrix_fingerprint(method, coords)
+    try:
+        out = np.lib.format.open_memmap(path, mode='r+')
+    except FileNotFoundError:
+        # A zero-filled file might be taken for a computed one,
+        # so it appears under `path` only after it's filled with NaN.
+        partial_path = path + '.partial'
+        out = np.lib.format.open_memmap(partial_path, mode='w+',
+                                        dtype=dtype, shape=shape)
+        out[...] = np.nan
+        out.flush()
+        del out  # close the file before renaming it (required on Windows)
+        with open(inputs_path, 'w') as f:
+            f.write(fingerprint)
+        os.replace(partial_path, path)
+        out = np.lib.format.open_memmap(path, mode='r+')
+        resume = False
+    else:
+        if out.shape != shape or out.dtype != dtype:
+            raise ValueError(
+                'Existing distance matrix file %r has a %r shape of %s, '
+                'expected %r of %s.' % (path, out.shape, out.dtype, shape, dtype)
+            )
+        try:
+            with open(inputs_path) as f:
+                stored = f.read().strip()
+        except FileNotFoundError:
+            stored = None
+        if stored != fingerprint:
+            raise ValueError(
+                'Existing distance matrix file %r has been computed for other '
+                'points or method (or its %r file is missing). Remove the file '
+                'to start over.' % (path, inputs_path)
+            )
+        resume = True
+    _fill_matrix(out, method, coords, symmetric, chunk_size, skip_computed=resume,
+                 processes=processes)
+    out.flush()
+    return out
+
+
+# Relative slack of the distance bounds in `within`, which covers
+# the rounding errors of both the bounds and the exact distances.
+_BOUNDS_EPSILON = 1e-9
+
+
+def _central_angles(lat1, lon1, lat2, lon2):
+    # Haversine formula, which is well-conditioned for small angles.
+    lat1, lon1 = np.radians(lat1), np.radians(lon1)
+    lat2, lon2 = np.radians(lat2), np.radians(lon2)
+    hav = (np.sin((lat2 - lat1) / 2) ** 2 +
+           np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * np.arcsin(np.sqrt(np.minimum(hav, 1.0)))
+
+
+def within(center, candidates, radius, method=geodesic, mask=False):
+    """
+    Find the candidates located within ``radius`` from ``center``
+    (inclusive). Requires numpy.
+
+    The result is the same as of checking
+    ``method(center, candidate) <= radius`` for each candidate,
+    but most of the candidates are ruled out without calculating the
+    exact distance: first by a latitude/longitude bounding box of the
+    circle, then by the lower and upper bounds of the distance derived
+    from the central angle on a sphere. Only the candidates close to
+    the boundary of the circle are measured with ``method``.
+    The approximate methods, such as :class:`.equirectangular`, cannot
+    be bounded like that, so all of the candidates are measured with
+    them::
+
+        >>> from geopy.distance import within
+        >>> stores = [(41.49008, -71.312796), (41.499498, -81.695391),
+        ...           (40.7128, -74.006)]
+        >>> within((42.3601, -71.0589), stores, radius=300)
+        array([0])
+        >>> within((42.3601, -71.0589), stores, radius=300, mask=True)
+        array([ True, False, False])
+
+    .. versionadded:: 2.6
+
+    :param center: Center of the circle.
+    :type center: :class:`geopy.point.Point`, list or tuple of ``(latitude,
+        longitude)``, or string as ``"%(latitude)s, %(longitude)s"``.
+
+    :param candidates: Points to filter: an iterable of anything
+        accepted by :class:`geopy.point.Point`, a
+        :class:`geopy.point.PointArray`, or a numpy array
+        of ``(n, 2)`` or ``(n, 3)`` shape of
+        ``(latitude, longitude[, altitude])`` rows.
+
+    :param radius: Radius of the circle in kilometers.
+    :type radius: float or :class:`.Distance`
+
+    :param method: Distance algorithm: either a :class:`.Distance`
+        subclass, such as :class:`.geodesic` or :class:`.great_circle`,
+        or its instance.
+
+    :param bool mask: Return a boolean mask instead of the indices.
+
+    :return: Sorted indices of the candidates within the circle
+        or a boolean mask of them.
+    :rtype: numpy array
+    """
+    method = _get_distance_instance(method)
+    if isinstance(radius, Distance):
+        radius = radius.kilometers
+    center = Point(center)
+    lat, lon, alt = _points_to_arrays(candidates)
+    _ensure_same_altitude_sets(np.array([center.altitude]), alt)
+
+    bounds = method._radian_bounds()
+    if bounds is None:
+        distances = method._measure_arrays(
+            np.full(lat.shape, center.latitude), np.full(lon.shape, center.longitude),
+            lat, lon,
+        )
+        inside = distances <= radius
+        return inside if mask else np.flatnonzero(inside)
+
+    min_radius, max_radius = bounds
+    max_angle = radius / min_radius * (1 + _BOUNDS_EPSILON)
+
+    # Bounding box of the circle.
+    max_angle_deg = np.degrees(max_angle)
+    inside = np.abs(lat - center.latitude) <= max_angle_deg
+    cos_center = np.cos(np.radians(center.latitude))
+    if max_angle < np.pi / 2 and np.sin(max_angle) < cos_center:
+        # The circle doesn't contain a pole, so it has a longitude span.
+        max_dlon = np.degrees(np.arcsin(np.sin(max_angle) / cos_center))
+        dlon = np.abs(lon - center.longitude) % 360
+        dlon = np.minimum(dlon, 360 - dlon)
+        inside &= dlon <= max_dlon * (1 + _BOUNDS_EPSILON)
+
+    # Spherical bounds.
+    maybe = np.flatnonzero(inside)
+    angles = _central_angles(center.latitude, center.longitude,
+                             lat[maybe], lon[maybe])
+    lower = angles * min_radius * (1 - _BOUNDS_EPSILON)
+    upper = angles * max_radius * (1 + _BOUNDS_EPSILON)
+    inside[maybe[lower > radius]] = False
+    unsure = maybe[(lower <= radius) & (upper > radius)]
+
+    # Exact distances near the boundary.
+    exact = method._measure_arrays(
+        np.full(unsure.shape, center.latitude), np.full(unsure.shape, center.longitude),
+        lat[unsure], lon[unsure],
+    )
+    inside[unsure] = exact <= radius
+    return inside if mask else np.flatnonzero(inside)
+
+
+def _fixes_to_arrays(fixes):
+    # Most tracks are sequences of number pairs or triples (or of their
+    # textual forms, e.g. rows of a CSV reader), which numpy converts
+    # without creating a `Point` for each of them.
+    try:
+        array = np.array(fixes, dtype=np.float64)
+    except (TypeError, ValueError):
+        array = None
+    if array is not None and array.ndim == 2 and array.shape[1] in (2, 3):
+        return _normalize_coordinate_arrays(*array.T)
+    return _points_to_arrays(fixes)
+
+
+def _point_chunks(points, chunk_size):
+    """
+    Lazily convert ``points`` to ``(latitudes, longitudes, altitudes)``
+    arrays of up to ``chunk_size`` points each.
+    """
+    if isinstance(points, (PointArray, np.ndarray)):
+        latitudes, longitudes, altitudes = _points_to_arrays(points)
+        for start in range(0, len(latitudes), chunk_size):
+            end = start + chunk_size
+            yield latitudes[start:end], longitudes[start:end], altitudes[start:end]
+        return
+    iterator = iter(points)
+    while True:
+        fixes = list(islice(iterator, chunk_size))
+        if not fixes:
+            return
+        yield _fixes_to_arrays(fixes)
+
+
+def cumulative_distances(points, method=geodesic, chunk_size=65536):
+    """
+    Lazily calculate the distances along a path, e.g. a GPS track.
+    Requires numpy.
+
+    The points are consumed in chunks of ``chunk_size``, and the
+    distances within a chunk are calculated at once, so a path of any
+    length can be processed with a bounded amount of memory. For each
+    chunk a tuple of two arrays is yielded, with an item for each
+    point of the chunk: the distances from the previous points
+    (zero for the first point of the path), and the distances along
+    the path from its first point::
+
+        >>> from geopy.distance import cumulative_distances
+        >>> track = [(41.49008, -71.312796), (41.499498, -81.695391),
+        ...          (40.7128, -74.006), (42.3601, -71.0589)]
+        >>> for segments, totals in cumulative_distances(track, chunk_size=3):
+        ...     print(segments.round(3), totals.round(3))
+        [  0.    866.455 651.567] [   0.     866.455 1518.022]
+        [306.49] [1824.513]
+
+    .. versionadded:: 2.6
+
+    :param points: Points of the path: an iterable (such as a generator
+        or a CSV reader) of anything accepted by
+        :class:`geopy.point.Point`, a :class:`geopy.point.PointArray`,
+        or a numpy array of ``(n, 2)`` or ``(n, 3)`` shape of
+        ``(latitude, longitude[, altitude])`` rows. As with other
+        distances, the adjacent points must have the same altitude
+        (see :ref:`distance_altitudes`).
+
+    :param method: Distance algorithm: either a :class:`.Distance`
+        subclass, such as :class:`.geodesic` or :class:`.great_circle`,
+        or its instance.
+
+    :param int chunk_size: Number of points in a chunk.
+
+    :return: A generator of tuples of two numpy arrays of distances
+        in kilometers.
+    """
+    util.ensure_numpy_is_installed()
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be a positive integer.')
+    method = _get_distance_instance(method)
+    previous = None
+    total = 0.0
+    for latitudes, longitudes, altitudes in _point_chunks(points, chunk_size):
+        if previous is None:
+            # The first segment is from the first point to itself.
+            previous = latitudes[:1], longitudes[:1], altitudes[:1]
+        lat1, lon1, alt1 = (
+            np.concatenate([last, current[:-1]])
+            for last, current in zip(previous, (latitudes, longitudes, altitudes))
+        )
+        _ensure_same_altitude_arrays(alt1, altitudes)
+        segments = method._measure_arrays(lat1, lon1, latitudes, longitudes)
+        totals = total + np.cumsum(segments)
+        total = float(totals[-1])
+        previous = latitudes[-1:], longitudes[-1:], altitudes[-1:]
+        yield segments, totals
+
+
+def path_length(points, method=geodesic, chunk_size=65536):
+    """
+    Calculate the length of a path, e.g. a GPS track. Requires numpy.
+
+    This is the same as ``method(*points)``, but the points are consumed
+    lazily and measured in vectorized chunks (see
+    :func:`.cumulative_distances`), so the path might be huge, e.g.
+    read line by line from a file::
+
+        >>> import csv
+        >>> from geopy.distance import path_length
+        >>> with open('track.csv') as f:
+        ...     print(path_length(csv.reader(f)).km)
+
+    .. versionadded:: 2.6
+
+    :param points: Points of the path, see :func:`.cumulative_distances`.
+
+    :param method: Distance algorithm: either a :class:`.Distance`
+        subclass, such as :class:`.geodesic` or :class:`.great_circle`,
+        or its instance.
+
+    :param int chunk_size: Number of points measured at once.
+
+    :return: The length of the path as an instance of the ``method``
+        class.
+    :rtype: :class:`.Distance`
+    """
+    method = _get_distance_instance(method)
+    total = 0.0
+    for _, totals in cumulative_distances(points, method, chunk_size):
+        total = float(totals[-1])
+    return type(method)(total)
+
+
+def _sphere_radius(method):
+    # Radius of the sphere used to close the triangles
+    # in `_segment_distances`.
+    if isinstance(method, geodesic):
+        major, minor, _ = method.ELLIPSOID
+        return (2 * major + minor) / 3
+    return method.RADIUS
+
+
+def _segment_distances(method, radius, lat1, lon1, lat2, lon2, lat3, lon3):
+    """
+    Distances from the points 3 to the segments from the points 1
+    to the points 2 (all arrays are broadcast against each other).
+
+    The distances and the azimuths are the ones of ``method``, the cross
+    track distance is then found from the spherical triangle with these
+    sides and angles, which is precise when the cross track distance
+    is much smaller than the earth radius.
+    """
+    lat1, lon1, lat2, lon2, lat3, lon3 = np.broadcast_arrays(
+        lat1, lon1, lat2, lon2, lat3, lon3
+    )
+    s12, azi12, azi21 = method._inverse_arrays(lat1, lon1, lat2, lon2)
+    s13, azi13, _ = method._inverse_arrays(lat1, lon1, lat3, lon3)
+    s23, azi23, _ = method._inverse_arrays(lat2, lon2, lat3, lon3)
+    cross_track = radius * np.abs(np.arcsin(np.clip(
+        np.sin(s13 / radius) * np.sin(np.radians(azi13 - azi12)), -1, 1
+    )))
+    # `azi21` is the forward azimuth at the point 2, so the segment
+    # is seen from there at `azi21 + 180`.
+    behind_start = np.cos(np.radians(azi13 - azi12)) <= 0
+    behind_end = np.cos(np.radians(azi23 - azi21)) >= 0
+    return np.where(
+        (s12 == 0) | behind_start, s13, np.where(behind_end, s23, cross_track)
+    )
+
+
+def _douglas_peucker(method, radius, latitudes, longitudes, tolerance):
+    keep = np.zeros(len(latitudes), dtype=bool)
+    keep[[0, -1]] = True
+    stack = [(0, len(latitudes) - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        errors = _segment_distances(
+            method, radius, latitudes[start:start + 1], longitudes[start:start + 1],
+            latitudes[end:end + 1], longitudes[end:end + 1],
+            latitudes[start + 1:end], longitudes[start + 1:end],
+        )
+        worst = int(np.argmax(errors))
+        if errors[worst] > tolerance:
+            split = start + 1 + worst
+            keep[split] = True
+            stack.append((start, split))
+            stack.append((split, end))
+    return np.flatnonzero(keep)
+
+
+def _visvalingam(method, radius, latitudes, longitudes, tolerance):
+    n = len(latitudes)
+    previous, following = list(range(-1, n - 1)), list(range(1, n + 1))
+    errors = [0.0] + _segment_distances(
+        method, radius, latitudes[:-2], longitudes[:-2],
+        latitudes[2:], longitudes[2:], latitudes[1:-1], longitudes[1:-1],
+    ).tolist() + [0.0]
+    heap = [(error, i) for i, error in enumerate(errors[1:-1], 1)]
+    heapq.heapify(heap)
+    keep = np.ones(n, dtype=bool)
+    while heap:
+        error, i = heapq.heappop(heap)
+        if not keep[i] or error != errors[i]:
+            continue  # Removed or updated since it has been pushed.
+        if error > tolerance:
+            break
+        keep[i] = False
+        before, after = previous[i], following[i]
+        following[before], previous[after] = after, before
+        neighbours = np.array([j for j in (before, after) if 0 < j < n - 1],
+                              dtype=np.intp)
+        if not len(neighbours):
+            continue
+        starts = np.array([previous[j] for j in neighbours], dtype=np.intp)
+        ends = np.array([following[j] for j in neighbours], dtype=np.intp)
+        updated = _segment_distances(
+            method, radius, latitudes[starts], longitudes[starts],
+            latitudes[ends], longitudes[ends],
+            latitudes[neighbours], longitudes[neighbours],
+        )
+        for j, new_error in zip(neighbours.tolist(), updated.tolist()):
+            # As in the original algorithm, the neighbours of a removed
+            # point are at least as significant as that point.
+            errors[j] = max(new_error, error)
+            heapq.heappush(heap, (errors[j], j))
+    return np.flatnonzero(keep)
+
+
+_SIMPLIFY_ALGORITHMS = {
+    'douglas-peucker': _douglas_peucker,
+    'visvalingam': _visvalingam,
+}
+
+
+def _prepare_simplify(tolerance, method, algorithm):
+    util.ensure_numpy_is_installed()
+    if isinstance(tolerance, Distance):
+        tolerance = tolerance.kilometers
+    if tolerance < 0:
+        raise ValueError('tolerance must not be negative.')
+    try:
+        algorithm = _SIMPLIFY_ALGORITHMS[algorithm]
+    except KeyError:
+        raise ValueError(
+            'Unknown simplification algorithm %r, expected one of: %s.'
+            % (algorithm, ', '.join(sorted(_SIMPLIFY_ALGORITHMS)))
+        )
+    method = _get_distance_instance(method)
+    if type(method)._inverse_arrays is Distance._inverse_arrays:
+        raise TypeError(
+            'Distance %s cannot be used for simplification, because it '
+            'does not calculate azimuths.' % type(method).__name__
+        )
+    radius = _sphere_radius(method)
+
+    def simplify_arrays(latitudes, longitudes, altitudes):
+        _ensure_same_altitude_arrays(altitudes[:-1], altitudes[1:])
+        if len(latitudes) < 3:
+            return np.arange(len(latitudes))
+        return algorithm(method, radius, latitudes, longitudes, tolerance)
+
+    return simplify_arrays
+
+
+def simplify(points, tolerance, method=geodesic, algorithm='douglas-peucker'):
+    """
+    Simplify a path, e.g. a GPS track, by dropping the points
+    which deviate from the simplified path by no more than
+    ``tolerance``. Requires numpy.
+
+    The deviation of a point is its cross track distance from
+    the segment of the simplified path replacing it (or the distance
+    to the nearest end of that segment), calculated from the distances
+    and the azimuths of ``method``. The first and the last points
+    are always kept::
+
+        >>> from geopy.distance import simplify
+        >>> track = [(0, 0), (0.001, 0.5), (0, 1), (0.1, 1.5), (0, 2)]
+        >>> simplify(track, tolerance=1)
+        array([0, 2, 3, 4])
+
+    The available algorithms are:
+
+    - ``'douglas-peucker'``: the Ramer-Douglas-Peucker algorithm,
+      which recursively keeps the point deviating the most from the
+      segment between the kept ones. All of the dropped points are
+      within ``tolerance`` from the simplified path.
+    - ``'visvalingam'``: a variant of the Visvalingam-Whyatt algorithm,
+      which repeatedly drops the point deviating the least from
+      the segment between its neighbours, until all of the remaining
+      points deviate more than ``tolerance``. It preserves the shape
+      of the path better, but a dropped point might end up farther
+      than ``tolerance`` from the simplified path.
+
+    .. versionadded:: 2.6
+
+    :param points: Points of the path, see :func:`.cumulative_distances`.
+        Use :func:`.simplify_stream` for paths which don't fit in memory.
+
+    :param tolerance: Maximum deviation in kilometers. Pass
+        a :class:`.Distance` to specify it in other units, e.g.
+        ``geodesic(meters=5)``.
+    :type tolerance: float or :class:`.Distance`
+
+    :param method: Distance algorithm: either a :class:`.Distance`
+        subclass, such as :class:`.geodesic` or :class:`.great_circle`,
+        or its instance. Distances which don't calculate azimuths, such
+        as :class:`.equirectangular`, are not supported.
+
+    :param str algorithm: ``'douglas-peucker'`` or ``'visvalingam'``.
+
+    :return: Sorted indices of the kept points.
+    :rtype: numpy array of int
+    """
+    simplify_arrays = _prepare_simplify(tolerance, method, algorithm)
+    if isinstance(points, (PointArray, np.ndarray)):
+        latitudes, longitudes, altitudes = _points_to_arrays(points)
+    else:
+        latitudes, longitudes, altitudes = _fixes_to_arrays(list(points))
+    return simplify_arrays(latitudes, longitudes, altitudes)
+
+
+def simplify_stream(points, tolerance, method=geodesic,
+                    algorithm='douglas-peucker', chunk_size=65536):
+    """
+    Lazily simplify a path like :func:`.simplify` does. Requires numpy.
+
+    The points are consumed and simplified in chunks of ``chunk_size``,
+    so a path of any length can be processed with a bounded amount
+    of memory. Each chunk is simplified on its own and the chunks are
+    joined at their endpoints, which are always kept, so all of the
+    points of a chunk are within ``tolerance`` from its simplified part.
+    The result might differ from the one of :func:`.simplify`, which
+    sees the whole path at once. For each chunk a tuple of the kept
+    points is yielded: their indices in the whole path, their latitudes
+    and their longitudes::
+
+        >>> from geopy.distance import simplify_stream
+        >>> track = [(0, 0), (0.001, 0.5), (0, 1), (0.1, 1.5), (0, 2)]
+        >>> for indices, latitudes, longitudes in simplify_stream(
+        ...         track, tolerance=1, chunk_size=3):
+        ...     print(indices, latitudes, longitudes)
+        [0] [0.] [0.]
+        [2 3 4] [0.  0.1 0. ] [1.  1.5 2. ]
+
+    .. versionadded:: 2.6
+
+    :param points: Points of the path, see :func:`.cumulative_distances`.
+
+    :param tolerance: Maximum deviation, see :func:`.simplify`.
+    :type tolerance: float or :class:`.Distance`
+
+    :param method: Distance algorithm, see :func:`.simplify`.
+
+    :param str algorithm: ``'douglas-peucker'`` or ``'visvalingam'``.
+
+    :param int chunk_size: Number of points in a chunk, at least 2.
+
+    :return: A generator of tuples of three numpy arrays.
+    """
+    simplify_arrays = _prepare_simplify(tolerance, method, algorithm)
+    if chunk_size < 2:
+        # A chunk gives away its last point to the next one,
+        # so a single point chunk would keep nothing.
+        raise ValueError('chunk_size must be at least 2.')
+    chunks = _point_chunks(points, chunk_size)
+    chunk = next(chunks, None)
+    carried = None
+    start = 0  # Index of the first point of `chunk` in the path.
+    while chunk is not None:
+        next_chunk = next(chunks, None)
+        if carried is not None:
+            # The last point of the previous chunk starts this one.
+            chunk = [np.concatenate(pair) for pair in zip(carried, chunk)]
+            start -= 1
+        latitudes, longitudes, altitudes = chunk
+        kept = simplify_arrays(latitudes, longitudes, altitudes)
+        end = start + len(latitudes)
+        if next_chunk is not None:
+            kept = kept[:-1]
+            carried = latitudes[-1:], longitudes[-1:], altitudes[-1:]
+        yield kept + start, latitudes[kept], longitudes[kept]
+        chunk, start = next_chunk, end
+
+
+# State of a worker process, see `_run_in_processes`.
+_worker_state = {}
+
+
+def _use_processes(processes, chunk_size):
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be a positive integer.')
+    if processes is None:
+        return False
+    if processes < 1:
+        raise ValueError('processes must be a positive integer.')
+    return processes > 1
+
+
+def _share_array(array):
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    shared = np.ndarray(array.shape, array.dtype, buffer=shm.buf)
+    shared[...] = array
+    del shared  # `shm` cannot be closed while its buffer is exported.
+    return shm, ('shm', shm.name, array.shape, array.dtype.str, 0)
+
+
+def _attach_array(spec):
+    from multiprocessing import shared_memory
+
+    kind, name, shape, dtype, offset = spec
+    if kind == 'memmap':
+        return None, np.memmap(name, mode='r+', dtype=dtype, shape=shape,
+                               offset=offset)
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype, buffer=shm.buf)
+
+
+def _init_worker(method, specs, options):
+    handles, arrays = zip(*map(_attach_array, specs))
+    # `handles` must be kept alive as long as the `arrays` are used.
+    _worker_state.update(
+        method=method, handles=handles, arrays=arrays, options=options
+    )
+
+
+def _measure_worker(bounds):
+    lat1, lon1, lat2, lon2, out = _worker_state['arrays']
+    start, stop = bounds
+    out[start:stop] = _worker_state['method']._measure_arrays(
+        lat1[start:stop], lon1[start:stop], lat2[start:stop], lon2[start:stop]
+    )
+
+
+def _matrix_worker(tile):
+    lat1, lon1, lat2, lon2, out = _worker_state['arrays']
+    symmetric, skip_computed = _worker_state['options']
+    _fill_matrix_tile(out, _worker_state['method'], (lat1, lon1, lat2, lon2),
+                      tile, symmetric, skip_computed)
+
+
+def _run_in_processes(processes, worker, tasks, method, inputs, out, options=()):
+    """
+    Call ``worker(task)`` for each of the ``tasks`` in a pool of
+    ``processes`` worker processes.
+
+    The ``inputs`` and ``out`` arrays are placed to shared memory once,
+    so only the tiny task descriptions are sent to the workers. A file
+    backed ``out`` (a :class:`numpy.memmap`) is written by the workers
+    directly, any other ``out`` is copied from the shared memory when
+    all of the tasks are done.
+    """
+    # Imported here, since they are not available on some platforms
+    # (e.g. Emscripten and WASI), which can't run the processes anyway.
+    import mmap
+    from concurrent.futures import ProcessPoolExecutor
+
+    handles = []
+    result = None
+    try:
+        specs = []
+        for array in inputs:
+            shm, spec = _share_array(array)
+            handles.append(shm)
+            specs.append(spec)
+        if (isinstance(out, np.memmap) and isinstance(out.base, mmap.mmap)
+                and out.flags.c_contiguous):
+            specs.append(('memmap', out.filename, out.shape, out.dtype.str,
+                          out.offset))
+        else:
+            shm, spec = _share_array(out)
+            handles.append(shm)
+            specs.append(spec)
+            result = np.ndarray(out.shape, out.dtype, buffer=shm.buf)
+
+        with ProcessPoolExecutor(processes, initializer=_init_worker,
+                                 initargs=(method, specs, options)) as executor:
+            for _ in executor.map(worker, tasks):
+                pass
+
+        if result is not None:
+            out[...] = result
+    finally:
+        result = None
+        for shm in handles:
+            shm.close()
+            shm.unlink()
@@ -43,6 +43,8 @@ class ArcGIS(Geocoder):
             user_agent=None,
             ssl_context=DEFAULT_SENTINEL,
             adapter_factory=None,
+            cache=DEFAULT_SENTINEL,
+            reverse_precision=DEFAULT_SENTINEL,
             auth_domain='www.arcgis.com',
             domain='geocode.arcgis.com'
     ):
@@ -85,6 +87,17 @@ class ArcGIS(Geocoder):
 
             .. versionadded:: 2.0
 
+        :type cache: :class:`geopy.cache.BaseCache`
+        :param cache:
+            See :attr:`geopy.geocoders.options.default_cache`.
+
+            .. versionadded:: 2.6
+
+        :param int reverse_precision:
+            See :attr:`geopy.geocoders.options.default_reverse_precision`.
+
+            .. versionadded:: 2.6
+
         :param str auth_domain: Domain where the target ArcGIS auth service
             is hosted. Used only in authenticated mode (i.e. username,
             password and referer are set).
@@ -99,6 +112,8 @@ class ArcGIS(Geocoder):
             user_agent=user_agent,
             ssl_context=ssl_context,
             adapter_factory=adapter_factory,
+            cache=cache,
+            reverse_precision=reverse_precision,
         )
         if username or password or referer:
             if not (username and password and referer):
@@ -216,7 +231,7 @@ class ArcGIS(Geocoder):
         :rtype: ``None``, :class:`geopy.location.Location` or a list of them, if
             ``exactly_one=False``.
         """
-        location = self._coerce_point_to_string(query, "%(lon)s,%(lat)s")
+        location = self._coerce_reverse_query_to_string(query, "%(lon)s,%(lat)s")
         wkid = DEFAULT_WKID
         params = {'location': location, 'f': 'json', 'outSR': wkid}
         if distance is not None:
@@ -325,4 +340,6 @@ class ArcGIS(Geocoder):
             self.token_expiry = int(time()) + self.token_lifetime
             return callback_success()
 
-        return self._call_geocoder(url, cb, timeout=timeout)
+        # The tokens are credentials, which must not be stored, and
+        # a cached token would be replayed after its expiration.
+        return self._call_geocoder(url, cb, timeout=timeout, cache=False)
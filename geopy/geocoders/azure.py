@@ -24,6 +24,8 @@ class AzureMaps(TomTom):
             user_agent=None,
             ssl_context=DEFAULT_SENTINEL,
             adapter_factory=None,
+            cache=DEFAULT_SENTINEL,
+            reverse_precision=DEFAULT_SENTINEL,
             domain='atlas.microsoft.com'
     ):
         """
@@ -50,6 +52,17 @@ class AzureMaps(TomTom):
 
             .. versionadded:: 2.0
 
+        :type cache: :class:`geopy.cache.BaseCache`
+        :param cache:
+            See :attr:`geopy.geocoders.options.default_cache`.
+
+            .. versionadded:: 2.6
+
+        :param int reverse_precision:
+            See :attr:`geopy.geocoders.options.default_reverse_precision`.
+
+            .. versionadded:: 2.6
+
         :param str domain: Domain where the target Azure Maps service
             is hosted.
         """
@@ -61,6 +74,8 @@ class AzureMaps(TomTom):
             user_agent=user_agent,
             ssl_context=ssl_context,
             adapter_factory=adapter_factory,
+            cache=cache,
+            reverse_precision=reverse_precision,
             domain=domain,
         )
 
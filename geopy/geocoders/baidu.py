@@ -39,6 +39,8 @@ class Baidu(Geocoder):
             user_agent=None,
             ssl_context=DEFAULT_SENTINEL,
             adapter_factory=None,
+            cache=DEFAULT_SENTINEL,
+            reverse_precision=DEFAULT_SENTINEL,
             security_key=None
     ):
         """
@@ -68,6 +70,17 @@ class Baidu(Geocoder):
 
             .. versionadded:: 2.0
 
+        :type cache: :class:`geopy.cache.BaseCache`
+        :param cache:
+            See :attr:`geopy.geocoders.options.default_cache`.
+
+            .. versionadded:: 2.6
+
+        :param int reverse_precision:
+            See :attr:`geopy.geocoders.options.default_reverse_precision`.
+
+            .. versionadded:: 2.6
+
         :param str security_key: The security key (SK) to calculate
             the SN parameter in request if authentication setting requires
             (http://lbsyun.baidu.com/index.php?title=lbscloud/api/appendix).
@@ -79,6 +92,8 @@ class Baidu(Geocoder):
             user_agent=user_agent,
             ssl_context=ssl_context,
             adapter_factory=adapter_factory,
+            cache=cache,
+            reverse_precision=reverse_precision,
         )
         self.api_key = api_key
         self.api = '%s://api.map.baidu.com%s' % (self.scheme, self.api_path)
@@ -153,7 +168,7 @@ class Baidu(Geocoder):
         params = {
             'ak': self.api_key,
             'output': 'json',
-            'location': self._coerce_point_to_string(query),
+            'location': self._coerce_reverse_query_to_string(query),
         }
 
         url = self._construct_url(self.reverse_api, self.reverse_path, params)
@@ -27,7 +27,9 @@ class BANFrance(Geocoder):
             proxies=DEFAULT_SENTINEL,
             user_agent=None,
             ssl_context=DEFAULT_SENTINEL,
-            adapter_factory=None
+            adapter_factory=None,
+            cache=DEFAULT_SENTINEL,
+            reverse_precision=DEFAULT_SENTINEL
     ):
         """
 
@@ -55,6 +57,17 @@ class BANFrance(Geocoder):
 
             .. versionadded:: 2.0
 
+        :type cache: :class:`geopy.cache.BaseCache`
+        :param cache:
+            See :attr:`geopy.geocoders.options.default_cache`.
+
+            .. versionadded:: 2.6
+
+        :param int reverse_precision:
+            See :attr:`geopy.geocoders.options.default_reverse_precision`.
+
+            .. versionadded:: 2.6
+
         """
         super().__init__(
             scheme=scheme,
@@ -63,6 +76,8 @@ class BANFrance(Geocoder):
             user_agent=user_agent,
             ssl_context=ssl_context,
             adapter_factory=adapter_factory,
+            cache=cache,
+            reverse_precision=reverse_precision,
         )
         self.domain = domain.strip('/')
 
@@ -146,7 +161,7 @@ class BANFrance(Geocoder):
         """
 
         try:
-            lat, lon = self._coerce_point_to_string(query).split(',')
+            lat, lon = self._coerce_reverse_query_to_string(query).split(',')
         except ValueError:
             raise ValueError("Must be a coordinate pair or Point")
 
@@ -1,6 +1,8 @@
 import asyncio
+import copy
 import functools
 import inspect
+import json
 import threading
 
 from geopy.adapters import (
@@ -11,6 +13,7 @@ from geopy.adapters import (
     URLLibAdapter,
     get_retry_after,
 )
+from geopy.cache import _cache_key
 from geopy.exc import (
     ConfigurationError,
     GeocoderAuthenticationFailure,
@@ -89,6 +92,14 @@ class options:
 
             .. versionadded:: 2.0
 
+        default_cache
+            A :class:`geopy.cache.BaseCache` instance storing the responses
+            of the geocoding services, e.g. :class:`geopy.cache.MemoryCache`.
+            See :mod:`geopy.cache` for more info. ``None`` (the default)
+            disables caching.
+
+            .. versionadded:: 2.6
+
         default_proxies
             Tunnel requests through HTTP proxy.
 
@@ -131,6 +142,23 @@ class options:
             For more information, see
             documentation on :func:`urllib.request.getproxies`.
 
+        default_reverse_precision
+            Number of decimal places the latitude and longitude of the
+            :meth:`reverse` queries are rounded to, e.g. ``4`` snaps the
+            points to a grid with the step of about 11 meters (``3`` --
+            110 meters). ``None`` (the default) sends the points as is.
+
+            The points from GPS devices almost never repeat exactly, so
+            the caches (see :attr:`default_cache`) rarely help with their
+            reverse queries. Once the points are snapped to the grid,
+            all the points within a grid cell produce the same request
+            and the same (cached) :class:`geopy.location.Location`.
+            The service is queried with the snapped point instead of
+            the exact one, so the precision should be chosen to match
+            the tolerance of the application.
+
+            .. versionadded:: 2.6
+
         default_scheme
             Use ``'https'`` or ``'http'`` as the API URL's scheme.
 
@@ -179,7 +207,9 @@ class options:
     # [1]: http://www.sphinx-doc.org/en/master/ext/autodoc.html#directive-autoattribute
     # [2]: https://github.com/rtfd/readthedocs.org/issues/855#issuecomment-261337038
     default_adapter_factory = _DEFAULT_ADAPTER_CLASS
+    default_cache = None
     default_proxies = None
+    default_reverse_precision = None
     default_scheme = 'https'
     default_ssl_context = None
     default_timeout = 1
@@ -209,6 +239,10 @@ ERROR_CODE_MAP = {
 
 NONE_RESULT = object()  # special return value for `_geocoder_exception_handler`
 
+# A cached `NONE_RESULT` outcome. It can't be confused with the cached
+# JSON responses, and the services don't return a lone NUL as text.
+_CACHED_NONE_RESULT = '\x00'
+
 
 class Geocoder:
     """
@@ -223,7 +257,9 @@ class Geocoder:
             proxies=DEFAULT_SENTINEL,
             user_agent=None,
             ssl_context=DEFAULT_SENTINEL,
-            adapter_factory=None
+            adapter_factory=None,
+            cache=DEFAULT_SENTINEL,
+            reverse_precision=DEFAULT_SENTINEL
     ):
         self.scheme = scheme or options.default_scheme
         if self.scheme not in ('http', 'https'):
@@ -237,6 +273,21 @@ class Geocoder:
         self.headers = {'User-Agent': user_agent or options.default_user_agent}
         self.ssl_context = (ssl_context if ssl_context is not DEFAULT_SENTINEL
                             else options.default_ssl_context)
+        self.cache = (cache if cache is not DEFAULT_SENTINEL
+                      else options.default_cache)
+        self._flights = {}
+        self._flights_lock = threading.Lock()
+        self._revalidations = {}
+        self.reverse_precision = (
+            reverse_precision if reverse_precision is not DEFAULT_SENTINEL
+            else options.default_reverse_precision
+        )
+        if self.reverse_precision is not None and not (
+            isinstance(self.reverse_precision, int) and self.reverse_precision >= 0
+        ):
+            raise ConfigurationError(
+                '`reverse_precision` must be a non-negative integer or None.'
+            )
 
         if isinstance(self.proxies, str):
             self.proxies = {'http': self.proxies, 'https': self.proxies}
@@ -308,6 +359,20 @@ class Geocoder:
         return output_format % dict(lat=_format_coordinate(point.latitude),
                                     lon=_format_coordinate(point.longitude))
 
+    def _coerce_reverse_query_to_string(
+        self, point, output_format="%(lat)s,%(lon)s"
+    ):
+        """
+        :meth:`._coerce_point_to_string` for the queries of the reverse
+        methods, which snaps the point to the grid of `reverse_precision`.
+        """
+        if self.reverse_precision is not None:
+            if not isinstance(point, Point):
+                point = Point(point)
+            point = Point(round(point.latitude, self.reverse_precision),
+                          round(point.longitude, self.reverse_precision))
+        return self._coerce_point_to_string(point, output_format)
+
     def _format_bounding_box(
         self, bbox, output_format="%(lat1)s,%(lon1)s,%(lat2)s,%(lon2)s"
     ):
@@ -349,10 +414,14 @@ class Geocoder:
             *,
             timeout=DEFAULT_SENTINEL,
             is_json=True,
-            headers=None
+            headers=None,
+            cache=True
     ):
         """
         For a generated query URL, get the results.
+
+        Pass ``cache=False`` for the requests whose responses must not
+        be cached, e.g. the authentication tokens.
         """
 
         req_headers = self.headers.copy()
@@ -362,32 +431,222 @@ class Geocoder:
         timeout = (timeout if timeout is not DEFAULT_SENTINEL
                    else self.timeout)
 
-        try:
+        request_key = _cache_key(url, req_headers, is_json)
+        cache_key = request_key if cache and self.cache is not None else None
+        # Concurrent identical calls share a single adapter request,
+        # even if their timeouts differ: the request made by the first
+        # call, with its timeout, is awaited by the others.
+        flight_key = request_key
+
+        def request():
             if is_json:
-                result = self.adapter.get_json(url, timeout=timeout, headers=req_headers)
-            else:
-                result = self.adapter.get_text(url, timeout=timeout, headers=req_headers)
-            if self.__run_async:
-                async def fut():
-                    try:
-                        res = callback(await result)
-                        if inspect.isawaitable(res):
-                            res = await res
-                        return res
-                    except Exception as error:
-                        res = self._adapter_error_handler(error)
-                        if res is NONE_RESULT:
-                            return None
+                return self.adapter.get_json(url, timeout=timeout, headers=req_headers)
+            return self.adapter.get_text(url, timeout=timeout, headers=req_headers)
+
+        def fetch():
+            return self._fetch(flight_key, cache_key, request, callback, is_json)
+
+        cached, stale = self._cache_lookup(cache_key)
+        if cached is None:
+            return fetch()
+
+        if self.__run_async:
+            async def fut():
+                try:
+                    if stale:
+                        self._revalidate(flight_key, fetch)
+                    response = self._cache_decode(cached, is_json)
+                    if response is NONE_RESULT:
+                        return None
+                    res = callback(response)
+                    if inspect.isawaitable(res):
+                        res = await res
+                    return res
+                except Exception as error:
+                    res = self._adapter_error_handler(error)
+                    if res is NONE_RESULT:
+                        return None
+                    raise
+
+            return fut()
+        else:
+            try:
+                if stale:
+                    self._revalidate(flight_key, fetch)
+                response = self._cache_decode(cached, is_json)
+                if response is NONE_RESULT:
+                    return None
+                return callback(response)
+            except Exception as error:
+                res = self._adapter_error_handler(error)
+                if res is NONE_RESULT:
+                    return None
+                raise
+
+    def _fetch(self, flight_key, cache_key, request, callback, is_json):
+        # Make the request (shared with the concurrent identical calls),
+        # parse the response and store the outcome in the cache.
+        if self.__run_async:
+            async def fut():
+                leader = False
+                try:
+                    flight, leader = await self._coalesce_async(flight_key, request)
+                    response = flight.response()
+                    encoded = self._cache_encode(cache_key, leader, response,
+                                                 is_json)
+                    res = callback(response)
+                    if inspect.isawaitable(res):
+                        res = await res
+                except Exception as error:
+                    res = self._adapter_error_handler(error)
+                    if res is not NONE_RESULT:
                         raise
+                    res = None
+                    encoded = self._cache_encode(cache_key, leader, NONE_RESULT,
+                                                 is_json)
+                self._cache_set(cache_key, encoded, negative=res is None)
+                return res
 
-                return fut()
+            return fut()
+        else:
+            leader = False
+            try:
+                flight, leader = self._coalesce(flight_key, request)
+                response = flight.response()
+                encoded = self._cache_encode(cache_key, leader, response, is_json)
+                res = callback(response)
+            except Exception as error:
+                res = self._adapter_error_handler(error)
+                if res is not NONE_RESULT:
+                    raise
+                res = None
+                encoded = self._cache_encode(cache_key, leader, NONE_RESULT,
+                                             is_json)
+            self._cache_set(cache_key, encoded, negative=res is None)
+            return res
+
+    def _coalesce(self, key, request):
+        # Make the request, unless an identical one is already in flight
+        # in another thread, in which case wait for its outcome instead.
+        # Returns the finished flight and whether this call has made
+        # the request.
+        with self._flights_lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight(threading.Event())
             else:
-                return callback(result)
+                flight.followers += 1
+        if leader:
+            try:
+                flight.result = request()
+            except BaseException as error:
+                flight.error = error
+            finally:
+                # No calls join the flight after it's removed, so
+                # `followers` is final when the waiters are woken up.
+                with self._flights_lock:
+                    del self._flights[key]
+                flight.done.set()
+        else:
+            flight.done.wait()
+        return flight, leader
+
+    async def _coalesce_async(self, key, request):
+        # An asynchronous counterpart of `_coalesce`. The request runs
+        # in its own task which is shielded from the cancellation of
+        # the waiting calls, so cancelling one of them (including
+        # the first one) doesn't affect the others.
+        flight = self._flights.get(key)
+        leader = flight is None or flight.done.done()
+        if leader:
+            flight = self._flights[key] = _Flight(asyncio.ensure_future(request()))
+
+            def done(task):
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+                if not task.cancelled():
+                    task.exception()  # don't warn if all the waiters are gone
+
+            flight.done.add_done_callback(done)
+        else:
+            flight.followers += 1
+        try:
+            flight.result = await asyncio.shield(flight.done)
         except Exception as error:
-            res = self._adapter_error_handler(error)
-            if res is NONE_RESULT:
-                return None
-            raise
+            flight.error = error
+        return flight, leader
+
+    def _revalidate(self, flight_key, fetch):
+        # Refresh a stale cache entry in the background, unless it's
+        # already being refreshed. `fetch` stores the outcome.
+        with self._flights_lock:
+            if flight_key in self._revalidations:
+                return
+            self._revalidations[flight_key] = None
+
+        def finish(error):
+            with self._flights_lock:
+                del self._revalidations[flight_key]
+            if error is not None:
+                logger.warning('Cache revalidation has failed',
+                               exc_info=(type(error), error, error.__traceback__))
+
+        if self.__run_async:
+            # Keep a reference to the task, the event loop doesn't.
+            task = self._revalidations[flight_key] = asyncio.ensure_future(fetch())
+            task.add_done_callback(
+                lambda task: finish(None if task.cancelled() else task.exception())
+            )
+        else:
+            def run():
+                error = None
+                try:
+                    fetch()
+                except Exception as e:
+                    error = e
+                finally:
+                    finish(error)
+
+            thread = threading.Thread(target=run, daemon=True)
+            self._revalidations[flight_key] = thread
+            thread.start()
+
+    def _cache_lookup(self, cache_key):
+        # Failures of the cache must not fail the geocoding.
+        if cache_key is None:
+            return None, False
+        try:
+            return self.cache.lookup(cache_key)
+        except Exception:
+            logger.warning('Cache lookup has failed', exc_info=True)
+            return None, False
+
+    def _cache_decode(self, cached, is_json):
+        if cached == _CACHED_NONE_RESULT:
+            return NONE_RESULT
+        return json.loads(cached) if is_json else cached
+
+    def _cache_encode(self, cache_key, leader, response, is_json):
+        # The response is serialized before the callback is called,
+        # because callbacks might modify it. Only the call which has
+        # made the request stores the response: the other ones have
+        # got it from the cache or from that call.
+        if cache_key is None or not leader:
+            return None
+        if response is NONE_RESULT:
+            return _CACHED_NONE_RESULT
+        return json.dumps(response) if is_json else response
+
+    def _cache_set(self, cache_key, encoded, negative):
+        # Called only after the callback has successfully parsed
+        # the response, so the errors are not cached.
+        if encoded is None:
+            return
+        try:
+            self.cache.set(cache_key, encoded, negative=negative)
+        except Exception:
+            logger.warning('Cache update has failed', exc_info=True)
 
     def _adapter_error_handler(self, error):
         if isinstance(error, AdapterHTTPError):
@@ -426,6 +685,30 @@ def _format_coordinate(coordinate):
     return f"{coordinate:.7f}"  # noqa
 
 
+class _Flight:
+    # An adapter request shared by the concurrent identical calls
+    # of `Geocoder._call_geocoder`. `done` is a `threading.Event`
+    # for the synchronous adapters and an `asyncio.Task` making
+    # the request for the asynchronous ones.
+
+    __slots__ = ('done', 'followers', 'result', 'error')
+
+    def __init__(self, done):
+        self.done = done
+        self.followers = 0
+        self.result = None
+        self.error = None
+
+    def response(self):
+        # The callbacks might modify the response, so when it's shared,
+        # each of the calls gets its own copy.
+        if self.error is not None:
+            raise self.error
+        if self.followers:
+            return copy.deepcopy(self.result)
+        return self.result
+
+
 def _synchronized(func):
     """A decorator for geocoder methods which makes the method always run
     under a lock. The lock is reentrant.
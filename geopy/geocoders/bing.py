@@ -44,6 +44,8 @@ class Bing(Geocoder):
             user_agent=None,
             ssl_context=DEFAULT_SENTINEL,
             adapter_factory=None,
+            cache=DEFAULT_SENTINEL,
+            reverse_precision=DEFAULT_SENTINEL,
             domain='dev.virtualearth.net',
     ):
         """
@@ -72,6 +74,17 @@ class Bing(Geocoder):
 
             .. versionadded:: 2.0
 
+        :type cache: :class:`geopy.cache.BaseCache`
+        :param cache:
+            See :attr:`geopy.geocoders.options.default_cache`.
+
+            .. versionadded:: 2.6
+
+        :param int reverse_precision:
+            See :attr:`geopy.geocoders.options.default_reverse_precision`.
+
+            .. versionadded:: 2.6
+
         :param str domain: base api domain
 
             .. versionadded:: 2.4
@@ -83,6 +96,8 @@ class Bing(Geocoder):
             user_agent=user_agent,
             ssl_context=ssl_context,
             adapter_factory=adapter_factory,
+            cache=cache,
+            reverse_precision=reverse_precision,
         )
         self.api_key = api_key
         self.geocode_api = '%s://%s%s' % (self.scheme, domain, self.geocode_path)
@@ -198,7 +213,7 @@ class Bing(Geocoder):
         :rtype: ``None``, :class:`geopy.location.Location` or a list of them, if
             ``exactly_one=False``.
         """
-        point = self._coerce_point_to_string(query)
+        point = self._coerce_reverse_query_to_string(query)
         params = {'key': self.api_key}
         if culture:
             params['culture'] = culture
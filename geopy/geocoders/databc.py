@@ -27,6 +27,7 @@ class DataBC(Geocoder):
             user_agent=None,
             ssl_context=DEFAULT_SENTINEL,
             adapter_factory=None,
+            cache=DEFAULT_SENTINEL,
             domain='geocoder.api.gov.bc.ca',
     ):
         """
@@ -52,6 +53,12 @@ class DataBC(Geocoder):
 
             .. versionadded:: 2.0
 
+        :type cache: :class:`geopy.cache.BaseCache`
+        :param cache:
+            See :attr:`geopy.geocoders.options.default_cache`.
+
+            .. versionadded:: 2.6
+
         :param str domain: base api domain
 
             .. versionadded:: 2.4
@@ -63,6 +70,7 @@ class DataBC(Geocoder):
             user_agent=user_agent,
             ssl_context=ssl_context,
             adapter_factory=adapter_factory,
+            cache=cache,
         )
         self.api = '%s://%s%s' % (self.scheme, domain, self.geocode_path)
 
@@ -25,7 +25,9 @@ class GeocodeEarth(Pelias):
             user_agent=None,
             scheme=None,
             ssl_context=DEFAULT_SENTINEL,
-            adapter_factory=None
+            adapter_factory=None,
+            cache=DEFAULT_SENTINEL,
+            reverse_precision=DEFAULT_SENTINEL
     ):
         """
         :param str api_key: Geocode.earth API key, required.
@@ -53,6 +55,17 @@ class GeocodeEarth(Pelias):
 
             .. versionadded:: 2.0
 
+        :type cache: :class:`geopy.cache.BaseCache`
+        :param cache:
+            See :attr:`geopy.geocoders.options.default_cache`.
+
+            .. versionadded:: 2.6
+
+        :param int reverse_precision:
+            See :attr:`geopy.geocoders.options.default_reverse_precision`.
+
+            .. versionadded:: 2.6
+
         """
         super().__init__(
             api_key=api_key,
@@ -63,4 +76,6 @@ class GeocodeEarth(Pelias):
             scheme=scheme,
             ssl_context=ssl_context,
             adapter_factory=adapter_factory,
+            cache=cache,
+            reverse_precision=reverse_precision,
         )
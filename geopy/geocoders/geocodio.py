@@ -46,6 +46,8 @@ class Geocodio(Geocoder):
         user_agent=None,
         ssl_context=DEFAULT_SENTINEL,
         adapter_factory=None,
+        cache=DEFAULT_SENTINEL,
+        reverse_precision=DEFAULT_SENTINEL,
         domain=None,
     ):
         """
@@ -71,6 +73,17 @@ class Geocodio(Geocoder):
         :param callable adapter_factory:
             See :attr:`geopy.geocoders.options.default_adapter_factory`.
 
+        :type cache: :class:`geopy.cache.BaseCache`
+        :param cache:
+            See :attr:`geopy.geocoders.options.default_cache`.
+
+            .. versionadded:: 2.6
+
+        :param int reverse_precision:
+            See :attr:`geopy.geocoders.options.default_reverse_precision`.
+
+            .. versionadded:: 2.6
+
         :param str domain: base api domain
 
             .. versionadded:: 2.4
@@ -82,6 +95,8 @@ class Geocodio(Geocoder):
             user_agent=user_agent,
             ssl_context=ssl_context,
             adapter_factory=adapter_factory,
+            cache=cache,
+            reverse_precision=reverse_precision,
         )
         self.api_key = api_key
         if domain:
@@ -172,7 +187,7 @@ class Geocodio(Geocoder):
             ``exactly_one=False``.
         """
         params = {
-            'q': self._coerce_point_to_string(query),
+            'q': self._coerce_reverse_query_to_string(query),
             'api_key': self.api_key
         }
         if exactly_one:
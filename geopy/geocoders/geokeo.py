@@ -37,7 +37,9 @@ class Geokeo(Geocoder):
             proxies=DEFAULT_SENTINEL,
             user_agent=None,
             ssl_context=DEFAULT_SENTINEL,
-            adapter_factory=None
+            adapter_factory=None,
+            cache=DEFAULT_SENTINEL,
+            reverse_precision=DEFAULT_SENTINEL
     ):
         """
 
@@ -67,6 +69,17 @@ class Geokeo(Geocoder):
         :param callable adapter_factory:
             See :attr:`geopy.geocoders.options.default_adapter_factory`.
 
+        :type cache: :class:`geopy.cache.BaseCache`
+        :param cache:
+            See :attr:`geopy.geocoders.options.default_cache`.
+
+            .. versionadded:: 2.6
+
+        :param int reverse_precision:
+            See :attr:`geopy.geocoders.options.default_reverse_precision`.
+
+            .. versionadded:: 2.6
+
         """
         super().__init__(
             scheme=scheme,
@@ -75,6 +88,8 @@ class Geokeo(Geocoder):
             user_agent=user_agent,
             ssl_context=ssl_context,
             adapter_factory=adapter_factory,
+            cache=cache,
+            reverse_precision=reverse_precision,
         )
 
         self.api_key = api_key
@@ -152,7 +167,7 @@ class Geokeo(Geocoder):
         """
 
         try:
-            lat, lng = self._coerce_point_to_string(query).split(',')
+            lat, lng = self._coerce_reverse_query_to_string(query).split(',')
         except ValueError:
             raise ValueError("Must be a coordinate pair or Point")
 
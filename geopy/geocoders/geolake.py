@@ -42,7 +42,8 @@ class Geolake(Geocoder):
             proxies=DEFAULT_SENTINEL,
             user_agent=None,
             ssl_context=DEFAULT_SENTINEL,
-            adapter_factory=None
+            adapter_factory=None,
+            cache=DEFAULT_SENTINEL
     ):
         """
 
@@ -74,6 +75,12 @@ class Geolake(Geocoder):
 
             .. versionadded:: 2.0
 
+        :type cache: :class:`geopy.cache.BaseCache`
+        :param cache:
+            See :attr:`geopy.geocoders.options.default_cache`.
+
+            .. versionadded:: 2.6
+
         """
         super().__init__(
             scheme=scheme,
@@ -82,6 +89,7 @@ class Geolake(Geocoder):
             user_agent=user_agent,
             ssl_context=ssl_context,
             adapter_factory=adapter_factory,
+            cache=cache,
         )
 
         self.api_key = api_key
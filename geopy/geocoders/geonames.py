@@ -44,6 +44,8 @@ class GeoNames(Geocoder):
             user_agent=None,
             ssl_context=DEFAULT_SENTINEL,
             adapter_factory=None,
+            cache=DEFAULT_SENTINEL,
+            reverse_precision=DEFAULT_SENTINEL,
             scheme='http',
             domain='api.geonames.org',
     ):
@@ -70,6 +72,17 @@ class GeoNames(Geocoder):
 
             .. versionadded:: 2.0
 
+        :type cache: :class:`geopy.cache.BaseCache`
+        :param cache:
+            See :attr:`geopy.geocoders.options.default_cache`.
+
+            .. versionadded:: 2.6
+
+        :param int reverse_precision:
+            See :attr:`geopy.geocoders.options.default_reverse_precision`.
+
+            .. versionadded:: 2.6
+
         :param str scheme:
             See :attr:`geopy.geocoders.options.default_scheme`. Note that
             at the time of writing GeoNames doesn't support `https`, so
@@ -89,6 +102,8 @@ class GeoNames(Geocoder):
             user_agent=user_agent,
             ssl_context=ssl_context,
             adapter_factory=adapter_factory,
+            cache=cache,
+            reverse_precision=reverse_precision,
         )
         self.username = username
 
@@ -205,7 +220,7 @@ class GeoNames(Geocoder):
         """
 
         try:
-            lat, lng = self._coerce_point_to_string(query).split(',')
+            lat, lng = self._coerce_reverse_query_to_string(query).split(',')
         except ValueError:
             raise ValueError("Must be a coordinate pair or Point")
 
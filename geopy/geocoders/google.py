@@ -48,6 +48,8 @@ class GoogleV3(Geocoder):
             user_agent=None,
             ssl_context=DEFAULT_SENTINEL,
             adapter_factory=None,
+            cache=DEFAULT_SENTINEL,
+            reverse_precision=DEFAULT_SENTINEL,
             channel=''
     ):
         """
@@ -96,6 +98,17 @@ class GoogleV3(Geocoder):
 
             .. versionadded:: 2.0
 
+        :type cache: :class:`geopy.cache.BaseCache`
+        :param cache:
+            See :attr:`geopy.geocoders.options.default_cache`.
+
+            .. versionadded:: 2.6
+
+        :param int reverse_precision:
+            See :attr:`geopy.geocoders.options.default_reverse_precision`.
+
+            .. versionadded:: 2.6
+
         :param str channel: If using premier, the channel identifier.
         """
         super().__init__(
@@ -105,6 +118,8 @@ class GoogleV3(Geocoder):
             user_agent=user_agent,
             ssl_context=ssl_context,
             adapter_factory=adapter_factory,
+            cache=cache,
+            reverse_precision=reverse_precision,
         )
         if client_id and not secret_key:
             raise ConfigurationError('Must provide secret_key with client_id.')
@@ -307,7 +322,7 @@ class GoogleV3(Geocoder):
         """
 
         params = {
-            'latlng': self._coerce_point_to_string(query),
+            'latlng': self._coerce_reverse_query_to_string(query),
             'sensor': str(sensor).lower()
         }
         if language:
@@ -57,7 +57,9 @@ class Here(Geocoder):
             proxies=DEFAULT_SENTINEL,
             user_agent=None,
             ssl_context=DEFAULT_SENTINEL,
-            adapter_factory=None
+            adapter_factory=None,
+            cache=DEFAULT_SENTINEL,
+            reverse_precision=DEFAULT_SENTINEL
     ):
         """
 
@@ -107,6 +109,17 @@ class Here(Geocoder):
             See :attr:`geopy.geocoders.options.default_adapter_factory`.
 
             .. versionadded:: 2.0
+
+        :type cache: :class:`geopy.cache.BaseCache`
+        :param cache:
+            See :attr:`geopy.geocoders.options.default_cache`.
+
+            .. versionadded:: 2.6
+
+        :param int reverse_precision:
+            See :attr:`geopy.geocoders.options.default_reverse_precision`.
+
+            .. versionadded:: 2.6
         """
         super().__init__(
             scheme=scheme,
@@ -115,6 +128,8 @@ class Here(Geocoder):
             user_agent=user_agent,
             ssl_context=ssl_context,
             adapter_factory=adapter_factory,
+            cache=cache,
+            reverse_precision=reverse_precision,
         )
         is_apikey = bool(apikey)
         is_app_code = app_id and app_code
@@ -304,7 +319,7 @@ class Here(Geocoder):
         :rtype: ``None``, :class:`geopy.location.Location` or a list of them, if
             ``exactly_one=False``.
         """
-        point = self._coerce_point_to_string(query)
+        point = self._coerce_reverse_query_to_string(query)
         params = {
             'mode': mode,
             'prox': point,
@@ -419,6 +434,8 @@ class HereV7(Geocoder):
             user_agent=None,
             ssl_context=DEFAULT_SENTINEL,
             adapter_factory=None,
+            cache=DEFAULT_SENTINEL,
+            reverse_precision=DEFAULT_SENTINEL,
             domain="search.hereapi.com",
     ):
         """
@@ -446,6 +463,17 @@ class HereV7(Geocoder):
         :param callable adapter_factory:
             See :attr:`geopy.geocoders.options.default_adapter_factory`.
 
+        :type cache: :class:`geopy.cache.BaseCache`
+        :param cache:
+            See :attr:`geopy.geocoders.options.default_cache`.
+
+            .. versionadded:: 2.6
+
+        :param int reverse_precision:
+            See :attr:`geopy.geocoders.options.default_reverse_precision`.
+
+            .. versionadded:: 2.6
+
         :param str domain: base api domain
 
             .. versionadded:: 2.4
@@ -457,6 +485,8 @@ class HereV7(Geocoder):
             user_agent=user_agent,
             ssl_context=ssl_context,
             adapter_factory=adapter_factory,
+            cache=cache,
+            reverse_precision=reverse_precision,
         )
 
         self.apikey = apikey
@@ -596,7 +626,9 @@ class HereV7(Geocoder):
         """
 
         params = {
-            'at': self._coerce_point_to_string(query, output_format="%(lat)s,%(lon)s"),
+            'at': self._coerce_reverse_query_to_string(
+                query, output_format="%(lat)s,%(lon)s"
+            ),
             'apiKey': self.apikey,
         }
 
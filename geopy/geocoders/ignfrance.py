@@ -49,7 +49,9 @@ class IGNFrance(Geocoder):
             proxies=DEFAULT_SENTINEL,
             user_agent=None,
             ssl_context=DEFAULT_SENTINEL,
-            adapter_factory=None
+            adapter_factory=None,
+            cache=DEFAULT_SENTINEL,
+            reverse_precision=DEFAULT_SENTINEL
     ):
         """
 
@@ -99,6 +101,17 @@ class IGNFrance(Geocoder):
             See :attr:`geopy.geocoders.options.default_adapter_factory`.
 
             .. versionadded:: 2.0
+
+        :type cache: :class:`geopy.cache.BaseCache`
+        :param cache:
+            See :attr:`geopy.geocoders.options.default_cache`.
+
+            .. versionadded:: 2.6
+
+        :param int reverse_precision:
+            See :attr:`geopy.geocoders.options.default_reverse_precision`.
+
+            .. versionadded:: 2.6
         """  # noqa
         super().__init__(
             scheme=scheme,
@@ -107,6 +120,8 @@ class IGNFrance(Geocoder):
             user_agent=user_agent,
             ssl_context=ssl_context,
             adapter_factory=adapter_factory,
+            cache=cache,
+            reverse_precision=reverse_precision,
         )
 
         if api_key or username or password or referer:
@@ -294,7 +309,7 @@ class IGNFrance(Geocoder):
                     'one or more of: StreetAddress, PositionOfInterest'
                 )
 
-        point = self._coerce_point_to_string(query, "%(lat)s %(lon)s")
+        point = self._coerce_reverse_query_to_string(query, "%(lat)s %(lon)s")
         reverse_geocode_preference = '\n'.join(
             '<ReverseGeocodePreference>%s</ReverseGeocodePreference>' % pref
             for pref
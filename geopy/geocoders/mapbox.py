@@ -28,6 +28,8 @@ class MapBox(Geocoder):
             user_agent=None,
             ssl_context=DEFAULT_SENTINEL,
             adapter_factory=None,
+            cache=DEFAULT_SENTINEL,
+            reverse_precision=DEFAULT_SENTINEL,
             domain='api.mapbox.com',
             referer=None
     ):
@@ -57,6 +59,17 @@ class MapBox(Geocoder):
 
             .. versionadded:: 2.0
 
+        :type cache: :class:`geopy.cache.BaseCache`
+        :param cache:
+            See :attr:`geopy.geocoders.options.default_cache`.
+
+            .. versionadded:: 2.6
+
+        :param int reverse_precision:
+            See :attr:`geopy.geocoders.options.default_reverse_precision`.
+
+            .. versionadded:: 2.6
+
         :param str domain: base api domain for mapbox
 
         :param str referer: The URL used to satisfy the URL restriction of
@@ -71,6 +84,8 @@ class MapBox(Geocoder):
             user_agent=user_agent,
             ssl_context=ssl_context,
             adapter_factory=adapter_factory,
+            cache=cache,
+            reverse_precision=reverse_precision,
         )
         self.api_key = api_key
         self.domain = domain.strip('/')
@@ -202,7 +217,7 @@ class MapBox(Geocoder):
         params = {}
         params['access_token'] = self.api_key
 
-        point = self._coerce_point_to_string(query, "%(lon)s,%(lat)s")
+        point = self._coerce_reverse_query_to_string(query, "%(lon)s,%(lat)s")
         quoted_query = quote(point.encode('utf-8'))
         url = "?".join((self.api % dict(query=quoted_query),
                         urlencode(params)))
@@ -35,6 +35,8 @@ class MapQuest(Geocoder):
             user_agent=None,
             ssl_context=DEFAULT_SENTINEL,
             adapter_factory=None,
+            cache=DEFAULT_SENTINEL,
+            reverse_precision=DEFAULT_SENTINEL,
             domain='www.mapquestapi.com'
     ):
         """
@@ -63,6 +65,17 @@ class MapQuest(Geocoder):
 
             .. versionadded:: 2.0
 
+        :type cache: :class:`geopy.cache.BaseCache`
+        :param cache:
+            See :attr:`geopy.geocoders.options.default_cache`.
+
+            .. versionadded:: 2.6
+
+        :param int reverse_precision:
+            See :attr:`geopy.geocoders.options.default_reverse_precision`.
+
+            .. versionadded:: 2.6
+
         :param str domain: base api domain for MapQuest
         """
         super().__init__(
@@ -72,6 +85,8 @@ class MapQuest(Geocoder):
             user_agent=user_agent,
             ssl_context=ssl_context,
             adapter_factory=adapter_factory,
+            cache=cache,
+            reverse_precision=reverse_precision,
         )
 
         self.api_key = api_key
@@ -201,7 +216,7 @@ class MapQuest(Geocoder):
         params = {}
         params['key'] = self.api_key
 
-        point = self._coerce_point_to_string(query, "%(lat)s,%(lon)s")
+        point = self._coerce_reverse_query_to_string(query, "%(lat)s,%(lon)s")
         params['location'] = point
 
         url = '?'.join((self.reverse_api, urlencode(params)))
@@ -59,7 +59,9 @@ class Nominatim(Geocoder):
             scheme=None,
             user_agent=None,
             ssl_context=DEFAULT_SENTINEL,
-            adapter_factory=None
+            adapter_factory=None,
+            cache=DEFAULT_SENTINEL,
+            reverse_precision=DEFAULT_SENTINEL
             # Make sure to synchronize the changes of this signature in the
             # inheriting classes (e.g. PickPoint).
     ):
@@ -88,6 +90,17 @@ class Nominatim(Geocoder):
             See :attr:`geopy.geocoders.options.default_adapter_factory`.
 
             .. versionadded:: 2.0
+
+        :type cache: :class:`geopy.cache.BaseCache`
+        :param cache:
+            See :attr:`geopy.geocoders.options.default_cache`.
+
+            .. versionadded:: 2.6
+
+        :param int reverse_precision:
+            See :attr:`geopy.geocoders.options.default_reverse_precision`.
+
+            .. versionadded:: 2.6
         """
         super().__init__(
             scheme=scheme,
@@ -96,6 +109,8 @@ class Nominatim(Geocoder):
             user_agent=user_agent,
             ssl_context=ssl_context,
             adapter_factory=adapter_factory,
+            cache=cache,
+            reverse_precision=reverse_precision,
         )
 
         self.domain = domain.strip('/')
@@ -347,7 +362,7 @@ class Nominatim(Geocoder):
 
         """
         try:
-            lat, lon = self._coerce_point_to_string(query).split(',')
+            lat, lon = self._coerce_reverse_query_to_string(query).split(',')
         except ValueError:
             raise ValueError("Must be a coordinate pair or Point")
         params = {
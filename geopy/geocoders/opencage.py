@@ -33,7 +33,9 @@ class OpenCage(Geocoder):
             proxies=DEFAULT_SENTINEL,
             user_agent=None,
             ssl_context=DEFAULT_SENTINEL,
-            adapter_factory=None
+            adapter_factory=None,
+            cache=DEFAULT_SENTINEL,
+            reverse_precision=DEFAULT_SENTINEL
     ):
         """
 
@@ -64,6 +66,17 @@ class OpenCage(Geocoder):
             See :attr:`geopy.geocoders.options.default_adapter_factory`.
 
             .. versionadded:: 2.0
+
+        :type cache: :class:`geopy.cache.BaseCache`
+        :param cache:
+            See :attr:`geopy.geocoders.options.default_cache`.
+
+            .. versionadded:: 2.6
+
+        :param int reverse_precision:
+            See :attr:`geopy.geocoders.options.default_reverse_precision`.
+
+            .. versionadded:: 2.6
         """
         super().__init__(
             scheme=scheme,
@@ -72,6 +85,8 @@ class OpenCage(Geocoder):
             user_agent=user_agent,
             ssl_context=ssl_context,
             adapter_factory=adapter_factory,
+            cache=cache,
+            reverse_precision=reverse_precision,
         )
 
         self.api_key = api_key
@@ -192,7 +207,7 @@ class OpenCage(Geocoder):
 
         params = {
             'key': self.api_key,
-            'q': self._coerce_point_to_string(query),
+            'q': self._coerce_reverse_query_to_string(query),
         }
         if language:
             params['language'] = language
@@ -28,7 +28,8 @@ class LiveAddress(Geocoder):
             proxies=DEFAULT_SENTINEL,
             user_agent=None,
             ssl_context=DEFAULT_SENTINEL,
-            adapter_factory=None
+            adapter_factory=None,
+            cache=DEFAULT_SENTINEL
     ):
         """
 
@@ -53,6 +54,12 @@ class LiveAddress(Geocoder):
             See :attr:`geopy.geocoders.options.default_adapter_factory`.
 
             .. versionadded:: 2.0
+
+        :type cache: :class:`geopy.cache.BaseCache`
+        :param cache:
+            See :attr:`geopy.geocoders.options.default_cache`.
+
+            .. versionadded:: 2.6
         """
         super().__init__(
             scheme='https',
@@ -61,6 +68,7 @@ class LiveAddress(Geocoder):
             user_agent=user_agent,
             ssl_context=ssl_context,
             adapter_factory=adapter_factory,
+            cache=cache,
         )
         self.auth_id = auth_id
         self.auth_token = auth_token
@@ -43,6 +43,8 @@ class What3Words(Geocoder):
             user_agent=None,
             ssl_context=DEFAULT_SENTINEL,
             adapter_factory=None,
+            cache=DEFAULT_SENTINEL,
+            reverse_precision=DEFAULT_SENTINEL,
             domain='api.what3words.com',
     ):
         """
@@ -68,6 +70,17 @@ class What3Words(Geocoder):
 
             .. versionadded:: 2.0
 
+        :type cache: :class:`geopy.cache.BaseCache`
+        :param cache:
+            See :attr:`geopy.geocoders.options.default_cache`.
+
+            .. versionadded:: 2.6
+
+        :param int reverse_precision:
+            See :attr:`geopy.geocoders.options.default_reverse_precision`.
+
+            .. versionadded:: 2.6
+
         :param str domain: base api domain
 
             .. versionadded:: 2.4
@@ -79,6 +92,8 @@ class What3Words(Geocoder):
             user_agent=user_agent,
             ssl_context=ssl_context,
             adapter_factory=adapter_factory,
+            cache=cache,
+            reverse_precision=reverse_precision,
         )
 
         self.api_key = api_key
@@ -210,7 +225,7 @@ class What3Words(Geocoder):
         lang = lang.lower()
 
         params = {
-            'coords': self._coerce_point_to_string(query),
+            'coords': self._coerce_reverse_query_to_string(query),
             'lang': lang.lower(),
             'key': self.api_key,
         }
@@ -249,6 +264,8 @@ class What3WordsV3(Geocoder):
             user_agent=None,
             ssl_context=DEFAULT_SENTINEL,
             adapter_factory=None,
+            cache=DEFAULT_SENTINEL,
+            reverse_precision=DEFAULT_SENTINEL,
             domain='api.what3words.com',
     ):
         """
@@ -272,6 +289,17 @@ class What3WordsV3(Geocoder):
         :param callable adapter_factory:
             See :attr:`geopy.geocoders.options.default_adapter_factory`.
 
+        :type cache: :class:`geopy.cache.BaseCache`
+        :param cache:
+            See :attr:`geopy.geocoders.options.default_cache`.
+
+            .. versionadded:: 2.6
+
+        :param int reverse_precision:
+            See :attr:`geopy.geocoders.options.default_reverse_precision`.
+
+            .. versionadded:: 2.6
+
         :param str domain: base api domain
 
             .. versionadded:: 2.4
@@ -283,6 +311,8 @@ class What3WordsV3(Geocoder):
             user_agent=user_agent,
             ssl_context=ssl_context,
             adapter_factory=adapter_factory,
+            cache=cache,
+            reverse_precision=reverse_precision,
         )
 
         self.api_key = api_key
@@ -410,7 +440,7 @@ class What3WordsV3(Geocoder):
         lang = lang.lower()
 
         params = {
-            'coordinates': self._coerce_point_to_string(query),
+            'coordinates': self._coerce_reverse_query_to_string(query),
             'language': lang.lower(),
             'key': self.api_key,
         }
@@ -32,6 +32,8 @@ class Woosmap(Geocoder):
         user_agent=None,
         ssl_context=DEFAULT_SENTINEL,
         adapter_factory=None,
+        cache=DEFAULT_SENTINEL,
+        reverse_precision=DEFAULT_SENTINEL,
     ):
         """
 
@@ -64,6 +66,17 @@ class Woosmap(Geocoder):
         :param callable adapter_factory:
             See :attr:`geopy.geocoders.options.default_adapter_factory`.
 
+        :type cache: :class:`geopy.cache.BaseCache`
+        :param cache:
+            See :attr:`geopy.geocoders.options.default_cache`.
+
+            .. versionadded:: 2.6
+
+        :param int reverse_precision:
+            See :attr:`geopy.geocoders.options.default_reverse_precision`.
+
+            .. versionadded:: 2.6
+
         """
         super().__init__(
             scheme=scheme,
@@ -72,6 +85,8 @@ class Woosmap(Geocoder):
             user_agent=user_agent,
             ssl_context=ssl_context,
             adapter_factory=adapter_factory,
+            cache=cache,
+            reverse_precision=reverse_precision,
         )
         self.api_key = api_key
         self.domain = domain.strip('/')
@@ -216,7 +231,9 @@ class Woosmap(Geocoder):
             ``exactly_one=False``.
         """
 
-        latlng = self._coerce_point_to_string(query, output_format="%(lat)s,%(lon)s")
+        latlng = self._coerce_reverse_query_to_string(
+            query, output_format="%(lat)s,%(lon)s"
+        )
         params = {
             'latlng': latlng,
             'private_key': self.api_key,
@@ -28,6 +28,8 @@ class Yandex(Geocoder):
             scheme=None,
             ssl_context=DEFAULT_SENTINEL,
             adapter_factory=None,
+            cache=DEFAULT_SENTINEL,
+            reverse_precision=DEFAULT_SENTINEL,
             domain='geocode-maps.yandex.ru',
     ):
         """
@@ -56,6 +58,17 @@ class Yandex(Geocoder):
 
             .. versionadded:: 2.0
 
+        :type cache: :class:`geopy.cache.BaseCache`
+        :param cache:
+            See :attr:`geopy.geocoders.options.default_cache`.
+
+            .. versionadded:: 2.6
+
+        :param int reverse_precision:
+            See :attr:`geopy.geocoders.options.default_reverse_precision`.
+
+            .. versionadded:: 2.6
+
         :param str domain: base api domain
 
             .. versionadded:: 2.4
@@ -67,6 +80,8 @@ class Yandex(Geocoder):
             user_agent=user_agent,
             ssl_context=ssl_context,
             adapter_factory=adapter_factory,
+            cache=cache,
+            reverse_precision=reverse_precision,
         )
         self.api_key = api_key
         self.api = '%s://%s%s' % (self.scheme, domain, self.api_path)
@@ -162,7 +177,7 @@ class Yandex(Geocoder):
         """
 
         try:
-            point = self._coerce_point_to_string(query, "%(lon)s,%(lat)s")
+            point = self._coerce_reverse_query_to_string(query, "%(lon)s,%(lat)s")
         except ValueError:
             raise ValueError("Must be a coordinate pair or Point")
         params = {
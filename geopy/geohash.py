@@ -0,0 +1,354 @@
+"""
+`Geohash <https://en.wikipedia.org/wiki/Geohash>`_ encoding and decoding
+of :class:`geopy.point.Point` instances.
+
+A geohash is a short string identifying a rectangular cell of the
+latitude/longitude grid. Each additional character subdivides the cell
+into 32 smaller ones, so points sharing a prefix are located in the
+same cell, which makes geohashes handy for sharding, cache keys and
+coarse proximity lookups::
+
+    >>> from geopy import geohash
+    >>> geohash.encode((57.64911, 10.40744), precision=11)
+    'u4pruydqqvj'
+    >>> geohash.decode('u4pruydqqvj')
+    Point(57.64911063015461, 10.407439693808556, 0.0)
+    >>> geohash.bounds('u4pr')
+    (Point(57.48046875, 10.1953125, 0.0), Point(57.65625, 10.546875, 0.0))
+    >>> geohash.neighbours('u4pr')['n']
+    'u4r2'
+
+Only :func:`.encode_many` requires numpy.
+
+.. versionadded:: 2.6
+"""
+
+from bisect import bisect_left, bisect_right
+from math import floor
+
+from geopy import util
+from geopy.point import Point, PointArray, _normalize_coordinate_arrays
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+__all__ = (
+    "GeohashIndex",
+    "bounds",
+    "decode",
+    "encode",
+    "encode_many",
+    "neighbours",
+)
+
+BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+_DECODE_MAP = {char: value for value, char in enumerate(BASE32)}
+
+MAX_PRECISION = 12
+
+# (latitude, longitude) steps of the neighbour cells.
+_DIRECTIONS = {
+    'n': (1, 0),
+    'ne': (1, 1),
+    'e': (0, 1),
+    'se': (-1, 1),
+    's': (-1, 0),
+    'sw': (-1, -1),
+    'w': (0, -1),
+    'nw': (1, -1),
+}
+
+
+def _check_precision(precision):
+    if not 1 <= precision <= MAX_PRECISION:
+        raise ValueError(
+            'Geohash precision must be in the [1; %s] range.' % MAX_PRECISION
+        )
+
+
+def _bit_counts(precision):
+    total = precision * 5
+    return (total + 1) // 2, total // 2  # longitude, latitude
+
+
+def _quantize(value, offset, span, bits):
+    # Shared by `encode` (for floats) and `encode_many` (for numpy
+    # arrays), so both produce the very same cells: `floor` of the same
+    # floating point expression, clamped to the same range.
+    cell = (value + offset) / span * float(1 << bits)
+    if np is None or not isinstance(value, np.ndarray):
+        return min(max(floor(cell), 0), (1 << bits) - 1)
+    return np.clip(np.floor(cell), 0, (1 << bits) - 1).astype(np.uint64)
+
+
+def _interleave(lon_cell, lat_cell, precision):
+    lon_bits, lat_bits = _bit_counts(precision)
+    code = 0
+    for i in range(precision * 5):
+        if i % 2 == 0:
+            lon_bits -= 1
+            bit = (lon_cell >> lon_bits) & 1
+        else:
+            lat_bits -= 1
+            bit = (lat_cell >> lat_bits) & 1
+        code = (code << 1) | bit
+    return code
+
+
+def _to_string(code, precision):
+    return ''.join(
+        BASE32[(code >> (5 * i)) & 31] for i in reversed(range(precision))
+    )
+
+
+def _to_cells(geohash):
+    """
+    Convert a geohash to ``(lon_cell, lat_cell, precision)``.
+    """
+    if not isinstance(geohash, str):
+        raise TypeError('Geohash must be a string, got %r.' % (geohash,))
+    geohash = geohash.lower()
+    _check_precision(len(geohash))
+    lon_cell = lat_cell = 0
+    is_lon = True
+    for char in geohash:
+        try:
+            value = _DECODE_MAP[char]
+        except KeyError:
+            raise ValueError('Invalid geohash %r.' % geohash)
+        for shift in range(4, -1, -1):
+            bit = (value >> shift) & 1
+            if is_lon:
+                lon_cell = (lon_cell << 1) | bit
+            else:
+                lat_cell = (lat_cell << 1) | bit
+            is_lon = not is_lon
+    return lon_cell, lat_cell, len(geohash)
+
+
+def _from_cells(lon_cell, lat_cell, precision):
+    return _to_string(_interleave(lon_cell, lat_cell, precision), precision)
+
+
+def encode(point, precision=12):
+    """
+    Encode a point to a geohash.
+
+    :param point: The point to encode.
+    :type point: :class:`geopy.point.Point`, list or tuple of ``(latitude,
+        longitude)``, or string as ``"%(latitude)s, %(longitude)s"``.
+
+    :param int precision: Length of the geohash, from 1 to 12.
+        The 12-character cells are a few centimeters wide.
+
+    :rtype: str
+    """
+    _check_precision(precision)
+    point = Point(point)
+    lon_bits, lat_bits = _bit_counts(precision)
+    lon_cell = _quantize(point.longitude, 180.0, 360.0, lon_bits)
+    lat_cell = _quantize(point.latitude, 90.0, 180.0, lat_bits)
+    return _from_cells(lon_cell, lat_cell, precision)
+
+
+def encode_many(latitudes, longitudes, precision=12):
+    """
+    Vectorized :func:`.encode`. Requires numpy.
+
+    The coordinates are validated and normalized like
+    :class:`geopy.point.Point` does::
+
+        >>> from geopy.geohash import encode_many
+        >>> encode_many([57.64911, -41.32], [10.40744, 174.81], precision=6)
+        array(['u4pruy', 'rbskcv'], dtype='<U6')
+
+    :param latitudes: Latitudes of the points.
+    :type latitudes: numpy array, sequence or any object supporting
+        the buffer protocol.
+
+    :param longitudes: Longitudes of the points.
+
+    :param int precision: Length of the geohashes, from 1 to 12.
+
+    :return: Geohashes, shaped as the broadcast inputs.
+    :rtype: numpy array of strings
+    """
+    util.ensure_numpy_is_installed()
+    _check_precision(precision)
+    latitudes, longitudes, _ = _normalize_coordinate_arrays(latitudes, longitudes)
+    lon_bits, lat_bits = _bit_counts(precision)
+    lon_cells = _quantize(longitudes, 180.0, 360.0, lon_bits)
+    lat_cells = _quantize(latitudes, 90.0, 180.0, lat_bits)
+
+    code = np.zeros(latitudes.shape, dtype=np.uint64)
+    one = np.uint64(1)
+    for i in range(precision * 5):
+        if i % 2 == 0:
+            lon_bits -= 1
+            bit = (lon_cells >> np.uint64(lon_bits)) & one
+        else:
+            lat_bits -= 1
+            bit = (lat_cells >> np.uint64(lat_bits)) & one
+        code = (code << one) | bit
+
+    shifts = np.arange(precision - 1, -1, -1, dtype=np.uint64) * np.uint64(5)
+    digits = (code[..., None] >> shifts) & np.uint64(31)
+    chars = np.array(list(BASE32))[digits.astype(np.intp)]
+    return np.ascontiguousarray(chars).view('<U%d' % precision)[..., 0]
+
+
+def bounds(geohash):
+    """
+    Return the cell of a geohash.
+
+    :param str geohash: The geohash.
+
+    :return: South-west and north-east corners of the cell.
+    :rtype: tuple of two :class:`geopy.point.Point`
+    """
+    lon_cell, lat_cell, precision = _to_cells(geohash)
+    lon_bits, lat_bits = _bit_counts(precision)
+    lat_size = 180.0 / (1 << lat_bits)
+    lon_size = 360.0 / (1 << lon_bits)
+    south = lat_cell * lat_size - 90.0
+    west = lon_cell * lon_size - 180.0
+    return (
+        Point(south, west),
+        Point(south + lat_size, west + lon_size),
+    )
+
+
+def decode(geohash):
+    """
+    Decode a geohash to the center of its cell.
+
+    :param str geohash: The geohash.
+
+    :rtype: :class:`geopy.point.Point`
+    """
+    south_west, north_east = bounds(geohash)
+    return Point(
+        (south_west.latitude + north_east.latitude) / 2,
+        (south_west.longitude + north_east.longitude) / 2,
+    )
+
+
+def neighbours(geohash):
+    """
+    Return geohashes of the 8 cells adjacent to the given one.
+
+    The cells wrap around the antimeridian. The cells adjacent
+    to the poles don't have neighbours beyond them.
+
+    :param str geohash: The geohash.
+
+    :return: A dict with the ``'n'``, ``'ne'``, ``'e'``, ``'se'``,
+        ``'s'``, ``'sw'``, ``'w'`` and ``'nw'`` keys, the keys of
+        the missing polar neighbours are omitted.
+    :rtype: dict
+    """
+    lon_cell, lat_cell, precision = _to_cells(geohash)
+    lon_bits, lat_bits = _bit_counts(precision)
+    result = {}
+    for direction, (lat_step, lon_step) in _DIRECTIONS.items():
+        lat = lat_cell + lat_step
+        if not 0 <= lat < (1 << lat_bits):
+            continue
+        lon = (lon_cell + lon_step) % (1 << lon_bits)
+        result[direction] = _from_cells(lon, lat, precision)
+    return result
+
+
+class GeohashIndex:
+    """
+    Points bucketed by their geohashes.
+
+    The geohashes are kept sorted, so all points of a cell of any
+    precision (up to the one of the index) form a contiguous range,
+    which is found with a binary search::
+
+        >>> from geopy.geohash import GeohashIndex
+        >>> index = GeohashIndex([(57.64911, 10.40744), (57.6, 10.5),
+        ...                       (-41.32, 174.81)])
+        >>> index.cell('u4pr')
+        [0, 1]
+        >>> index.nearby((57.7, 10.4), precision=4)
+        [0, 1]
+
+    .. versionadded:: 2.6
+    """
+
+    def __init__(self, points, precision=12):
+        """
+        :param points: Indexed points: an iterable of anything accepted
+            by :class:`geopy.point.Point`, or a numpy array of ``(n, 2)``
+            or ``(n, 3)`` shape of ``(latitude, longitude[, altitude])``
+            rows or a :class:`geopy.point.PointArray`, which are encoded
+            with :func:`.encode_many`.
+
+        :param int precision: Length of the stored geohashes.
+        """
+        _check_precision(precision)
+        self.precision = precision
+        if isinstance(points, PointArray):
+            points = points.coordinates
+        if np is not None and isinstance(points, np.ndarray):
+            hashes = encode_many(points[:, 0], points[:, 1], precision).tolist()
+        else:
+            hashes = [encode(point, precision) for point in points]
+        order = sorted(range(len(hashes)), key=hashes.__getitem__)
+        self._hashes = [hashes[i] for i in order]
+        self._indices = order
+
+    def __len__(self):
+        return len(self._hashes)
+
+    def cell(self, geohash):
+        """
+        Find the points located in a cell.
+
+        :param str geohash: Geohash of the cell, not longer than
+            the precision of the index.
+
+        :return: Indices of the points (positions in the list passed
+            to the constructor), in the order of their geohashes.
+        :rtype: list of int
+        """
+        geohash = geohash.lower()
+        if len(geohash) > self.precision:
+            raise ValueError(
+                'Geohash %r is longer than the precision of the index (%s).'
+                % (geohash, self.precision)
+            )
+        start = bisect_left(self._hashes, geohash)
+        # '~' sorts after any of the geohash characters.
+        end = bisect_right(self._hashes, geohash + '~', lo=start)
+        return self._indices[start:end]
+
+    def nearby(self, point, precision):
+        """
+        Find the points located in the cell containing ``point`` and in
+        the 8 cells adjacent to it. This is a coarse proximity filter.
+
+        Every returned point lies within the 3x3 block of cells around
+        ``point``, so it's at most about two cell sizes away from it
+        (in latitude and in longitude, measured in the cell's height
+        and width respectively). The points nearer than one cell size
+        are always included, except across the poles, where no
+        neighbour cells are generated.
+
+        :param point: The query point.
+        :type point: :class:`geopy.point.Point`, list or tuple of ``(latitude,
+            longitude)``, or string as ``"%(latitude)s, %(longitude)s"``.
+
+        :param int precision: Precision of the cells to look in.
+
+        :rtype: list of int
+        """
+        geohash = encode(point, precision)
+        result = self.cell(geohash)
+        for neighbour in neighbours(geohash).values():
+            result.extend(self.cell(neighbour))
+        return result
@@ -0,0 +1,471 @@
+"""
+:class:`.SpatialIndex` answers nearest-neighbour and radius queries
+over a fixed set of points without measuring the distance to each
+of them.
+
+The points are placed on a unit sphere (as earth-centered, earth-fixed
+unit vectors) and organized in a k-d tree. Straight-line (chord) distances
+between the unit vectors bound the distances on the earth surface
+from both sides, so the tree cheaply narrows down the candidates, and
+only those are then measured with the chosen :mod:`geopy.distance`
+algorithm. Thus the results are the same as the ones of a brute-force
+scan with that algorithm.
+
+Requires numpy.
+"""
+
+import heapq
+from math import pi, sin
+
+from geopy import util
+from geopy.distance import (
+    Distance,
+    _ensure_same_altitude_sets,
+    _get_distance_instance,
+    _points_to_arrays,
+    geodesic,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+__all__ = (
+    "SpatialIndex",
+    "assign",
+)
+
+# Absolute slack added to the chord bounds to make them robust
+# to the floating point rounding errors.
+_CHORD_EPSILON = 1e-12
+
+
+def _to_unit_vectors(latitudes, longitudes):
+    lat = np.radians(latitudes)
+    lon = np.radians(longitudes)
+    cos_lat = np.cos(lat)
+    return np.stack(
+        [cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)], axis=-1
+    )
+
+
+def _angle_to_chord(angle):
+    return 2 * sin(min(angle, pi) / 2)
+
+
+def _scale_chords(chords, factor):
+    # Vectorized chords of the central angles `factor` times larger
+    # than the angles of `chords`, with the rounding slack added.
+    angles = 2 * np.arcsin(np.minimum(chords / 2, 1)) * factor
+    return 2 * np.sin(np.minimum(angles, pi) / 2) + _CHORD_EPSILON
+
+
+def _kth_per_row(rows, values, n, k):
+    """
+    The k-th smallest of ``values`` for each of ``range(n)`` rows,
+    where ``rows`` (sorted) are the rows of the ``values``. Every row
+    must have at least ``k`` values.
+    """
+    counts = np.bincount(rows, minlength=n)
+    columns = np.arange(len(rows)) - (np.cumsum(counts) - counts)[rows]
+    padded = np.full((n, counts.max()), np.inf)
+    padded[rows, columns] = values
+    return np.partition(padded, k - 1, axis=1)[:, k - 1]
+
+
+class SpatialIndex:
+    """
+    A k-d tree over points for :meth:`.nearest` and :meth:`.within`
+    queries::
+
+        >>> from geopy.index import SpatialIndex
+        >>> depots = [(41.49008, -71.312796), (41.499498, -81.695391),
+        ...           (40.7128, -74.006)]
+        >>> index = SpatialIndex(depots)
+        >>> index.nearest((42.3601, -71.0589), k=2)
+        (array([0, 2]), array([ 98.90281957, 306.4904908 ]))
+        >>> index.within((42.3601, -71.0589), 200)
+        (array([0]), array([98.90281957]))
+
+    The returned indices refer to the positions of the points passed
+    to the constructor, the distances are in kilometers.
+
+    .. versionadded:: 2.6
+    """
+
+    def __init__(self, points, method=geodesic, leaf_size=32):
+        """
+        :param points: Indexed points: an iterable of anything accepted
+            by :class:`geopy.point.Point`, a :class:`geopy.point.PointArray`,
+            or a numpy array of ``(n, 2)`` or ``(n, 3)`` shape of
+            ``(latitude, longitude[, altitude])`` rows. As with other
+            distances, all points must have the same altitude
+            (see :ref:`distance_altitudes`).
+
+        :param method: Distance algorithm used to measure the final
+            distances: either a :class:`geopy.distance.Distance` subclass,
+            such as :class:`geopy.distance.geodesic` or
+            :class:`geopy.distance.great_circle`, or its instance.
+            Approximate distances, such as
+            :class:`geopy.distance.equirectangular`, are not supported.
+
+        :param int leaf_size: Maximum number of points in a leaf
+            node of the tree.
+        """
+        util.ensure_numpy_is_installed()
+        if leaf_size < 1:
+            raise ValueError('leaf_size must be a positive integer.')
+        self.method = _get_distance_instance(method)
+        bounds = self.method._radian_bounds()
+        if bounds is None:
+            raise TypeError(
+                'Approximate distance %s cannot be used in SpatialIndex.'
+                % type(self.method).__name__
+            )
+        self._min_radius, self._max_radius = bounds
+        self._leaf_size = leaf_size
+
+        latitudes, longitudes, altitudes = _points_to_arrays(points)
+        self.latitudes = np.ascontiguousarray(latitudes)
+        self.longitudes = np.ascontiguousarray(longitudes)
+        self._altitudes = altitudes
+        self._vectors = _to_unit_vectors(self.latitudes, self.longitudes)
+
+        # Nodes of the tree, the root is the node 0. Points of a node
+        # are `self._order[start:end]`.
+        self._order = np.arange(len(self.latitudes))
+        self._starts, self._ends = [], []
+        self._children = []  # (left, right) or None for leaves
+        self._box_lo, self._box_hi = [], []
+        self._build(0, len(self._order))
+        self._box_lo = np.array(self._box_lo).reshape(-1, 3)
+        self._box_hi = np.array(self._box_hi).reshape(-1, 3)
+
+        leaves = np.array([
+            node for node, children in enumerate(self._children)
+            if children is None and self._ends[node] > self._starts[node]
+        ], dtype=np.intp)
+        self._leaf_starts = np.array(self._starts, dtype=np.intp)[leaves]
+        self._leaf_ends = np.array(self._ends, dtype=np.intp)[leaves]
+        self._leaf_lo, self._leaf_hi = self._box_lo[leaves], self._box_hi[leaves]
+
+    def __len__(self):
+        return len(self._order)
+
+    def _build(self, start, end):
+        node = len(self._starts)
+        self._starts.append(start)
+        self._ends.append(end)
+        self._children.append(None)
+        vectors = self._vectors[self._order[start:end]]
+        if end > start:
+            lo, hi = vectors.min(axis=0), vectors.max(axis=0)
+        else:
+            lo = hi = np.zeros(3)
+        self._box_lo.append(lo)
+        self._box_hi.append(hi)
+
+        if end - start > self._leaf_size:
+            axis = int(np.argmax(hi - lo))
+            middle = (end - start) // 2
+            part = np.argpartition(vectors[:, axis], middle)
+            self._order[start:end] = self._order[start:end][part]
+            left = self._build(start, start + middle)
+            right = self._build(start + middle, end)
+            self._children[node] = (left, right)
+        return node
+
+    def _box_distance(self, node, vector):
+        gap = np.maximum(
+            np.maximum(self._box_lo[node] - vector, vector - self._box_hi[node]), 0
+        )
+        return float(np.sqrt(gap @ gap))
+
+    def _chord_candidates(self, vector, chord):
+        """
+        Indices of the points within ``chord`` from the unit ``vector``.
+        """
+        if not len(self):
+            return self._order[:0]
+        slices = []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            if self._box_distance(node, vector) > chord:
+                continue
+            children = self._children[node]
+            if children is None:
+                slices.append(self._order[self._starts[node]:self._ends[node]])
+            else:
+                stack.extend(children)
+        if not slices:
+            return self._order[:0]
+        candidates = np.concatenate(slices)
+        diff = self._vectors[candidates] - vector
+        chords = np.sqrt(np.einsum('ij,ij->i', diff, diff))
+        return candidates[chords <= chord]
+
+    def _chord_nearest(self, vector, k):
+        """
+        Indices of the ``k`` points nearest to the unit ``vector``
+        by the chord distance.
+        """
+        best = self._order[:0]
+        best_chords = np.empty(0)
+        heap = [(0.0, 0)]
+        while heap:
+            box_distance, node = heapq.heappop(heap)
+            if len(best) == k and box_distance > best_chords.max():
+                break
+            children = self._children[node]
+            if children is not None:
+                for child in children:
+                    heapq.heappush(heap, (self._box_distance(child, vector), child))
+                continue
+            leaf = self._order[self._starts[node]:self._ends[node]]
+            diff = self._vectors[leaf] - vector
+            best = np.concatenate([best, leaf])
+            best_chords = np.concatenate(
+                [best_chords, np.sqrt(np.einsum('ij,ij->i', diff, diff))]
+            )
+            if len(best) > k:
+                keep = np.argpartition(best_chords, k - 1)[:k]
+                best, best_chords = best[keep], best_chords[keep]
+        return best
+
+    def _prepare_query(self, point):
+        latitudes, longitudes, altitudes = _points_to_arrays([point])
+        _ensure_same_altitude_sets(self._altitudes, altitudes)
+        return (
+            latitudes[0], longitudes[0],
+            _to_unit_vectors(latitudes, longitudes)[0],
+        )
+
+    def _measure(self, latitude, longitude, candidates):
+        lat2, lon2 = self.latitudes[candidates], self.longitudes[candidates]
+        lat1, lon1 = np.full_like(lat2, latitude), np.full_like(lon2, longitude)
+        return self.method._measure_arrays(lat1, lon1, lat2, lon2)
+
+    def _refine(self, latitude, longitude, vector, radius):
+        """
+        Candidates within ``radius`` km and their exact distances,
+        sorted by the distance (and then by the index).
+        """
+        angle = radius / self._min_radius
+        chord = _angle_to_chord(angle) + _CHORD_EPSILON
+        candidates = self._chord_candidates(vector, chord)
+        distances = self._measure(latitude, longitude, candidates)
+        order = np.lexsort((candidates, distances))
+        return candidates[order], distances[order]
+
+    def nearest(self, point, k=1):
+        """
+        Find the ``k`` points nearest to ``point``.
+
+        :param point: The query point.
+        :type point: :class:`geopy.point.Point`, list or tuple of ``(latitude,
+            longitude)``, or string as ``"%(latitude)s, %(longitude)s"``.
+
+        :param int k: Number of the points to find. Fewer points
+            are returned if the index is smaller than that.
+
+        :return: Indices of the nearest points and the distances
+            to them in kilometers, sorted by the distance.
+        :rtype: tuple of two numpy arrays
+        """
+        if k < 1:
+            raise ValueError('k must be a positive integer.')
+        latitude, longitude, vector = self._prepare_query(point)
+        k = min(k, len(self))
+        if not k:
+            return self._order[:0], np.empty(0)
+        candidates = self._chord_nearest(vector, k)
+        # Any of the true k nearest points is not farther than the
+        # farthest of these candidates, so search within that radius.
+        radius = self._measure(latitude, longitude, candidates).max()
+        indices, distances = self._refine(latitude, longitude, vector, radius)
+        return indices[:k], distances[:k]
+
+    def nearest_many(self, points, k=1, chunk_size=4096):
+        """
+        Find the ``k`` points nearest to each of many query points,
+        e.g. to assign customers to their nearest depots.
+
+        The queries are processed in vectorized chunks: the leaves of
+        the tree which cannot contain any of the ``k`` nearest points are
+        ruled out by their bounding boxes, and the chord distances to
+        the points of the remaining leaves narrow the candidates down
+        to just a few more than ``k`` per query before they are measured.
+        The results are the same as of :meth:`.nearest` for each query::
+
+            >>> from geopy.index import SpatialIndex
+            >>> depots = [(41.49008, -71.312796), (41.499498, -81.695391),
+            ...           (40.7128, -74.006)]
+            >>> index = SpatialIndex(depots)
+            >>> customers = [(42.3601, -71.0589), (39.9526, -75.1652)]
+            >>> indices, distances = index.nearest_many(customers, k=2)
+            >>> indices
+            array([[0, 2],
+                   [2, 0]])
+
+        .. versionadded:: 2.6
+
+        :param points: The query points: an iterable of anything
+            accepted by :class:`geopy.point.Point`,
+            a :class:`geopy.point.PointArray`, or a numpy array
+            of ``(n, 2)`` or ``(n, 3)`` shape.
+
+        :param int k: Number of the points to find for each query.
+            Fewer points are returned if the index is smaller than that.
+
+        :param int chunk_size: Number of the queries processed at once.
+            The memory used is proportional to it times the number
+            of the leaves in the tree.
+
+        :return: Indices of the nearest points and the distances
+            to them in kilometers, both of ``(n, k)`` shape, with
+            the rows sorted by the distance.
+        :rtype: tuple of two numpy arrays
+        """
+        if k < 1:
+            raise ValueError('k must be a positive integer.')
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be a positive integer.')
+        latitudes, longitudes, altitudes = _points_to_arrays(points)
+        _ensure_same_altitude_sets(self._altitudes, altitudes)
+        k = min(k, len(self))
+        indices = np.empty((len(latitudes), k), dtype=np.intp)
+        distances = np.empty((len(latitudes), k), dtype=np.float64)
+        if not k:
+            return indices, distances
+        vectors = _to_unit_vectors(latitudes, longitudes)
+        for start in range(0, len(latitudes), chunk_size):
+            chunk = slice(start, start + chunk_size)
+            indices[chunk], distances[chunk] = self._nearest_chunk(
+                latitudes[chunk], longitudes[chunk], vectors[chunk], k
+            )
+        return indices, distances
+
+    def _nearest_chunk(self, latitudes, longitudes, vectors, k):
+        n = len(vectors)
+        # The ratio of the central angles of two points which is
+        # enough for the farther point to be nearer by `self.method`.
+        factor = self._max_radius / self._min_radius
+
+        # The bounds of the chords from each query to the leaf boxes.
+        queries = vectors[:, None, :]
+        gap = np.maximum(
+            np.maximum(self._leaf_lo - queries, queries - self._leaf_hi), 0
+        )
+        lower = np.sqrt(np.einsum('ijk,ijk->ij', gap, gap))
+        far = np.maximum(np.abs(queries - self._leaf_lo),
+                         np.abs(queries - self._leaf_hi))
+        upper = np.sqrt(np.einsum('ijk,ijk->ij', far, far))
+
+        # The leaves nearest by `upper` which hold at least k points
+        # give an upper bound of the k-th nearest chord.
+        order = np.argsort(upper, axis=1)
+        sizes = (self._leaf_ends - self._leaf_starts)[order]
+        enough = np.argmax(np.cumsum(sizes, axis=1) >= k, axis=1)
+        nearest_leaves = np.zeros(upper.shape, dtype=bool)
+        np.put_along_axis(
+            nearest_leaves, order,
+            np.arange(upper.shape[1]) <= enough[:, None], axis=1,
+        )
+        query_rows, _, chords = self._leaf_points(vectors, nearest_leaves)
+        bound = _scale_chords(_kth_per_row(query_rows, chords, n, k), factor)
+
+        # Any of the k nearest points by `self.method` is within
+        # the scaled k-th nearest chord.
+        query_rows, candidates, chords = self._leaf_points(
+            vectors, lower <= bound[:, None]
+        )
+        kth = _kth_per_row(query_rows, chords, n, k)
+        keep = chords <= _scale_chords(kth, factor)[query_rows]
+        query_rows, candidates = query_rows[keep], candidates[keep]
+
+        distances = self.method._measure_arrays(
+            latitudes[query_rows], longitudes[query_rows],
+            self.latitudes[candidates], self.longitudes[candidates],
+        )
+        order = np.lexsort((candidates, distances, query_rows))
+        take = np.searchsorted(query_rows[order], np.arange(n))[:, None] + np.arange(k)
+        return candidates[order][take], distances[order][take]
+
+    def _leaf_points(self, vectors, mask):
+        """
+        All points of the leaves selected by ``mask`` (of
+        ``(len(vectors), number of leaves)`` shape) as the rows
+        of ``vectors``, the indices of the points and the chords
+        between them.
+        """
+        query_rows, leaves = np.nonzero(mask)
+        starts = self._leaf_starts[leaves]
+        lengths = self._leaf_ends[leaves] - starts
+        offsets = np.cumsum(lengths) - lengths
+        positions = (np.repeat(starts - offsets, lengths) +
+                     np.arange(lengths.sum()))
+        query_rows = np.repeat(query_rows, lengths)
+        candidates = self._order[positions]
+        diff = self._vectors[candidates] - vectors[query_rows]
+        return query_rows, candidates, np.sqrt(np.einsum('ij,ij->i', diff, diff))
+
+    def within(self, point, radius):
+        """
+        Find all points within ``radius`` from ``point`` (inclusive).
+
+        :param point: The query point.
+        :type point: :class:`geopy.point.Point`, list or tuple of ``(latitude,
+            longitude)``, or string as ``"%(latitude)s, %(longitude)s"``.
+
+        :param radius: Search radius in kilometers.
+        :type radius: float or :class:`geopy.distance.Distance`
+
+        :return: Indices of the found points and the distances
+            to them in kilometers, sorted by the distance.
+        :rtype: tuple of two numpy arrays
+        """
+        if isinstance(radius, Distance):
+            radius = radius.kilometers
+        if radius < 0:
+            raise ValueError('radius must not be negative.')
+        latitude, longitude, vector = self._prepare_query(point)
+        indices, distances = self._refine(latitude, longitude, vector, radius)
+        mask = distances <= radius
+        return indices[mask], distances[mask]
+
+
+def assign(points, facilities, k=1, method=geodesic, chunk_size=4096):
+    """
+    Assign each of ``points`` to the nearest of ``facilities`` (or to
+    the ``k`` nearest ones), e.g. customers to depots. A shortcut for
+    building a :class:`.SpatialIndex` over ``facilities`` and calling
+    :meth:`.SpatialIndex.nearest_many`::
+
+        >>> from geopy.index import assign
+        >>> depots = [(41.49008, -71.312796), (41.499498, -81.695391)]
+        >>> customers = [(42.3601, -71.0589), (41.8781, -87.6298)]
+        >>> indices, distances = assign(customers, depots)
+        >>> indices[:, 0]
+        array([0, 1])
+
+    .. versionadded:: 2.6
+
+    :param points: The points to assign, see
+        :meth:`.SpatialIndex.nearest_many`.
+
+    :param facilities: The points to assign to, see :class:`.SpatialIndex`.
+
+    :param int k: Number of the nearest facilities for each point.
+
+    :param method: Distance algorithm, see :class:`.SpatialIndex`.
+
+    :param int chunk_size: See :meth:`.SpatialIndex.nearest_many`.
+
+    :return: Indices of the nearest facilities and the distances
+        to them in kilometers, both of ``(len(points), k)`` shape.
+    :rtype: tuple of two numpy arrays
+    """
+    index = SpatialIndex(facilities, method=method)
+    return index.nearest_many(points, k=k, chunk_size=chunk_size)
@@ -1,7 +1,8 @@
 """
-:class:`.Point` data structure.
+:class:`.Point` and :class:`.PointArray` data structures.
 """
 
+import array
 import collections.abc
 import re
 import warnings
@@ -11,8 +12,13 @@ from math import fmod, isfinite
 from geopy import units, util
 from geopy.format import DEGREE, DOUBLE_PRIME, PRIME, format_degrees, format_distance
 
-POINT_PATTERN = re.compile(r"""
-    .*?
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Latitude, longitude and optional altitude, till the end of the string.
+_POINT_BODY = r"""
     (?P<latitude>
       (?P<latitude_direction_front>[NS])?[ ]*
         (?P<latitude_degrees>[+-]?%(FLOAT)s)(?:[%(DEGREE)sD\*\u00B0\s][ ]*
@@ -37,7 +43,32 @@ POINT_PATTERN = re.compile(r"""
     "PRIME": PRIME,
     "DOUBLE_PRIME": DOUBLE_PRIME,
     "SEP": r'\s*[,;/\s]\s*',
-}, re.VERBOSE | re.UNICODE)
+}
+
+POINT_PATTERN = re.compile(r".*?" + _POINT_BODY, re.VERBOSE | re.UNICODE)
+
+# The same without the leading `.*?`, see `_parse_point_string`.
+_POINT_BODY_PATTERN = re.compile(_POINT_BODY, re.VERBOSE | re.UNICODE)
+
+# A string of two decimal degrees, which is parsed by `POINT_PATTERN`
+# into the same values.
+_DECIMAL_POINT_PATTERN = re.compile(
+    r'[ ]*([+-]?\d+(?:\.\d+)?)(?:\s*[,;/]\s*|\s+)([+-]?\d+(?:\.\d+)?)\s*'
+)
+
+# Positions where `_POINT_BODY_PATTERN` might start to match.
+_POINT_BODY_START = re.compile(r'[NS+-]|\d+')
+
+_WHITESPACE_RUN = re.compile(r'\s\s+')
+
+_ALTITUDE_CONVERTERS = {
+    'km': lambda d: d,
+    'm': lambda d: units.kilometers(meters=d),
+    'mi': lambda d: units.kilometers(miles=d),
+    'ft': lambda d: units.kilometers(feet=d),
+    'nm': lambda d: units.kilometers(nautical=d),
+    'nmi': lambda d: units.kilometers(nautical=d)
+}
 
 
 def _normalize_angle(x, limit):
@@ -81,6 +112,139 @@ def _normalize_coordinates(latitude, longitude, altitude):
     return latitude, longitude, altitude
 
 
+def _normalize_angle_array(x, limit):
+    """
+    Vectorized :func:`_normalize_angle`.
+    """
+    double_limit = limit * 2.0
+    modulo = np.fmod(x, double_limit) + 0.0  # `+ 0` is to turn -0 to +0.
+    modulo = np.where(modulo < -limit, modulo + double_limit, modulo)
+    return np.where(modulo >= limit, modulo - double_limit, modulo)
+
+
+def _normalize_coordinate_arrays(latitude, longitude, altitude=None):
+    """
+    Vectorized :func:`_normalize_coordinates`: validate and normalize
+    arrays of coordinates in a single pass.
+
+    The arguments are broadcast against each other. The resulting
+    float64 arrays might share memory with the inputs, so they must
+    be treated as read-only.
+    """
+    util.ensure_numpy_is_installed()
+    if altitude is None:
+        altitude = 0.0
+    latitude, longitude, altitude = np.broadcast_arrays(
+        np.asarray(latitude, dtype=np.float64),
+        np.asarray(longitude, dtype=np.float64),
+        np.asarray(altitude, dtype=np.float64),
+    )
+
+    is_finite = (
+        np.isfinite(latitude) & np.isfinite(longitude) & np.isfinite(altitude)
+    )
+    if not is_finite.all():
+        i = np.flatnonzero(~is_finite.ravel())[0]
+        bad = (latitude.flat[i], longitude.flat[i], altitude.flat[i])
+        raise ValueError('Point coordinates must be finite. %r has been passed '
+                         'as coordinates.' % (tuple(map(float, bad)),))
+
+    if (np.abs(latitude) > 90).any():
+        warnings.warn('Latitude normalization has been prohibited in the newer '
+                      'versions of geopy, because the normalized value happened '
+                      'to be on a different pole, which is probably not what was '
+                      'meant. If you pass coordinates as positional args, '
+                      'please make sure that the order is '
+                      '(latitude, longitude) or (y, x) in Cartesian terms.',
+                      UserWarning, stacklevel=3)
+        raise ValueError('Latitude must be in the [-90; 90] range.')
+
+    longitude = np.where(
+        np.abs(longitude) > 180, _normalize_angle_array(longitude, 180.0), longitude
+    )
+
+    return latitude, longitude, altitude
+
+
+def _compress_whitespace(match):
+    # Shorten a whitespace run to at most 2 characters. `POINT_PATTERN`
+    # distinguishes the runs only by their length (one or more), by
+    # whether they consist of spaces (`[ ]*`) either entirely or after
+    # their first character (`[\s][ ]*`), and by whether they contain
+    # a newline (which cannot be skipped by `.*?`), so these properties
+    # are preserved. Long runs make the pattern backtrack exponentially.
+    run = match.group()
+    rest = run[1:]
+    if not rest.strip(' '):
+        return run[0] + ' '
+    return run[0] + ('\n' if '\n' in rest else '\t')
+
+
+def _parse_point_string(string):
+    """
+    Parse a string like :meth:`Point.from_string` does, in linear time
+    and without the string length limit.
+
+    :return: Validated, but not normalized, ``(latitude, longitude,
+        altitude)``.
+    :raises ValueError: if the string cannot be parsed.
+    """
+    if not isinstance(string, str):
+        raise ValueError(
+            "Failed to create Point instance from %r: not a string." % (string,)
+        )
+    if "''" in string:
+        string = string.replace("''", '"')
+
+    match = _DECIMAL_POINT_PATTERN.fullmatch(string)
+    if match:
+        latitude, longitude = float(match.group(1)), float(match.group(2))
+        altitude = 0.0
+    else:
+        string = _WHITESPACE_RUN.sub(_compress_whitespace, string)
+        # `.*?` of `POINT_PATTERN` finds the leftmost position from which
+        # the rest of the pattern matches. Retrying the match from every
+        # position is quadratic, so only the positions where the match
+        # might start are tried, one per run of digits: if the match fails
+        # from the first digit of a run, it fails from the other ones too.
+        end = string.find('\n')
+        if end == -1:
+            end = len(string)
+        for start in _POINT_BODY_START.finditer(string, 0, end):
+            match = _POINT_BODY_PATTERN.match(string, start.start())
+            if match:
+                break
+        else:
+            raise ValueError(
+                "Failed to create Point instance from string: unknown format."
+            )
+        latitude = Point.parse_degrees(
+            match.group('latitude_degrees'),
+            match.group('latitude_arcminutes') or 0.0,
+            match.group('latitude_arcseconds') or 0.0,
+            (match.group('latitude_direction_front')
+             or match.group('latitude_direction_back')),
+        )
+        longitude = Point.parse_degrees(
+            match.group('longitude_degrees'),
+            match.group('longitude_arcminutes') or 0.0,
+            match.group('longitude_arcseconds') or 0.0,
+            (match.group('longitude_direction_front')
+             or match.group('longitude_direction_back')),
+        )
+        altitude = Point.parse_altitude(
+            match.group('altitude_distance'),
+            match.group('altitude_units')
+        ) or 0.0
+
+    if not (isfinite(latitude) and isfinite(longitude) and isfinite(altitude)):
+        raise ValueError('Point coordinates must be finite. %r has been passed '
+                         'as coordinates.' % ((latitude, longitude, altitude),))
+    if abs(latitude) > 90:
+        raise ValueError('Latitude must be in the [-90; 90] range.')
+    return latitude, longitude, altitude
+
+
 class Point:
     """
     A geodetic point with latitude, longitude, and altitude.
@@ -373,20 +537,12 @@ class Point:
         """
         if distance is not None:
             distance = float(distance)
-            CONVERTERS = {
-                'km': lambda d: d,
-                'm': lambda d: units.kilometers(meters=d),
-                'mi': lambda d: units.kilometers(miles=d),
-                'ft': lambda d: units.kilometers(feet=d),
-                'nm': lambda d: units.kilometers(nautical=d),
-                'nmi': lambda d: units.kilometers(nautical=d)
-            }
             try:
-                return CONVERTERS[unit](distance)
+                return _ALTITUDE_CONVERTERS[unit](distance)
             except KeyError:
                 raise NotImplementedError(
                     'Bad distance unit specified, valid ones are: %r' %
-                    CONVERTERS.keys()
+                    _ALTITUDE_CONVERTERS.keys()
                 )
         else:
             return distance
@@ -434,6 +590,9 @@ class Point:
             with a :class:`ValueError` to guard against ReDoS attacks
             (:issue:`608`, :ghsa:`mhvh-fq92-pfmr`).
 
+        To parse many strings, or strings longer than that, use
+        :meth:`.PointArray.from_strings`.
+
         """
         if len(string) > cls._MAX_STRING_LENGTH:
             raise ValueError(
@@ -494,3 +653,233 @@ class Point:
         instance.
         """
         return cls(point.latitude, point.longitude, point.altitude)
+
+
+class PointArray:
+    """
+    A compact sequence of points backed by a single contiguous float64
+    numpy array of ``(latitude, longitude, altitude)`` rows, 24 bytes
+    per point. Requires numpy.
+
+    The coordinates are validated and normalized like in
+    :class:`.Point`, but in one vectorized pass::
+
+        >>> from geopy.point import PointArray
+        >>> points = PointArray([41.5, -16.1333333], [-81.0, 190.0])
+        >>> len(points)
+        2
+        >>> points[1]
+        Point(-16.1333333, -170.0, 0.0)
+        >>> points.longitudes
+        array([ -81., -170.])
+
+    Indexing with an integer returns a :class:`.Point`; slices, integer
+    arrays and boolean masks return a :class:`.PointArray` (slices share
+    the memory with the original array). Iteration creates the
+    :class:`.Point` instances lazily, one at a time.
+
+    The coordinates are read-only. They are available without copying
+    as a ``(n, 3)`` numpy array with :attr:`.coordinates` or
+    ``numpy.asarray(points)``, and, on Python 3.12+, via the buffer
+    protocol (e.g. ``memoryview(points)``).
+
+    The functions of :mod:`geopy.distance` accepting sequences of
+    points, as well as :class:`geopy.index.SpatialIndex` and
+    :class:`geopy.geohash.GeohashIndex`, use the coordinates of
+    a :class:`.PointArray` directly.
+
+    .. versionadded:: 2.6
+    """
+
+    def __init__(self, latitudes, longitudes, altitudes=None):
+        """
+        :param latitudes: Latitudes of the points.
+        :type latitudes: numpy array, sequence or any object supporting
+            the buffer protocol.
+
+        :param longitudes: Longitudes of the points.
+
+        :param altitudes: Altitudes of the points in kilometers,
+            zero by default.
+
+        The arguments are broadcast against each other and must result
+        in 1-d arrays.
+        """
+        latitudes, longitudes, altitudes = _normalize_coordinate_arrays(
+            latitudes, longitudes, altitudes
+        )
+        if latitudes.ndim != 1:
+            raise ValueError(
+                'PointArray coordinates must be 1-d arrays, got %r shape.'
+                % (latitudes.shape,)
+            )
+        coordinates = np.empty((len(latitudes), 3), dtype=np.float64)
+        coordinates[:, 0] = latitudes
+        coordinates[:, 1] = longitudes
+        coordinates[:, 2] = altitudes
+        self._set_coordinates(coordinates)
+
+    def _set_coordinates(self, coordinates):
+        coordinates.flags.writeable = False
+        self._coordinates = coordinates
+
+    @classmethod
+    def _from_normalized(cls, coordinates):
+        self = cls.__new__(cls)
+        self._set_coordinates(coordinates)
+        return self
+
+    @classmethod
+    def from_points(cls, points):
+        """
+        Create a :class:`.PointArray` from an iterable of anything
+        accepted by :class:`.Point`, or from a numpy array of ``(n, 2)``
+        or ``(n, 3)`` shape of ``(latitude, longitude[, altitude])`` rows.
+
+        The iterable is consumed without keeping the intermediate
+        :class:`.Point` instances.
+        """
+        util.ensure_numpy_is_installed()
+        if isinstance(points, cls):
+            return cls._from_normalized(points._coordinates)
+        if isinstance(points, np.ndarray) and points.dtype != object:
+            if points.ndim != 2 or points.shape[1] not in (2, 3):
+                raise ValueError(
+                    'An array of points must have an (n, 2) or (n, 3) shape, '
+                    'got %r.' % (points.shape,)
+                )
+            return cls(*points.T)
+        buffer = array.array('d')
+        for point in points:
+            buffer.extend(Point(point))
+        return cls._from_normalized(
+            np.frombuffer(buffer, dtype=np.float64).reshape(-1, 3)
+        )
+
+    @classmethod
+    def from_strings(cls, strings):
+        """
+        Parse an iterable of strings, such as a column of a CSV file,
+        into a :class:`.PointArray`.
+
+        The strings are accepted in the same formats as in
+        :meth:`.Point.from_string`, and are parsed into the same values,
+        but the time spent on a string is linear in its length (so there
+        is no limit on it), and invalid strings don't stop the parsing::
+
+            >>> from geopy.point import PointArray
+            >>> points, errors = PointArray.from_strings(
+            ...     ["41.5,-81.0", "nowhere", "23 26m 22s N 23 27m 30s E"]
+            ... )
+            >>> points.coordinates
+            array([[ 41.5       , -81.        ,   0.        ],
+                   [ 23.43944444,  23.45833333,   0.        ]])
+            >>> list(errors)
+            [1]
+
+        .. versionadded:: 2.6
+
+        :param strings: Strings to parse.
+
+        :return: A tuple of a :class:`.PointArray` of the successfully
+            parsed strings, in their original order, and a dict mapping
+            the positions of the other items of ``strings`` to the
+            :class:`ValueError` describing the problem.
+        :rtype: tuple of :class:`.PointArray` and dict
+        """
+        util.ensure_numpy_is_installed()
+        buffer = array.array('d')
+        errors = {}
+        for i, string in enumerate(strings):
+            try:
+                buffer.extend(_parse_point_string(string))
+            except ValueError as error:
+                errors[i] = error
+        coordinates = np.frombuffer(buffer, dtype=np.float64).reshape(-1, 3)
+        return cls(*coordinates.T), errors
+
+    @property
+    def coordinates(self):
+        """
+        Read-only ``(n, 3)`` float64 array of ``(latitude, longitude,
+        altitude)`` rows.
+        """
+        return self._coordinates
+
+    @property
+    def latitudes(self):
+        """
+        Read-only array of latitudes.
+        """
+        return self._coordinates[:, 0]
+
+    @property
+    def longitudes(self):
+        """
+        Read-only array of longitudes.
+        """
+        return self._coordinates[:, 1]
+
+    @property
+    def altitudes(self):
+        """
+        Read-only array of altitudes in kilometers.
+        """
+        return self._coordinates[:, 2]
+
+    def _point(self, row):
+        # The coordinates are already normalized, so skip the validation.
+        point = object.__new__(Point)
+        point.latitude, point.longitude, point.altitude = row
+        return point
+
+    def __len__(self):
+        return len(self._coordinates)
+
+    def __getitem__(self, index):
+        if isinstance(index, tuple):
+            raise TypeError('PointArray indices must not be tuples.')
+        selected = self._coordinates[index]
+        if selected.ndim == 1:
+            return self._point(selected.tolist())
+        return self._from_normalized(selected)
+
+    def __iter__(self):
+        for i in range(len(self._coordinates)):
+            yield self._point(self._coordinates[i].tolist())
+
+    def __array__(self, dtype=None, copy=None):
+        if copy or (dtype is not None and np.dtype(dtype) != np.float64):
+            return np.array(self._coordinates, dtype=dtype)
+        return self._coordinates
+
+    def __buffer__(self, flags):
+        return memoryview(self._coordinates)
+
+    def __getstate__(self):
+        return {'coordinates': self._coordinates}
+
+    def __setstate__(self, state):
+        self._set_coordinates(state['coordinates'])
+
+    def __eq__(self, other):
+        if not isinstance(other, PointArray):
+            return NotImplemented
+        return bool(np.array_equal(self._coordinates, other._coordinates))
+
+    __hash__ = None
+
+    def __repr__(self):
+        # Like the numpy arrays, the large ones are summarized,
+        # the others can be passed back to the constructor.
+        summarize = self._coordinates.size > np.get_printoptions()['threshold']
+
+        def format_column(column):
+            if summarize:
+                return '[%s, ..., %s]' % (
+                    ', '.join(map(repr, column[:3].tolist())),
+                    ', '.join(map(repr, column[-3:].tolist())),
+                )
+            return repr(column.tolist())
+
+        return 'PointArray(%s)' % ', '.join(map(format_column, self._coordinates.T))
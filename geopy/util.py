@@ -1,6 +1,12 @@
 import logging
 from decimal import Decimal
 
+try:
+    import numpy  # noqa
+    numpy_available = True
+except ImportError:
+    numpy_available = False
+
 NUMBER_TYPES = (int, float, Decimal)
 
 __version__ = "2.5.0"
@@ -23,5 +29,14 @@ def join_filter(sep, seq, pred=bool):
     return sep.join([str(i) for i in seq if pred(i)])
 
 
+def ensure_numpy_is_installed():
+    if not numpy_available:
+        raise ImportError(
+            'numpy must be installed in order to use array operations. '
+            'If geopy has been installed with `pip`, then numpy can be '
+            'installed with `pip install "geopy[numpy]"`.'
+        )
+
+
 def get_version():
     return __version__
@@ -1,6 +1,11 @@
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlsplit
+
 import pytest
 
 from geopy import exc
+from geopy.adapters import BaseSyncAdapter
+from geopy.cache import MemoryCache
 from geopy.geocoders import ArcGIS
 from geopy.point import Point
 from test.geocoders.util import BaseTestGeocoder, env
@@ -14,6 +19,54 @@ class TestUnitArcGIS:
         )
         assert geocoder.headers['User-Agent'] == 'my_user_agent/1.0'
 
+    def test_token_expiry_with_cache(self):
+        cache = MemoryCache(ttl=3600)
+        geocoder = ArcGIS(username='a', password='b',
+                          referer='http://www.example.com',
+                          adapter_factory=TokenSyncAdapter, cache=cache)
+        now = [1000]
+        with patch('geopy.geocoders.arcgis.time', lambda: now[0]):
+            assert geocoder.geocode('a').address == 'a'
+            assert geocoder.token == 'T1'
+
+            # Expired locally: a new token is requested.
+            now[0] += geocoder.token_lifetime + 1
+            assert geocoder.geocode('b').address == 'b'
+            assert geocoder.token == 'T2'
+
+            # Expired on the server: the query is retried with a new token.
+            geocoder.adapter.tokens += 1
+            assert geocoder.geocode('c').address == 'c'
+            assert geocoder.token == 'T4'
+
+        assert 3 == geocoder.adapter.token_requests
+        for value, _, _ in cache._entries.values():
+            assert '"token"' not in value
+
+
+class TokenSyncAdapter(BaseSyncAdapter):
+    # Issues a new token for each token request, and accepts
+    # the last issued one only.
+
+    def __init__(self, *, proxies, ssl_context):
+        super().__init__(proxies=proxies, ssl_context=ssl_context)
+        self.tokens = 0
+        self.token_requests = 0
+
+    def get_json(self, url, *, timeout, headers):
+        params = parse_qs(urlsplit(url).query)
+        if url.startswith('https://www.arcgis.com/sharing/generateToken'):
+            self.tokens += 1
+            self.token_requests += 1
+            return {'token': 'T%s' % self.tokens}
+        if params['token'] != ['T%s' % self.tokens]:
+            return {'error': {'code': 498}}
+        query = params['singleLine'][0]
+        return {'candidates': [{'address': query, 'location': {'x': 1, 'y': 2}}]}
+
+    def get_text(self, url, *, timeout, headers):  # pragma: no cover
+        raise NotImplementedError
+
 
 class TestArcGIS(BaseTestGeocoder):
 
@@ -1,15 +1,21 @@
+import asyncio
+import functools
+import threading
+import time
 import unittest
 from contextlib import ExitStack
 from unittest.mock import patch, sentinel
 
 import pytest
 
+import geopy.exc
 import geopy.geocoders
 import geopy.geocoders.base
-from geopy.adapters import BaseAsyncAdapter, BaseSyncAdapter
-from geopy.exc import GeocoderNotFound, GeocoderQueryError
-from geopy.geocoders import GoogleV3, get_geocoder_for_service
-from geopy.geocoders.base import Geocoder, _synchronized
+from geopy.adapters import AdapterHTTPError, BaseAsyncAdapter, BaseSyncAdapter
+from geopy.cache import BaseCache, CacheInfo, MemoryCache
+from geopy.exc import GeocoderNotFound, GeocoderQueryError, GeocoderServiceError
+from geopy.geocoders import GoogleV3, Nominatim, get_geocoder_for_service
+from geopy.geocoders.base import NONE_RESULT, Geocoder, _synchronized
 from geopy.point import Point
 
 
@@ -332,3 +338,466 @@ async def test_synchronize_decorator_async_reentrance():
 
     assert 42 == await geocoder.f()
     assert calls == list(range(5))
+
+
+class CountingSyncAdapter(BaseSyncAdapter):
+    def __init__(self, *, proxies, ssl_context, response=None):
+        super().__init__(proxies=proxies, ssl_context=ssl_context)
+        self.response = response if response is not None else {"lat": 1}
+        self.calls = []
+
+    def get_json(self, url, *, timeout, headers):
+        self.calls.append((url, headers))
+        return dict(self.response)
+
+    def get_text(self, url, *, timeout, headers):
+        self.calls.append((url, headers))
+        return "text response"
+
+
+class CountingAsyncAdapter(BaseAsyncAdapter):
+    def __init__(self, *, proxies, ssl_context, response=None):
+        super().__init__(proxies=proxies, ssl_context=ssl_context)
+        self.response = response if response is not None else {"lat": 1}
+        self.calls = []
+
+    async def get_json(self, url, *, timeout, headers):
+        self.calls.append((url, headers))
+        return dict(self.response)
+
+    async def get_text(self, url, *, timeout, headers):
+        self.calls.append((url, headers))
+        return "text response"
+
+
+class FailingCache(BaseCache):
+    def get(self, key):
+        raise RuntimeError("get")
+
+    def set(self, key, value, *, negative=False):
+        raise RuntimeError("set")
+
+
+async def _call(geocoder, url, callback=lambda res: res, **kwargs):
+    res = geocoder._call_geocoder(url, callback, **kwargs)
+    if isinstance(geocoder.adapter, BaseAsyncAdapter):
+        res = await res
+    return res
+
+
+@pytest.mark.parametrize("adapter_factory",
+                         [CountingSyncAdapter, CountingAsyncAdapter])
+async def test_cache_hit_skips_adapter(adapter_factory):
+    cache = MemoryCache()
+    geocoder = Geocoder(adapter_factory=adapter_factory, cache=cache)
+
+    assert {"lat": 1} == await _call(geocoder, "https://example.com/?q=a")
+    assert {"lat": 1} == await _call(geocoder, "https://example.com/?q=a")
+    assert "text response" == await _call(
+        geocoder, "https://example.com/?q=a", is_json=False
+    )
+    assert "text response" == await _call(
+        geocoder, "https://example.com/?q=a", is_json=False
+    )
+    assert 2 == len(geocoder.adapter.calls)
+    assert (2, 2) == cache.cache_info()[:2]
+
+
+def test_cache_hit_returns_fresh_copies():
+    geocoder = Geocoder(adapter_factory=CountingSyncAdapter, cache=MemoryCache())
+
+    def callback(response):
+        response["lat"] = 2
+        return response
+
+    assert {"lat": 2} == geocoder._call_geocoder("https://example.com/", callback)
+    assert {"lat": 2} == geocoder._call_geocoder("https://example.com/", callback)
+    assert {"lat": 1} == geocoder._call_geocoder("https://example.com/",
+                                                 lambda res: res)
+    assert 1 == len(geocoder.adapter.calls)
+
+
+async def test_cache_key_normalization():
+    geocoder = Geocoder(adapter_factory=CountingSyncAdapter, cache=MemoryCache())
+
+    await _call(geocoder, "https://example.com/?a=1&b=2")
+    await _call(geocoder, "HTTPS://EXAMPLE.com/?b=2&a=1")
+    geocoder.headers["User-Agent"] = "another/1.0"
+    await _call(geocoder, "https://example.com/?a=1&b=2")
+    assert 1 == len(geocoder.adapter.calls)
+
+    await _call(geocoder, "https://example.com/?a=1&b=3")
+    await _call(geocoder, "https://example.com/?a=1&b=2",
+                headers={"Accept-Language": "de"})
+    await _call(geocoder, "https://example.com/?a=1&b=2", is_json=False)
+    assert 4 == len(geocoder.adapter.calls)
+
+
+@pytest.mark.parametrize("adapter_factory",
+                         [CountingSyncAdapter, CountingAsyncAdapter])
+async def test_cache_errors_are_not_cached(adapter_factory):
+    cache = MemoryCache()
+    geocoder = Geocoder(adapter_factory=adapter_factory, cache=cache)
+
+    def callback(response):
+        raise GeocoderQueryError("bad response")
+
+    for _ in range(2):
+        with pytest.raises(GeocoderQueryError):
+            await _call(geocoder, "https://example.com/", callback)
+    assert 2 == len(geocoder.adapter.calls)
+    assert 0 == cache.cache_info().currsize
+
+
+@pytest.mark.parametrize("adapter_factory",
+                         [CountingSyncAdapter, CountingAsyncAdapter])
+async def test_cache_failures_are_logged(adapter_factory, caplog):
+    geocoder = Geocoder(adapter_factory=adapter_factory, cache=FailingCache())
+
+    assert {"lat": 1} == await _call(geocoder, "https://example.com/")
+    assert 1 == len(geocoder.adapter.calls)
+    messages = [record.getMessage() for record in caplog.records]
+    assert "Cache lookup has failed" in messages
+    assert "Cache update has failed" in messages
+
+
+def test_cache_default_option():
+    cache = MemoryCache()
+    with patch.object(geopy.geocoders.options, 'default_cache', cache):
+        assert Geocoder().cache is cache
+        assert Geocoder(cache=None).cache is None
+    assert Geocoder().cache is None
+
+
+class GeocoderReversePrecisionTestCase(unittest.TestCase):
+
+    def test_default_is_exact(self):
+        geocoder = Geocoder()
+        assert geocoder.reverse_precision is None
+        assert "40.7486731,-73.9856472" == geocoder._coerce_reverse_query_to_string(
+            (40.7486731, -73.9856472)
+        )
+
+    def test_snaps_to_grid(self):
+        geocoder = Geocoder(reverse_precision=3)
+        for query in ((40.7486731, -73.9856472), "40.74851,-73.98551",
+                      Point(40.74851, -73.98551, 10)):
+            assert "40.749,-73.986" == geocoder._coerce_reverse_query_to_string(
+                query
+            )
+        assert "-0.0010000 0.5000000" == geocoder._coerce_reverse_query_to_string(
+            (-0.0009, 0.49999), "%(lat)s %(lon)s"
+        )
+
+    @patch.object(geopy.geocoders.options, 'default_reverse_precision', 4)
+    def test_default_option(self):
+        assert 4 == Geocoder().reverse_precision
+        assert Geocoder(reverse_precision=None).reverse_precision is None
+
+    def test_invalid(self):
+        for reverse_precision in (-1, 1.5, "4"):
+            with pytest.raises(geopy.exc.ConfigurationError):
+                Geocoder(reverse_precision=reverse_precision)
+
+
+def test_reverse_precision_with_cache():
+    response = {"lat": "40.7486", "lon": "-73.9856", "display_name": "ESB"}
+    adapter = CountingSyncAdapter(proxies=None, ssl_context=None,
+                                  response=response)
+    geocoder = Nominatim(
+        user_agent="test", adapter_factory=lambda **kw: adapter,
+        cache=MemoryCache(), reverse_precision=4,
+    )
+    first = geocoder.reverse((40.74861, -73.98559))
+    second = geocoder.reverse((40.74864, -73.98562))
+    assert first == second
+    assert "ESB" == second.address
+    assert 1 == len(adapter.calls)
+    assert "lat=40.7486&lon=-73.9856" in adapter.calls[0][0]
+
+    geocoder.reverse((40.74866, -73.98562))
+    assert 2 == len(adapter.calls)
+
+
+class BlockingSyncAdapter(CountingSyncAdapter):
+    def __init__(self, *, proxies, ssl_context, error=None):
+        super().__init__(proxies=proxies, ssl_context=ssl_context)
+        self.release = threading.Event()
+        self.error = error
+
+    def get_json(self, url, *, timeout, headers):
+        self.calls.append((url, headers))
+        assert self.release.wait(5)
+        if self.error is not None:
+            raise self.error
+        return dict(self.response)
+
+
+class BlockingAsyncAdapter(CountingAsyncAdapter):
+    def __init__(self, *, proxies, ssl_context, error=None):
+        super().__init__(proxies=proxies, ssl_context=ssl_context)
+        self.release = asyncio.Event()
+        self.error = error
+
+    async def get_json(self, url, *, timeout, headers):
+        self.calls.append((url, headers))
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return dict(self.response)
+
+
+def _run_threads(geocoder, count, callback=lambda res: res):
+    outcomes = [None] * count
+
+    def target(i):
+        try:
+            outcomes[i] = geocoder._call_geocoder("https://example.com/", callback)
+        except Exception as error:
+            outcomes[i] = error
+
+    threads = [threading.Thread(target=target, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    # Wait until all of the calls have joined the flight.
+    deadline = time.monotonic() + 5
+    while not (
+        geocoder._flights and
+        next(iter(geocoder._flights.values())).followers == count - 1
+    ):
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+    geocoder.adapter.release.set()
+    for thread in threads:
+        thread.join()
+    return outcomes
+
+
+def test_coalesce_sync():
+    geocoder = Geocoder(adapter_factory=BlockingSyncAdapter)
+
+    def callback(response):
+        response["parsed"] = True  # must not leak to the other calls
+        return response
+
+    outcomes = _run_threads(geocoder, 10, callback)
+    assert 1 == len(geocoder.adapter.calls)
+    assert all(res == {"lat": 1, "parsed": True} for res in outcomes)
+    assert 10 == len({id(res) for res in outcomes})
+    assert {} == geocoder._flights
+
+    geocoder._call_geocoder("https://example.com/", lambda res: res)
+    assert 2 == len(geocoder.adapter.calls)
+
+
+def test_coalesce_sync_error():
+    geocoder = Geocoder(adapter_factory=functools.partial(
+        BlockingSyncAdapter, error=GeocoderServiceError("boom")
+    ))
+    outcomes = _run_threads(geocoder, 5)
+    assert 1 == len(geocoder.adapter.calls)
+    assert all(isinstance(res, GeocoderServiceError) for res in outcomes)
+    assert {} == geocoder._flights
+
+
+async def test_coalesce_async():
+    geocoder = Geocoder(adapter_factory=BlockingAsyncAdapter)
+
+    def callback(response):
+        response["parsed"] = True
+        return response
+
+    calls = [
+        asyncio.ensure_future(geocoder._call_geocoder("https://example.com/", callback))
+        for _ in range(10)
+    ]
+    other = asyncio.ensure_future(
+        geocoder._call_geocoder("https://example.com/?q=other", callback)
+    )
+    await asyncio.sleep(0)
+    geocoder.adapter.release.set()
+    outcomes = await asyncio.gather(*calls, other)
+    assert 2 == len(geocoder.adapter.calls)
+    assert all(res == {"lat": 1, "parsed": True} for res in outcomes)
+    assert 11 == len({id(res) for res in outcomes})
+    assert {} == geocoder._flights
+
+
+async def test_coalesce_async_different_timeouts():
+    geocoder = Geocoder(adapter_factory=BlockingAsyncAdapter)
+    calls = [
+        asyncio.ensure_future(
+            geocoder._call_geocoder("https://example.com/", lambda res: res,
+                                    timeout=timeout)
+        )
+        for timeout in (1, 2, None)
+    ]
+    await asyncio.sleep(0)
+    geocoder.adapter.release.set()
+    outcomes = await asyncio.gather(*calls)
+    assert 1 == len(geocoder.adapter.calls)
+    assert all(res == {"lat": 1} for res in outcomes)
+
+
+async def test_coalesce_async_error():
+    geocoder = Geocoder(adapter_factory=functools.partial(
+        BlockingAsyncAdapter, error=GeocoderServiceError("boom")
+    ))
+    calls = [geocoder._call_geocoder("https://example.com/", lambda res: res)
+             for _ in range(5)]
+    geocoder.adapter.release.set()
+    outcomes = await asyncio.gather(*calls, return_exceptions=True)
+    assert 1 == len(geocoder.adapter.calls)
+    assert all(isinstance(res, GeocoderServiceError) for res in outcomes)
+
+
+async def test_coalesce_async_cancelled_leader():
+    geocoder = Geocoder(adapter_factory=BlockingAsyncAdapter)
+    leader = asyncio.ensure_future(
+        geocoder._call_geocoder("https://example.com/", lambda res: res)
+    )
+    follower = asyncio.ensure_future(
+        geocoder._call_geocoder("https://example.com/", lambda res: res)
+    )
+    await asyncio.sleep(0)
+    leader.cancel()
+    await asyncio.sleep(0)
+    geocoder.adapter.release.set()
+    assert {"lat": 1} == await follower
+    assert leader.cancelled()
+    assert 1 == len(geocoder.adapter.calls)
+
+
+async def test_coalesce_async_with_cache():
+    cache = MemoryCache()
+    geocoder = Geocoder(adapter_factory=BlockingAsyncAdapter, cache=cache)
+    calls = [geocoder._call_geocoder("https://example.com/", lambda res: res)
+             for _ in range(3)]
+    geocoder.adapter.release.set()
+    await asyncio.gather(*calls)
+    await geocoder._call_geocoder("https://example.com/", lambda res: res)
+    assert 1 == len(geocoder.adapter.calls)
+    assert CacheInfo(1, 3, 0, 1, 10) == cache.cache_info()
+
+
+class NotFoundGeocoder(Geocoder):
+    def _geocoder_exception_handler(self, error):
+        if isinstance(error, AdapterHTTPError) and error.status_code == 404:
+            return NONE_RESULT
+
+
+class NotFoundSyncAdapter(CountingSyncAdapter):
+    def get_json(self, url, *, timeout, headers):
+        self.calls.append((url, headers))
+        raise AdapterHTTPError("not found", status_code=404, headers={}, text="")
+
+
+class NotFoundAsyncAdapter(CountingAsyncAdapter):
+    async def get_json(self, url, *, timeout, headers):
+        self.calls.append((url, headers))
+        raise AdapterHTTPError("not found", status_code=404, headers={}, text="")
+
+
+@pytest.fixture
+def clock():
+    now = [0.0]
+    with patch.object(MemoryCache, '_clock', lambda _: now[0]):
+        yield now
+
+
+@pytest.mark.parametrize("adapter_factory",
+                         [CountingSyncAdapter, CountingAsyncAdapter])
+async def test_cache_negative_callback_result(adapter_factory, clock):
+    cache = MemoryCache(ttl=100, negative_ttl=10)
+    geocoder = Geocoder(adapter_factory=adapter_factory, cache=cache)
+
+    assert await _call(geocoder, "https://example.com/", lambda res: None) is None
+    assert await _call(geocoder, "https://example.com/", lambda res: None) is None
+    assert 1 == len(geocoder.adapter.calls)
+    clock[0] += 10
+    assert await _call(geocoder, "https://example.com/", lambda res: None) is None
+    assert 2 == len(geocoder.adapter.calls)
+
+
+@pytest.mark.parametrize("adapter_factory",
+                         [NotFoundSyncAdapter, NotFoundAsyncAdapter])
+async def test_cache_negative_none_result(adapter_factory, clock):
+    cache = MemoryCache(ttl=100, negative_ttl=10)
+    geocoder = NotFoundGeocoder(adapter_factory=adapter_factory, cache=cache)
+
+    def callback(response):  # pragma: no cover
+        raise AssertionError("must not be called")
+
+    assert await _call(geocoder, "https://example.com/", callback) is None
+    assert await _call(geocoder, "https://example.com/", callback) is None
+    assert 1 == len(geocoder.adapter.calls)
+    clock[0] += 10
+    assert await _call(geocoder, "https://example.com/", callback) is None
+    assert 2 == len(geocoder.adapter.calls)
+
+
+def test_cache_stale_while_revalidate_sync(clock):
+    cache = MemoryCache(ttl=10, stale_while_revalidate=100)
+    geocoder = Geocoder(adapter_factory=BlockingSyncAdapter, cache=cache)
+    geocoder.adapter.release.set()
+    assert {"lat": 1} == geocoder._call_geocoder("https://example.com/",
+                                                 lambda res: res)
+
+    geocoder.adapter.release.clear()
+    geocoder.adapter.response = {"lat": 2}
+    clock[0] += 10
+    # The stale response is returned while the single refresh is blocked.
+    for _ in range(3):
+        assert {"lat": 1} == geocoder._call_geocoder("https://example.com/",
+                                                     lambda res: res)
+    (thread,) = geocoder._revalidations.values()
+    geocoder.adapter.release.set()
+    thread.join()
+    assert {} == geocoder._revalidations
+    assert 2 == len(geocoder.adapter.calls)
+    assert {"lat": 2} == geocoder._call_geocoder("https://example.com/",
+                                                 lambda res: res)
+    assert ('{"lat": 2}', False) == cache.lookup(next(iter(cache._entries)))
+
+
+async def test_cache_stale_while_revalidate_async(clock):
+    cache = MemoryCache(ttl=10, stale_while_revalidate=100)
+    geocoder = Geocoder(adapter_factory=BlockingAsyncAdapter, cache=cache)
+    geocoder.adapter.release.set()
+    assert {"lat": 1} == await geocoder._call_geocoder("https://example.com/",
+                                                       lambda res: res)
+
+    geocoder.adapter.release.clear()
+    geocoder.adapter.response = {"lat": 2}
+    clock[0] += 10
+    for _ in range(3):
+        assert {"lat": 1} == await geocoder._call_geocoder("https://example.com/",
+                                                           lambda res: res)
+    (task,) = geocoder._revalidations.values()
+    geocoder.adapter.release.set()
+    await task
+    await asyncio.sleep(0)
+    assert {} == geocoder._revalidations
+    assert 2 == len(geocoder.adapter.calls)
+    assert {"lat": 2} == await geocoder._call_geocoder("https://example.com/",
+                                                       lambda res: res)
+
+
+def test_cache_failed_revalidation_keeps_stale_entry(clock, caplog):
+    cache = MemoryCache(ttl=10, stale_while_revalidate=100)
+    geocoder = Geocoder(adapter_factory=BlockingSyncAdapter, cache=cache)
+    geocoder.adapter.release.set()
+    geocoder._call_geocoder("https://example.com/", lambda res: res)
+
+    geocoder.adapter.release.clear()
+    geocoder.adapter.error = GeocoderServiceError("boom")
+    clock[0] += 10
+    assert {"lat": 1} == geocoder._call_geocoder("https://example.com/",
+                                                 lambda res: res)
+    (thread,) = geocoder._revalidations.values()
+    geocoder.adapter.release.set()
+    thread.join()
+    assert "Cache revalidation has failed" in [
+        record.getMessage() for record in caplog.records
+    ]
+    assert ('{"lat": 1}', True) == cache.lookup(next(iter(cache._entries)))
@@ -0,0 +1,301 @@
+import sqlite3
+import unittest
+from time import monotonic
+from unittest.mock import patch
+
+import pytest
+
+from geopy.cache import BaseCache, CacheInfo, MemoryCache, SQLiteCache, _cache_key
+
+
+class CacheKeyTestCase(unittest.TestCase):
+
+    def test_query_order_is_ignored(self):
+        assert (
+            _cache_key("https://example.com/a?x=1&y=2", {}, True) ==
+            _cache_key("https://example.com/a?y=2&x=1", {}, True)
+        )
+
+    def test_repeated_params_order_is_kept(self):
+        assert (
+            _cache_key("https://example.com/a?x=1&x=2", {}, True) !=
+            _cache_key("https://example.com/a?x=2&x=1", {}, True)
+        )
+
+    def test_scheme_and_host_are_case_insensitive(self):
+        assert (
+            _cache_key("HTTPS://Example.COM/a", {}, True) ==
+            _cache_key("https://example.com/a", {}, True)
+        )
+        assert (
+            _cache_key("https://example.com/A", {}, True) !=
+            _cache_key("https://example.com/a", {}, True)
+        )
+
+    def test_headers(self):
+        key = _cache_key("https://example.com/", {"User-Agent": "a"}, True)
+        assert key == _cache_key("https://example.com/", {"User-Agent": "b"}, True)
+        assert key == _cache_key("https://example.com/", {}, True)
+        assert key != _cache_key("https://example.com/", {"X-Lang": "de"}, True)
+
+    def test_json_and_text_differ(self):
+        assert (
+            _cache_key("https://example.com/", {}, True) !=
+            _cache_key("https://example.com/", {}, False)
+        )
+
+    def test_url_is_not_stored_in_key(self):
+        key = _cache_key("https://example.com/?key=secret", {}, True)
+        assert "secret" not in key
+        assert 64 == len(key)
+
+
+class MemoryCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 0.0
+        patcher = patch.object(MemoryCache, '_clock', lambda _: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_get_set(self):
+        cache = MemoryCache()
+        assert cache.get("a") is None
+        cache.set("a", "1")
+        assert "1" == cache.get("a")
+        cache.set("a", "22")
+        assert "22" == cache.get("a")
+        assert CacheInfo(2, 1, 0, 1, 2) == cache.cache_info()
+
+    def test_ttl(self):
+        cache = MemoryCache(ttl=10)
+        cache.set("a", "1")
+        self.now = 9.9
+        assert "1" == cache.get("a")
+        self.now = 10
+        assert cache.get("a") is None
+        assert CacheInfo(1, 1, 0, 0, 0) == cache.cache_info()
+
+    def test_no_ttl(self):
+        cache = MemoryCache(ttl=None)
+        cache.set("a", "1")
+        self.now = 1e12
+        assert "1" == cache.get("a")
+
+    def test_maxsize_evicts_least_recently_used(self):
+        cache = MemoryCache(maxsize=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+        cache.set("c", "3")
+        assert cache.get("b") is None
+        assert "1" == cache.get("a")
+        assert "3" == cache.get("c")
+        assert 1 == cache.cache_info().evictions
+
+    def test_max_bytes(self):
+        cache = MemoryCache(max_bytes=4)
+        cache.set("a", "12")
+        cache.set("b", "34")
+        cache.set("c", "é")  # 2 bytes in UTF-8
+        assert cache.get("a") is None
+        assert CacheInfo(0, 1, 1, 2, 4) == cache.cache_info()
+        cache.set("d", "12345")
+        assert cache.get("d") is None
+        assert "34" == cache.get("b")
+
+    def test_clear(self):
+        cache = MemoryCache()
+        cache.set("a", "1")
+        cache.get("a")
+        cache.clear()
+        assert cache.get("a") is None
+        assert CacheInfo(0, 1, 0, 0, 0) == cache.cache_info()
+
+    def test_negative_ttl(self):
+        cache = MemoryCache(ttl=10, negative_ttl=2)
+        cache.set("a", "1")
+        cache.set("b", "[]", negative=True)
+        self.now = 2
+        assert "1" == cache.get("a")
+        assert cache.get("b") is None
+
+    def test_stale_while_revalidate(self):
+        cache = MemoryCache(ttl=10, stale_while_revalidate=5)
+        cache.set("a", "1")
+        assert ("1", False) == cache.lookup("a")
+        self.now = 10
+        assert ("1", True) == cache.lookup("a")
+        assert cache.get("a") is None
+        self.now = 15
+        assert (None, False) == cache.lookup("a")
+        assert CacheInfo(2, 2, 0, 0, 0) == cache.cache_info()
+
+    def test_lookup_without_stale_while_revalidate(self):
+        cache = MemoryCache(ttl=10)
+        cache.set("a", "1")
+        self.now = 10
+        assert (None, False) == cache.lookup("a")
+
+    def test_invalid_arguments(self):
+        for kwargs in ({"ttl": 0}, {"maxsize": 0}, {"max_bytes": 0},
+                       {"negative_ttl": 0}, {"stale_while_revalidate": -1}):
+            with pytest.raises(ValueError):
+                MemoryCache(**kwargs)
+
+
+def test_base_cache_lookup():
+    class DictCache(BaseCache):
+        def __init__(self):
+            self.data = {}
+
+        def get(self, key):
+            return self.data.get(key)
+
+        def set(self, key, value, *, negative=False):
+            self.data[key] = value
+
+    cache = DictCache()
+    cache.set("a", "1")
+    assert ("1", False) == cache.lookup("a")
+    assert (None, False) == cache.lookup("b")
+    assert cache.cache_info() is None
+
+
+@pytest.fixture
+def clock():
+    now = [1000.0]
+    with patch.object(SQLiteCache, '_clock', lambda _: now[0]):
+        yield now
+
+
+def test_sqlite_cache_get_set(tmp_path, clock):
+    cache = SQLiteCache(tmp_path / "cache.sqlite")
+    assert cache.get("a") is None
+    cache.set("a", '{"lat": 1}')
+    assert '{"lat": 1}' == cache.get("a")
+    cache.set("a", "é" * 1000)
+    assert "é" * 1000 == cache.get("a")
+    info = cache.cache_info()
+    assert (2, 1, 0, 1) == info[:4]
+    assert 0 < info.nbytes < 100  # compressed
+
+
+def test_sqlite_cache_is_persistent_and_shared(tmp_path, clock):
+    path = str(tmp_path / "cache.sqlite")
+    first = SQLiteCache(path)
+    second = SQLiteCache(path)
+    first.set("a", "1")
+    assert "1" == second.get("a")
+    first.close()
+    assert "1" == SQLiteCache(path).get("a")
+    assert "1" == first.get("a")  # reconnects
+
+
+def test_sqlite_cache_does_not_wait_for_locked_database(tmp_path, clock):
+    path = str(tmp_path / "cache.sqlite")
+    cache = SQLiteCache(path, timeout=0.05)
+    cache.set("a", "1")
+    writer = sqlite3.connect(path, isolation_level=None)
+    writer.execute("BEGIN IMMEDIATE")
+    try:
+        start = monotonic()
+        cache.set("b", "2")  # skipped
+        assert "1" == cache.get("a")  # readers aren't blocked in WAL mode
+        cache.close()
+        assert cache.get("a") is None  # can't reconnect, a miss
+        assert monotonic() - start < 5
+    finally:
+        writer.execute("ROLLBACK")
+        writer.close()
+    assert "1" == cache.get("a")
+    assert cache.get("b") is None
+    assert (2, 2) == cache.cache_info()[:2]
+
+
+def test_sqlite_cache_ttl(tmp_path, clock):
+    cache = SQLiteCache(tmp_path / "cache.sqlite", ttl=10)
+    cache.set("a", "1")
+    clock[0] += 9.9
+    assert "1" == cache.get("a")
+    clock[0] += 0.1
+    assert cache.get("a") is None
+    cache.vacuum()
+    assert 0 == cache.cache_info().currsize
+
+
+def test_sqlite_cache_maxsize_evicts_oldest(tmp_path, clock):
+    cache = SQLiteCache(tmp_path / "cache.sqlite", maxsize=2)
+    for key in "abc":
+        cache.set(key, key)
+        clock[0] += 1
+    assert cache.get("a") is None
+    assert "b" == cache.get("b")
+    assert "c" == cache.get("c")
+    assert 1 == cache.cache_info().evictions
+
+
+def test_sqlite_cache_evicts_expired_first(tmp_path, clock):
+    cache = SQLiteCache(tmp_path / "cache.sqlite", ttl=10, maxsize=2)
+    cache.set("a", "a")
+    clock[0] += 5
+    cache.set("b", "b")
+    clock[0] += 6  # `a` has expired
+    cache.set("c", "c")
+    assert "b" == cache.get("b")
+    assert 1 == cache.cache_info().evictions
+
+
+def test_sqlite_cache_max_bytes(tmp_path, clock):
+    cache = SQLiteCache(tmp_path / "cache.sqlite", max_bytes=30,
+                        compress_level=0)
+    cache.set("a", "x" * 5)  # 16 bytes with the zlib framing
+    clock[0] += 1
+    cache.set("b", "y" * 5)
+    assert cache.get("a") is None
+    assert "y" * 5 == cache.get("b")
+    cache.set("c", "z" * 100)  # too large
+    assert cache.get("c") is None
+    assert (1, 16) == cache.cache_info()[3:]
+
+
+def test_sqlite_cache_clear(tmp_path, clock):
+    cache = SQLiteCache(tmp_path / "cache.sqlite")
+    cache.set("a", "1")
+    cache.get("a")
+    cache.clear()
+    assert cache.get("a") is None
+    assert CacheInfo(0, 1, 0, 0, 0) == cache.cache_info()
+
+
+def test_sqlite_cache_negative_ttl(tmp_path, clock):
+    cache = SQLiteCache(tmp_path / "cache.sqlite", ttl=10, negative_ttl=2)
+    cache.set("a", "1")
+    cache.set("b", "[]", negative=True)
+    clock[0] += 2
+    assert "1" == cache.get("a")
+    assert cache.get("b") is None
+
+
+def test_sqlite_cache_stale_while_revalidate(tmp_path, clock):
+    cache = SQLiteCache(tmp_path / "cache.sqlite", ttl=10,
+                        stale_while_revalidate=5, maxsize=2)
+    cache.set("a", "1")
+    assert ("1", False) == cache.lookup("a")
+    clock[0] += 10
+    assert ("1", True) == cache.lookup("a")
+    assert cache.get("a") is None
+    cache.vacuum()  # `a` can still be served stale
+    assert 1 == cache.cache_info().currsize
+    clock[0] += 5
+    assert (None, False) == cache.lookup("a")
+    cache.vacuum()
+    assert 0 == cache.cache_info().currsize
+
+
+def test_sqlite_cache_invalid_arguments(tmp_path):
+    for kwargs in ({"ttl": 0}, {"maxsize": 0}, {"max_bytes": 0},
+                   {"compress_level": 10}, {"negative_ttl": 0},
+                   {"stale_while_revalidate": 0}):
+        with pytest.raises(ValueError):
+            SQLiteCache(tmp_path / "cache.sqlite", **kwargs)
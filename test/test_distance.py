@@ -1,16 +1,49 @@
+import array
+import csv
+import itertools
 import math
+import os
+import threading
 import unittest
 import warnings
+from unittest.mock import patch
+
+import pytest
+from geographiclib.geodesic import Geodesic
+from geographiclib.polygonarea import PolygonArea
 
 from geopy.distance import (
     EARTH_RADIUS,
+    ELLIPSOIDS,
     Distance,
+    DistanceArray,
+    DistanceCache,
     GeodesicDistance,
     GreatCircleDistance,
+    andoyer_lambert,
+    cumulative_distances,
     distance,
+    distance_matrix,
+    equirectangular,
+    local_projection,
     lonlat,
+    path_length,
+    simplify,
+    simplify_stream,
+    within,
+    write_distance_matrix,
+)
+from geopy.point import Point, PointArray
+
+try:
+    import numpy as np
+    numpy_available = True
+except ImportError:
+    numpy_available = False
+
+requires_numpy = pytest.mark.skipif(
+    "not numpy_available", reason="numpy is not installed"
 )
-from geopy.point import Point
 
 EARTH_CIRCUMFERENCE = 2 * math.pi * EARTH_RADIUS
 NORTH_POLE = Point(90, 0)
@@ -132,6 +165,277 @@ class CommonDistanceComputationCases:
                                 for _ in range(2))
         self.assertEqual(distance1.kilometers, distance2.kilometers)
 
+    def test_plain_tuples_same_as_points(self):
+        # Plain float tuples skip the Point construction, which
+        # must not change the results.
+        distance = self.cls()
+        pairs = [
+            ((41.49008, -71.312796), (41.499498, -81.695391)),
+            ((90, 180), (-90, -180)),
+            ((10, 20), (-10.5, -20)),
+            ((10, 200), (-10, -200.5)),
+            (("10", "20"), (11, 21)),
+        ]
+        for a, b in pairs:
+            self.assertEqual(distance.measure(a, b),
+                             distance.measure(Point(a), Point(b)))
+            self.assertEqual(distance.measure(a, b),
+                             distance.measure(list(a), list(b)))
+        with self.assertRaises(ValueError):
+            distance.measure((90.5, 0), (0, 0))
+        with self.assertRaises(ValueError):
+            distance.measure((0, float('inf')), (0, 0))
+
+
+class CommonBatchDistanceCases:
+
+    cls = None
+    destination_crosses_poles = True
+
+    pairs = [
+        ((10, 20), (40, 60)),
+        ((0, 0), (0, 0)),
+        ((0, -180), (0, 180)),
+        ((-90, 0), (90, 0)),
+        ((41.49008, -71.312796), (41.499498, -81.695391)),
+        ((0, -179.5), (0, 179.5)),
+        ((-16.1333333, 180.0), (-16.2, 540.5)),
+    ]
+
+    def _columns(self):
+        lat1, lon1 = zip(*(a for a, _ in self.pairs))
+        lat2, lon2 = zip(*(b for _, b in self.pairs))
+        return lat1, lon1, lat2, lon2
+
+    @requires_numpy
+    def test_measure_many_matches_measure(self):
+        distance = self.cls()
+        lat1, lon1, lat2, lon2 = map(np.array, self._columns())
+        result = distance.measure_many(lat1, lon1, lat2, lon2)
+        self.assertEqual(result.dtype, np.float64)
+        self.assertEqual(result.shape, (len(self.pairs),))
+        for (a, b), km in zip(self.pairs, result):
+            self.assertAlmostEqual(km, distance.measure(a, b), delta=1e-9)
+
+    @requires_numpy
+    def test_measure_many_accepts_sequences_and_buffers(self):
+        distance = self.cls()
+        lat1, lon1, lat2, lon2 = self._columns()
+        expected = distance.measure_many(*map(np.array, self._columns()))
+        buffers = [array.array('d', column) for column in (lat1, lon1)]
+        result = distance.measure_many(*buffers, list(lat2), list(lon2))
+        np.testing.assert_array_equal(result, expected)
+
+    @requires_numpy
+    def test_measure_many_broadcasts(self):
+        distance = self.cls()
+        result = distance.measure_many(0, 0, np.zeros((2, 3)), np.arange(6).reshape(2, 3))
+        self.assertEqual(result.shape, (2, 3))
+        self.assertAlmostEqual(result[1, 2], distance.measure((0, 0), (0, 5)))
+
+    @requires_numpy
+    def test_measure_many_should_not_tolerate_nans(self):
+        with self.assertRaises(ValueError):
+            self.cls().measure_many([0, float('nan')], [0, 0], [1, 1], [1, 1])
+
+    @requires_numpy
+    def test_measure_many_should_warn_for_mixed_up_lat_lon(self):
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            with self.assertRaises(ValueError):
+                self.cls().measure_many([40, 120], [120, 40], [0, 0], [0, 0])
+            self.assertEqual(1, len(w))
+
+    @requires_numpy
+    def test_measure_many_different_altitudes_error(self):
+        distance = self.cls()
+        with self.assertRaises(ValueError):
+            distance.measure_many([10, 10], [10, 10], [20, 20], [20, 20],
+                                  alt1=[10, 10], alt2=[10, 15])
+        # Equal non-zero altitudes don't raise:
+        distance.measure_many([10, 10], [10, 10], [20, 20], [20, 20],
+                              alt1=10, alt2=[10, 10])
+
+    @requires_numpy
+    def test_destination_many_matches_destination(self):
+        distance = self.cls(kilometers=100)
+        points = [a for a, _ in self.pairs] + [NORTH_POLE, FIJI]
+        if not self.destination_crosses_poles:
+            points = [p for p in points if abs(Point(p).latitude) < 89]
+        bearings = np.array([0, 45, 90, -90, 180 + 360, 315.5])
+        lat, lon = distance.destination_many(
+            np.array([tuple(Point(p))[:2] for p in points])[:, None, :],
+            bearings
+        )
+        self.assertEqual(lat.shape, (len(points), len(bearings)))
+        for i, point in enumerate(points):
+            for j, bearing in enumerate(bearings):
+                expected = distance.destination(point, bearing)
+                self.assertAlmostEqual(lat[i, j], expected.latitude, delta=1e-9)
+                self.assertAlmostEqual(lon[i, j], expected.longitude, delta=1e-9)
+
+    @requires_numpy
+    def test_destination_many_distances(self):
+        distance = self.cls(kilometers=100)
+        lat, lon = distance.destination_many(
+            [(0, 160), (60, 160)], 90, distances=[100, 200]
+        )
+        expected = [
+            distance.destination((0, 160), 90),
+            distance.destination((60, 160), 90, distance=200),
+        ]
+        np.testing.assert_allclose(lat, [p.latitude for p in expected], atol=1e-9)
+        np.testing.assert_allclose(lon, [p.longitude for p in expected], atol=1e-9)
+
+        lat, lon = distance.destination_many((0, 160), 90, distances=self.cls(200))
+        expected = distance.destination((0, 160), 90, distance=200)
+        self.assertAlmostEqual(float(lon), expected.longitude, delta=1e-9)
+
+    @requires_numpy
+    def test_destination_many_single_point(self):
+        distance = self.cls(kilometers=10)
+        for point in (FIJI, (-16.1333333, 180.0), "16.1333333 S, 180 E"):
+            lat, lon = distance.destination_many(point, [45, 90])
+            self.assertEqual(lat.shape, (2,))
+            self.assertAlmostEqual(lon[0], distance.destination(FIJI, 45).longitude)
+
+    @requires_numpy
+    def test_within_matches_brute_force(self):
+        rng = np.random.default_rng(42)
+        candidates = np.column_stack([
+            np.degrees(np.arcsin(rng.uniform(-1, 1, 300))),
+            rng.uniform(-180, 180, 300),
+        ])
+        centers = [a for a, _ in self.pairs] + [(89.9, 10), (-60, -179.9)]
+        matrix = distance_matrix(centers, candidates, method=self.cls)
+        for center, row in zip(centers, matrix):
+            for radius in (0, 800, 5000, 15000, 21000):
+                result = within(center, candidates, radius, method=self.cls)
+                np.testing.assert_array_equal(result, np.flatnonzero(row <= radius))
+                mask = within(center, candidates, radius, method=self.cls, mask=True)
+                np.testing.assert_array_equal(mask, row <= radius)
+
+    @requires_numpy
+    def test_within_boundary(self):
+        center, point = (41.49008, -71.312796), (41.499498, -81.695391)
+        radius = self.cls(center, point)
+        self.assertEqual(within(center, [point], radius, method=self.cls), [0])
+        self.assertEqual(
+            len(within(center, [point], radius.km - 1e-9, method=self.cls)), 0
+        )
+        with self.assertRaises(ValueError):
+            within((0, 0, 1), [(0, 0, 2)], 10, method=self.cls)
+
+    @requires_numpy
+    def test_path_length_matches_distance(self):
+        track = [a for a, _ in self.pairs] + [b for _, b in self.pairs]
+        expected = self.cls(*track)
+        for chunk_size in (1, 2, 5, 100):
+            result = path_length(track, method=self.cls, chunk_size=chunk_size)
+            self.assertIsInstance(result, self.cls)
+            self.assertAlmostEqual(result.km, expected.km, delta=1e-6)
+
+    @requires_numpy
+    def test_cumulative_distances_chunks(self):
+        track = [a for a, _ in self.pairs]
+        chunks = list(cumulative_distances(track, method=self.cls(), chunk_size=3))
+        self.assertEqual([len(segments) for segments, _ in chunks], [3, 3, 1])
+        segments = np.concatenate([segments for segments, _ in chunks])
+        totals = np.concatenate([totals for _, totals in chunks])
+        expected = [0] + [self.cls(a, b).km for a, b in zip(track, track[1:])]
+        np.testing.assert_allclose(segments, expected, rtol=0, atol=1e-9)
+        np.testing.assert_allclose(totals, np.cumsum(expected), rtol=0, atol=1e-6)
+
+    @requires_numpy
+    def test_distance_matrix_matches_measure(self):
+        origins = [a for a, _ in self.pairs]
+        destinations = [Point(b) for _, b in self.pairs[:4]]
+        result = distance_matrix(origins, destinations, method=self.cls,
+                                 chunk_size=3)
+        self.assertEqual(result.shape, (len(origins), len(destinations)))
+        for i, a in enumerate(origins):
+            for j, b in enumerate(destinations):
+                self.assertAlmostEqual(result[i, j], self.cls(a, b).km, delta=1e-9)
+
+    @requires_numpy
+    def test_distance_matrix_symmetric(self):
+        points = np.array([a for a, _ in self.pairs] + [b for _, b in self.pairs])
+        full = distance_matrix(points, points.copy(), method=self.cls)
+        for chunk_size in (1, 3, 5, 100):
+            result = distance_matrix(points, method=self.cls(),
+                                     chunk_size=chunk_size)
+            np.testing.assert_array_equal(result, result.T)
+            np.testing.assert_allclose(result, full, rtol=0, atol=1e-9)
+
+    @requires_numpy
+    def test_distance_matrix_empty(self):
+        result = distance_matrix([], [(0, 0)], method=self.cls)
+        self.assertEqual(result.shape, (0, 1))
+
+    @requires_numpy
+    def test_distance_matrix_errors(self):
+        with self.assertRaises(ValueError):
+            distance_matrix(np.zeros((3, 4)), method=self.cls)
+        with self.assertRaises(ValueError):
+            distance_matrix([(0, 0, 1)], [(1, 1, 1), (2, 2, 2)], method=self.cls)
+        with self.assertRaises(ValueError):
+            distance_matrix([(0, 0)], method=self.cls, chunk_size=0)
+        with self.assertRaises(TypeError):
+            distance_matrix([(0, 0)], method=Point)
+
+
+class CommonInverseCases:
+
+    cls = None
+
+    legs = [
+        ((41.49008, -71.312796), (41.499498, -81.695391)),
+        ((10, 20), (40, 60)),
+        ((0, -179.5), (0, 179.5)),
+        ((-60, 10), (70, -150)),
+        ((-16.1333333, 180.0), (-16.2, 540.5)),
+    ]
+
+    def test_inverse(self):
+        distance = self.cls()
+        for a, b in self.legs:
+            km, azi1, azi2 = distance.inverse(a, b)
+            self.assertAlmostEqual(km, distance.measure(a, b), delta=1e-9)
+            self.assertTrue(-180 <= azi1 <= 180 and -180 <= azi2 <= 180)
+
+            # Travel forward from `a` and backward from `b`.
+            end = self.cls(km).destination(a, azi1)
+            self.assertAlmostEqual(self.cls(end, b).km, 0, delta=1e-6)
+            start = self.cls(km).destination(b, azi2 + 180)
+            self.assertAlmostEqual(self.cls(start, a).km, 0, delta=1e-6)
+
+    def test_inverse_cardinal_directions(self):
+        distance = self.cls()
+        self.assertEqual(distance.inverse((0, 0), (0, 1))[1:], (90, 90))
+        self.assertEqual(distance.inverse((0, 0), (1, 0))[1:], (0, 0))
+        self.assertEqual(distance.inverse((1, 0), (0, 0))[1:], (180, 180))
+
+    def test_inverse_different_altitudes_error(self):
+        with self.assertRaises(ValueError):
+            self.cls().inverse((10, 10, 10), (20, 20, 15))
+
+    @requires_numpy
+    def test_inverse_many_matches_inverse(self):
+        distance = self.cls()
+        lat1, lon1 = np.array([a for a, _ in self.legs]).T
+        lat2, lon2 = np.array([b for _, b in self.legs]).T
+        result = distance.inverse_many(lat1, lon1, lat2, lon2)
+        self.assertEqual(len(result), 3)
+        for i, (a, b) in enumerate(self.legs):
+            expected = distance.inverse(a, b)
+            for values, value in zip(result, expected):
+                self.assertEqual(values.shape, (len(self.legs),))
+                self.assertAlmostEqual(values[i], value, delta=1e-9)
+
+        distances, azi1, azi2 = distance.inverse_many(0, 0, [[0], [1]], [[1], [0]])
+        self.assertEqual(azi1.shape, (2, 1))
+        np.testing.assert_allclose(azi1, [[90], [0]], atol=1e-12)
+
 
 class CommonMathematicalOperatorCases:
 
@@ -283,6 +587,8 @@ class CommonComparisonCases:
 
 
 class CommonDistanceCases(CommonDistanceComputationCases,
+                          CommonBatchDistanceCases,
+                          CommonInverseCases,
                           CommonMathematicalOperatorCases,
                           CommonConversionCases,
                           CommonComparisonCases):
@@ -340,6 +646,131 @@ class TestWhenComputingGeodesicDistance(CommonDistanceCases,
         # Equal non-zero altitudes don't raise:
         self.cls((10, 10, 10), (20, 20, 10))
 
+    def test_geod_is_shared(self):
+        d1, d2 = self.cls(), self.cls()
+        self.assertIs(d1._get_geod(), d2._get_geod())
+        d3 = self.cls(ellipsoid='GRS-80')
+        self.assertIsNot(d1._get_geod(), d3._get_geod())
+        d1.set_ellipsoid('GRS-80')
+        self.assertIs(d1._get_geod(), d3._get_geod())
+        self.assertEqual(d1.measure((10, 20), (30, 40)),
+                         d3.measure((10, 20), (30, 40)))
+
+    def test_inverse_same_as_geographiclib(self):
+        a, b = (41.49008, -71.312796), (41.499498, -81.695391)
+        r = Geodesic(*ELLIPSOIDS['GRS-80'][::2]).Inverse(*a, *b)
+        self.assertEqual(
+            self.cls(ellipsoid='GRS-80').inverse(a, b),
+            (r['s12'], r['azi1'], r['azi2'])
+        )
+
+    @requires_numpy
+    def test_interpolate(self):
+        d = self.cls(ellipsoid='GRS-80')
+        a, b = (41.49008, -71.312796), (-33.8688, 151.2093)
+        lat, lon = d.interpolate(a, b, 5)
+        self.assertEqual((lat[0], lon[0]), a)
+        self.assertEqual((lat[-1], lon[-1]), b)
+        s12, azi1, _ = d.inverse(a, b)
+        for i in range(1, 4):
+            expected = d.destination(a, azi1, s12 * i / 4)
+            self.assertAlmostEqual(lat[i], expected.latitude, delta=1e-9)
+            self.assertAlmostEqual(lon[i], expected.longitude, delta=1e-9)
+
+        lat, lon = d.interpolate((10, 10, 5), (10, 10, 5), 3)
+        np.testing.assert_array_equal(lat, [10, 10, 10])
+        np.testing.assert_array_equal(lon, [10, 10, 10])
+
+        with self.assertRaises(ValueError):
+            d.interpolate(a, b, 1)
+        with self.assertRaises(ValueError):
+            d.interpolate((10, 10, 10), (20, 20, 15), 3)
+
+    @requires_numpy
+    def test_densify(self):
+        d = self.cls()
+        path = [(10, 170), (10, -175), (11, -175), (30, -150)]
+        lat, lon = d.densify(PointArray.from_points(path), 100)
+        self.assertTrue(((-180 <= lon) & (lon <= 180)).all())
+        segments = d.measure_many(lat[:-1], lon[:-1], lat[1:], lon[1:])
+        self.assertLessEqual(segments.max(), 100)
+        # Every segment is split into the minimal number of parts.
+        self.assertEqual(
+            len(lat) - 1,
+            sum(math.ceil(d.measure(a, b) / 100) for a, b in zip(path, path[1:]))
+        )
+        vertices = list(zip(lat.tolist(), lon.tolist()))
+        positions = [vertices.index(p) for p in path]
+        self.assertEqual(positions, sorted(positions))
+        self.assertAlmostEqual(
+            segments.sum(), d.measure_many(*np.array(path[:-1]).T,
+                                           *np.array(path[1:]).T).sum(),
+            delta=1e-6
+        )
+
+        lat, lon = d.densify(np.array(path), self.cls(kilometers=1e5))
+        np.testing.assert_array_equal(np.stack([lat, lon], axis=1), path)
+        for path in ([], [(10, 20)]):
+            lat, lon = d.densify(path, 1)
+            self.assertEqual(len(lat), len(path))
+
+        with self.assertRaises(ValueError):
+            d.densify(path, 0)
+        with self.assertRaises(ValueError):
+            d.densify([(10, 10, 10), (20, 20, 15)], 100)
+
+    def test_polygon_area(self):
+        square = [(0, 0), (0, 1), (1, 1), (1, 0)]
+        area, perimeter = self.cls(ellipsoid='GRS-80').polygon_area(square)
+        polygon = PolygonArea(Geodesic(*ELLIPSOIDS['GRS-80'][::2]))
+        for point in square:
+            polygon.AddPoint(*point)
+        _, expected_perimeter, expected_area = polygon.Compute()
+        self.assertEqual((area, perimeter), (expected_area, expected_perimeter))
+
+        d = self.cls()
+        closed = d.polygon_area(square + square[:1])
+        self.assertAlmostEqual(closed[0], d.polygon_area(square)[0], delta=1e-6)
+        self.assertAlmostEqual(closed[1], d.polygon_area(square)[1], delta=1e-9)
+        clockwise = square[::-1]
+        self.assertEqual(d.polygon_area(clockwise), d.polygon_area(square))
+        self.assertEqual(d.polygon_area(clockwise, signed=True)[0],
+                         -d.polygon_area(square)[0])
+
+    @requires_numpy
+    def test_polygon_area_many(self):
+        d = self.cls(ellipsoid='Intl 1924')
+        polygons = [
+            [(0, 0), (0, 1), (1, 1), (1, 0)],
+            [],
+            [(10, 179.5), (10, -179.5), (11, -179.5)][::-1],
+            [(-89, 0), (-89, 120), (-89, -120)],
+        ]
+        offsets = np.cumsum([0] + [len(p) for p in polygons])
+        coordinates = np.array([c for p in polygons for c in p])
+        for signed in (False, True):
+            expected = np.array([d.polygon_area(p, signed=signed) for p in polygons])
+            for buffer in (coordinates, coordinates.ravel().tolist(),
+                           array.array('d', coordinates.ravel()),
+                           PointArray(*coordinates.T)):
+                areas, perimeters = d.polygon_area_many(buffer, offsets,
+                                                        signed=signed)
+                np.testing.assert_array_equal(areas, expected[:, 0])
+                np.testing.assert_array_equal(perimeters, expected[:, 1])
+        self.assertLess(d.polygon_area_many(coordinates, offsets, signed=True)[0][2], 0)
+
+        areas, perimeters = d.polygon_area_many(coordinates, [0])
+        self.assertEqual((len(areas), len(perimeters)), (0, 0))
+
+        for offsets in ([], [[0, 4]], [0, 4, 3], [-1, 4], [0, 20]):
+            with self.assertRaises(ValueError):
+                d.polygon_area_many(coordinates, offsets)
+        with self.assertRaises(TypeError):
+            d.polygon_area_many(coordinates, [0.0, 4.0])
+        for coordinates in ([1, 2, 3], np.zeros((4, 3))):
+            with self.assertRaises(ValueError):
+                d.polygon_area_many(coordinates, [0, 1])
+
     def test_miscellaneous_high_accuracy_cases(self):
 
         testcases = [
@@ -418,6 +849,116 @@ class TestWhenComputingGeodesicDistance(CommonDistanceCases,
             self.assertAlmostEqual(p.longitude, p1.longitude, delta=1e-12)
 
 
+class CommonApproximateDistanceCases(CommonBatchDistanceCases,
+                                     CommonMathematicalOperatorCases,
+                                     CommonConversionCases,
+                                     CommonComparisonCases):
+
+    destination_crosses_poles = False
+
+    # Maximum relative error vs geodesic for the distances of
+    # `test_error_vs_geodesic`.
+    max_errors = {}
+
+    def test_should_have_zero_distance_for_coincident_points(self):
+        self.assertEqual(self.cls((0, 0), (0, 0)).kilometers, 0)
+        self.assertEqual(self.cls((10, 20), (10, 20)).kilometers, 0)
+
+    def test_should_compute_distance_across_antimeridian(self):
+        distance = self.cls((10, -179.95), (10, 179.95)).kilometers
+        self.assertAlmostEqual(distance, GeodesicDistance((10, 0), (10, 0.1)).km,
+                               delta=0.1)
+
+    def test_different_altitudes_error(self):
+        with self.assertRaises(ValueError):
+            self.cls((10, 10, 10), (20, 20, 15))
+        self.cls((10, 10, 10), (20, 20, 10))
+
+    def test_error_vs_geodesic(self):
+        geodesic = GeodesicDistance()
+        approximate = self.cls()
+        for km, max_error in self.max_errors.items():
+            for start in [(0, 0), (41.49, -71.31), (-60.5, 170.2), (69.9, 20)]:
+                for bearing in range(0, 360, 30):
+                    end = geodesic.destination(start, bearing, km)
+                    error = abs(approximate.measure(start, end) - km) / km
+                    self.assertLess(error, max_error, (start, end))
+
+    def test_destination_round_trip(self):
+        distance = self.cls(kilometers=50)
+        for start in [(0, 0), (41.49, -71.31), (-60.5, 179.9)]:
+            for bearing in range(0, 360, 45):
+                end = distance.destination(start, bearing)
+                self.assertAlmostEqual(self.cls(start, end).km, 50, delta=1e-3)
+
+    @requires_numpy
+    def test_within_measures_all_candidates(self):
+        candidates = [(0, 0.5), (0, 1.5), (0, -179.5), (1, 0)]
+        expected = [i for i, point in enumerate(candidates)
+                    if self.cls((0, 0), point).km <= 120]
+        result = within((0, 0), candidates, 120, method=self.cls)
+        np.testing.assert_array_equal(result, expected)
+
+
+class TestWhenComputingEquirectangularDistance(CommonApproximateDistanceCases,
+                                               unittest.TestCase):
+    cls = equirectangular
+    max_errors = {1: 0.006, 100: 0.006, 1000: 0.01}
+
+    def test_radius(self):
+        distance = self.cls((0, 0), (0, 1), radius=1)
+        self.assertAlmostEqual(distance.km, math.radians(1))
+
+
+class TestWhenComputingLocalProjectionDistance(CommonApproximateDistanceCases,
+                                               unittest.TestCase):
+    cls = local_projection
+    max_errors = {1: 1e-8, 10: 1e-6, 100: 1e-4, 1000: 0.015}
+
+    def test_reference_latitude(self):
+        a, b = (52.5163, 13.3777), (52.5096, 13.3761)
+        distance = self.cls(a, b, reference_latitude=52.5)
+        self.assertAlmostEqual(distance.km, GeodesicDistance(a, b).km, delta=1e-5)
+        self.assertEqual(
+            self.cls(reference_latitude=52.5).destination(a, 90, 10),
+            self.cls(reference_latitude=52.5).destination(a, 90, 10),
+        )
+
+    def test_ellipsoid(self):
+        a, b = (52.5163, 13.3777), (52.5096, 13.3761)
+        distance = self.cls(a, b, ellipsoid='GRS-80')
+        expected = GeodesicDistance(a, b, ellipsoid='GRS-80')
+        self.assertAlmostEqual(distance.km, expected.km, delta=1e-6)
+
+
+class TestWhenComputingAndoyerLambertDistance(CommonApproximateDistanceCases,
+                                              unittest.TestCase):
+    cls = andoyer_lambert
+    max_errors = {1: 2e-6, 1000: 2e-6, 5000: 2e-6, 15000: 5e-6}
+
+    def test_nearly_antipodal_points(self):
+        for a, b in [((0, 0), (0, 180)), ((10, 20), (-10, -160)),
+                     ((30, 0), (-29.9, 179.8))]:
+            self.assertAlmostEqual(
+                self.cls(a, b).km, GeodesicDistance(a, b).km, delta=0.5
+            )
+
+    @requires_numpy
+    def test_measure_many_nearly_antipodal_points(self):
+        columns = [0, 10, 0], [0, 20, 0], [0, -10, 0], [180, -160, 0]
+        result = self.cls().measure_many(*columns)
+        expected = GeodesicDistance().measure_many(*columns)
+        np.testing.assert_allclose(result, expected, rtol=0, atol=1e-9)
+
+    def test_destination_is_exact(self):
+        start, end = (41.49008, -71.312796), (41.499498, -81.695391)
+        geodesic = GeodesicDistance(start, end)
+        self.assertEqual(
+            self.cls(geodesic.km).destination(start, 270),
+            geodesic.destination(start, 270),
+        )
+
+
 def test_distance_hashing():
     d1 = Distance(1.0)
     d2 = GreatCircleDistance(1.0)
@@ -425,3 +966,554 @@ def test_distance_hashing():
     assert d1 == d2 == d3
     assert hash(d1) == hash(d2) == hash(d3)
     assert len({d1, d2, d3}) == 1
+
+
+@requires_numpy
+def test_point_array_arguments():
+    points = [(41.49008, -71.312796), (41.499498, -81.695391), (40.7128, -74.006)]
+    point_array = PointArray.from_points(points)
+    np.testing.assert_array_equal(
+        distance_matrix(point_array), distance_matrix(np.array(points))
+    )
+    np.testing.assert_array_equal(
+        within((42.3601, -71.0589), point_array[1:], 800), [1]
+    )
+    lat, lon = GeodesicDistance(10).destination_many(point_array, 90)
+    assert lat.shape == (3,)
+
+
+@requires_numpy
+def test_path_length_inputs(tmp_path):
+    track = [(41.49008, -71.312796), (41.499498, -81.695391),
+             (40.7128, -74.006), (42.3601, -71.0589)]
+    expected = GeodesicDistance(*track).km
+
+    path = tmp_path / "track.csv"
+    path.write_text("".join("%r,%r\n" % fix for fix in track))
+    with open(str(path)) as f:
+        assert path_length(csv.reader(f), chunk_size=3).km == pytest.approx(expected)
+    with open(str(path)) as f:
+        assert path_length(f, chunk_size=3).km == pytest.approx(expected)
+
+    for points in (
+        iter(track),
+        [Point(fix) for fix in track],
+        [fix + (0,) for fix in track[:2]] + track[2:],
+        np.array(track),
+        PointArray.from_points(track),
+    ):
+        assert path_length(points, chunk_size=3).km == pytest.approx(expected)
+
+
+@requires_numpy
+def test_cumulative_distances_is_lazy():
+    def fixes():
+        for i in itertools.count():
+            yield (0, i % 360)
+
+    chunks = cumulative_distances(fixes(), method=GreatCircleDistance, chunk_size=4)
+    segments, totals = next(chunks)
+    segments, totals = next(chunks)
+    assert totals[-1] == pytest.approx(GreatCircleDistance((0, 0), (0, 7)).km)
+
+
+@requires_numpy
+def test_path_length_edge_cases():
+    assert path_length([]).km == 0
+    assert path_length([(10, 20)]).km == 0
+    (segments, totals), = cumulative_distances([(10, 20)])
+    assert segments.tolist() == totals.tolist() == [0.0]
+    assert path_length([(10, 20, 1), (11, 20, 1)]).km > 0
+    with pytest.raises(ValueError):
+        path_length([(10, 20, 1), (11, 20, 1), (11, 21, 2)], chunk_size=2)
+    with pytest.raises(ValueError):
+        path_length([(10, 20)], chunk_size=0)
+    with pytest.warns(UserWarning), pytest.raises(ValueError):
+        path_length([(10, 20), (95, 20)])
+
+
+def _noisy_track(n=200, seed=1):
+    # A wiggly track of about 1000 km with a few sharp turns.
+    rng = np.random.default_rng(seed)
+    headings = np.repeat(rng.uniform(0, 360, 8), n // 8)
+    headings += rng.normal(0, 3, len(headings))
+    lat, lon = [40.0], [-100.0]
+    for heading in headings[1:]:
+        point = GeodesicDistance(kilometers=5).destination((lat[-1], lon[-1]), heading)
+        lat.append(point.latitude)
+        lon.append(point.longitude)
+    return np.stack([lat, lon], axis=1)
+
+
+def _deviation(point, a, b):
+    # Distance from the point to the geodesic segment a-b, found with
+    # a golden section search along the segment.
+    geod = Geodesic.WGS84
+    line = geod.InverseLine(a[0], a[1], b[0], b[1])
+
+    def distance(s):
+        r = line.Position(s)
+        return geod.Inverse(r['lat2'], r['lon2'], point[0], point[1])['s12'] / 1000
+
+    lo, hi = 0, line.s13
+    ratio = (math.sqrt(5) - 1) / 2
+    while hi - lo > 1:
+        x1, x2 = hi - ratio * (hi - lo), lo + ratio * (hi - lo)
+        if distance(x1) < distance(x2):
+            hi = x2
+        else:
+            lo = x1
+    return min(distance(lo), distance(hi))
+
+
+@requires_numpy
+@pytest.mark.parametrize("method", [GeodesicDistance, GreatCircleDistance])
+def test_simplify_douglas_peucker_tolerance(method):
+    track = _noisy_track()
+    tolerance = 2
+    kept = simplify(track, tolerance, method=method)
+    assert kept[0] == 0 and kept[-1] == len(track) - 1
+    assert (np.diff(kept) > 0).all()
+    assert len(kept) < len(track) / 4
+    # Spherical distances are up to 0.5% off the geodesic ones.
+    slack = 1.01 if method is GreatCircleDistance else 1.001
+    for start, end in zip(kept, kept[1:]):
+        for i in range(start + 1, end, 7):
+            assert _deviation(track[i], track[start], track[end]) <= tolerance * slack
+
+
+@requires_numpy
+def test_simplify_cross_track_accuracy():
+    d = GeodesicDistance()
+    a, b = (50, 10), (52, 14)
+    s12, azi1, _ = d.inverse(a, b)
+    lat, lon = d.interpolate(a, b, 3)
+    azi_middle = d.inverse((lat[1], lon[1]), b)[1]
+    for offset in (0.01, 5, 30):
+        bump = d.destination((lat[1], lon[1]), azi_middle - 90, offset)
+        track = [a, bump, b]
+        assert simplify(track, offset * 0.999).tolist() == [0, 1, 2]
+        assert simplify(track, offset * 1.001).tolist() == [0, 2]
+    # Points beyond the ends of a segment deviate by the distance to the end.
+    track = [a, d.destination(a, azi1 + 180, 10), b]
+    assert simplify(track, 9.99).tolist() == [0, 1, 2]
+    assert simplify(track, 10.01).tolist() == [0, 2]
+    track = [a, d.destination(b, d.inverse(a, b)[2], 10), b]
+    assert simplify(track, 9.99).tolist() == [0, 1, 2]
+    # A closed loop: the deviation from a zero-length segment.
+    track = [a, d.destination(a, 30, 10), a]
+    assert simplify(track, 9.99).tolist() == [0, 1, 2]
+    assert simplify(track, 10.01).tolist() == [0, 2]
+
+
+@requires_numpy
+def test_simplify_visvalingam():
+    track = _noisy_track(seed=2)
+    kept = simplify(track, 2, algorithm='visvalingam')
+    assert kept[0] == 0 and kept[-1] == len(track) - 1
+    assert (np.diff(kept) > 0).all()
+    assert len(kept) < len(track) / 4
+    # Every kept point deviates from its neighbours more than the tolerance.
+    for before, i, after in zip(kept, kept[1:], kept[2:]):
+        assert _deviation(track[i], track[before], track[after]) > 2 * 0.999
+    assert simplify(track, 0, algorithm='visvalingam').tolist() == list(
+        range(len(track))
+    )
+    assert len(simplify(track, 1e5, algorithm='visvalingam')) == 2
+
+
+@requires_numpy
+def test_simplify_inputs():
+    track = _noisy_track(n=80)
+    expected = simplify(track, 1).tolist()
+    assert simplify(PointArray(*track.T), 1).tolist() == expected
+    assert simplify(map(tuple, track), 1).tolist() == expected
+    assert simplify(track, GeodesicDistance(meters=1000)).tolist() == expected
+    assert simplify(track, 1, method=local_projection()).tolist() == expected
+    assert simplify([], 1).tolist() == []
+    assert simplify([(10, 20)], 1).tolist() == [0]
+    assert simplify([(10, 20, 1), (11, 20, 1), (12, 20, 1)], 1).tolist() == [0, 2]
+
+    with pytest.raises(ValueError):
+        simplify(track, -1)
+    with pytest.raises(ValueError):
+        simplify(track, 1, algorithm='radial')
+    with pytest.raises(TypeError):
+        simplify(track, 1, method=equirectangular)
+    with pytest.raises(ValueError):
+        simplify([(10, 20, 1), (11, 20, 1), (12, 20, 2)], 1)
+
+
+@requires_numpy
+@pytest.mark.parametrize("algorithm", ["douglas-peucker", "visvalingam"])
+def test_simplify_stream(algorithm):
+    track = _noisy_track()
+    expected = simplify(track, 2, algorithm=algorithm)
+    (indices, lat, lon), = simplify_stream(track, 2, algorithm=algorithm)
+    assert indices.tolist() == expected.tolist()
+
+    chunk_size = 48
+    chunks = list(simplify_stream(iter(track.tolist()), 2, algorithm=algorithm,
+                                  chunk_size=chunk_size))
+    assert len(chunks) == math.ceil(len(track) / chunk_size)
+    indices, lat, lon = (np.concatenate(arrays) for arrays in zip(*chunks))
+    np.testing.assert_array_equal(np.stack([lat, lon], axis=1), track[indices])
+    assert (np.diff(indices) > 0).all()
+    assert indices[-1] == len(track) - 1
+    # The chunks are joined at their last points.
+    ends = np.arange(chunk_size - 1, len(track), chunk_size)
+    assert np.isin(ends, indices).all()
+
+    assert list(simplify_stream([], 2)) == []
+    with pytest.raises(ValueError):
+        list(simplify_stream(track, 2, chunk_size=0))
+    with pytest.raises(ValueError):
+        list(simplify_stream(track, 2, chunk_size=1))
+
+
+@requires_numpy
+@pytest.mark.parametrize("algorithm", ["douglas-peucker", "visvalingam"])
+def test_simplify_stream_small_chunks(algorithm):
+    track = [(0, 0.01 * i) for i in range(9)]  # a straight line
+    chunks = list(simplify_stream(track, 1, algorithm=algorithm, chunk_size=2))
+    assert all(len(indices) for indices, _, _ in chunks)
+    indices = np.concatenate([indices for indices, _, _ in chunks])
+    assert indices.tolist() == [0, 1, 3, 5, 7, 8]
+
+
+def test_distance_cache_hits_and_keys():
+    cache = DistanceCache(GreatCircleDistance, precision=3)
+    a, b = (41.49008, -71.312796), (41.499498, -81.695391)
+    expected = GreatCircleDistance().measure((41.49, -71.313), (41.499, -81.695))
+    assert cache.measure(a, b) == expected
+    assert cache.measure(b, a) == expected
+    assert cache.measure((41.4901, -71.3128), b) == expected
+    assert cache.measure(Point(a), "41.499498, -81.695391") == expected
+    assert cache.measure((41.49008, 288.687204), b) == expected
+    assert cache.cache_info() == (4, 1, 65536, 1)
+    assert cache(a, b, a) == GreatCircleDistance(2 * expected)
+    assert isinstance(cache(a, b), GreatCircleDistance)
+    assert cache.hits == 7
+
+    asymmetric = DistanceCache(GreatCircleDistance, symmetric=False)
+    asymmetric.measure(a, b)
+    asymmetric.measure(b, a)
+    assert asymmetric.cache_info() == (0, 2, 65536, 2)
+
+    cache.cache_clear()
+    assert cache.cache_info() == (0, 0, 65536, 0)
+
+    with pytest.raises(ValueError):
+        cache.measure((10, 20, 1), (11, 20, 2))
+    with pytest.raises(ValueError):
+        DistanceCache(maxsize=0)
+    with pytest.raises(TypeError):
+        DistanceCache(method=len)
+
+
+def test_distance_cache_lru():
+    cache = DistanceCache(maxsize=2)
+    a, b, c, d = (10, 20), (11, 20), (12, 20), (13, 20)
+    cache.measure(a, b)
+    cache.measure(a, c)
+    cache.measure(a, b)  # `a, c` is now the least recently used
+    cache.measure(a, d)
+    assert cache.cache_info() == (1, 3, 2, 2)
+    cache.measure(a, b)
+    assert cache.hits == 2
+    cache.measure(a, c)
+    assert cache.misses == 4
+
+
+def test_distance_cache_model_in_key():
+    method = GeodesicDistance()
+    cache = DistanceCache(method)
+    a, b = (41.49008, -71.312796), (41.499498, -81.695391)
+    assert cache.measure(a, b) == GeodesicDistance(a, b).km
+    method.set_ellipsoid('Intl 1924')
+    assert cache.measure(a, b) == GeodesicDistance(a, b, ellipsoid='Intl 1924').km
+    method.set_ellipsoid([6377., 6356., 1 / 297.])
+    cache.measure(a, b)
+    assert cache.cache_info() == (0, 3, 65536, 3)
+
+
+def test_distance_cache_threads():
+    cache = DistanceCache(maxsize=50)
+    pairs = [((i % 60, 0), (i % 60, 1)) for i in range(600)]
+    expected = [GeodesicDistance(a, b).km for a, b in pairs]
+    results = [None] * 4
+
+    def worker(n):
+        results[n] = [cache.measure(a, b) for a, b in pairs]
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [expected] * 4
+    info = cache.cache_info()
+    assert info.hits + info.misses == 2400
+    assert info.currsize == 50
+
+
+@requires_numpy
+def test_distance_array_units_match_distance():
+    values = [0, 1.5, 866.4554329098685, 12345.678]
+    distances = DistanceArray(values)
+    for unit in ['kilometers', 'km', 'meters', 'm', 'miles', 'mi',
+                 'feet', 'ft', 'nautical', 'nm']:
+        expected = [getattr(Distance(x), unit) for x in values]
+        assert getattr(distances, unit).tolist() == expected, unit
+    for unit in ['meters', 'miles', 'feet', 'nautical']:
+        expected = [Distance(**{unit: x}).km for x in values]
+        assert DistanceArray(**{unit: values}).km.tolist() == expected, unit
+    mixed = DistanceArray(values, miles=1, meters=np.array(values))
+    assert mixed.km.tolist() == [
+        Distance(x, miles=1, meters=x).km for x in values
+    ]
+
+    assert DistanceArray([Distance(1), GeodesicDistance(2), 3]).km.tolist() == [1, 2, 3]
+    assert DistanceArray(distances) is not distances
+    assert DistanceArray(5.0).shape == ()
+    with pytest.raises(TypeError):
+        DistanceArray(values, furlongs=1)
+
+
+@requires_numpy
+def test_distance_array_is_immutable_view():
+    kilometers = np.array([1.0, 2.0])
+    distances = DistanceArray(kilometers)
+    assert np.shares_memory(distances.km, kilometers)
+    with pytest.raises(ValueError):
+        distances.km[0] = 5
+    kilometers[0] = 5  # The caller's array stays writable.
+    assert distances[0] == Distance(5)
+
+
+@requires_numpy
+def test_distance_array_arithmetic():
+    a = DistanceArray([1.0, 2.0, 4.0])
+    b = DistanceArray([0.5, 1.0, 1.0])
+    assert (a + b).km.tolist() == [1.5, 3.0, 5.0]
+    assert (a - b).km.tolist() == [0.5, 1.0, 3.0]
+    assert (a + Distance(1)).km.tolist() == [2.0, 3.0, 5.0]
+    assert (a - GreatCircleDistance(1)).km.tolist() == [0.0, 1.0, 3.0]
+    assert (-a).km.tolist() == [-1.0, -2.0, -4.0]
+    assert abs(-a).km.tolist() == [1.0, 2.0, 4.0]
+    assert (a * 2).km.tolist() == [2.0, 4.0, 8.0]
+    assert (2 * a).km.tolist() == [2.0, 4.0, 8.0]
+    assert (np.float64(2) * a).km.tolist() == [2.0, 4.0, 8.0]
+    assert (a * np.array([1, 0, 2])).km.tolist() == [1.0, 0.0, 8.0]
+    assert (a / 2).km.tolist() == [0.5, 1.0, 2.0]
+    assert (a // 3).km.tolist() == [0.0, 0.0, 1.0]
+    ratio = a / b
+    assert isinstance(ratio, np.ndarray) and ratio.tolist() == [2.0, 2.0, 4.0]
+    assert (a / Distance(2)).tolist() == [0.5, 1.0, 2.0]
+    assert (a // Distance(1.5)).tolist() == [0.0, 1.0, 2.0]
+
+    with pytest.raises(TypeError):
+        a + 1
+    with pytest.raises(TypeError):
+        1 - a
+    with pytest.raises(TypeError):
+        np.array([1.0, 2.0, 3.0]) + a
+    with pytest.raises(TypeError):
+        a * b
+    with pytest.raises(TypeError):
+        Distance(2) * a
+
+
+@requires_numpy
+def test_distance_array_reflected_operations():
+    a = DistanceArray([1.0, 2.0, 4.0])
+    assert (Distance(1) + a).km.tolist() == [2.0, 3.0, 5.0]
+    assert (Distance(5) - a).km.tolist() == [4.0, 3.0, 1.0]
+    assert (GreatCircleDistance(5) - a).km.tolist() == [4.0, 3.0, 1.0]
+    total = sum([a, a], Distance(0))
+    assert isinstance(total, DistanceArray)
+    assert total.km.tolist() == [2.0, 4.0, 8.0]
+    assert (Distance(4) / a).tolist() == [4.0, 2.0, 1.0]
+    assert (Distance(4) // a).tolist() == [4.0, 2.0, 1.0]
+
+    assert (Distance(2) < a).tolist() == [False, False, True]
+    assert (Distance(2) <= a).tolist() == [False, True, True]
+    assert (Distance(2) > a).tolist() == [True, False, False]
+    assert (Distance(2) >= a).tolist() == [True, True, False]
+    assert (Distance(2) == a).tolist() == [False, True, False]
+    assert (Distance(2) != a).tolist() == [True, False, True]
+
+    with pytest.raises(TypeError):
+        a * Distance(2)
+    with pytest.raises(TypeError):
+        2 / a
+    with pytest.raises(TypeError):
+        Distance(1) + 1
+
+
+@requires_numpy
+def test_distance_array_comparisons_and_reductions():
+    distances = DistanceArray([3.0, 1.0, 2.0])
+    assert (distances < Distance(2.5)).tolist() == [False, True, True]
+    assert (distances >= 2).tolist() == [True, False, True]
+    assert (distances == DistanceArray([3.0, 0.0, 2.0])).tolist() == [True, False, True]
+    assert (distances != Distance(1)).tolist() == [True, False, True]
+    assert (distances > np.array([1, 1, 3])).tolist() == [True, False, False]
+    assert (distances <= Distance(1)).tolist() == [False, True, False]
+    assert distances[distances > 1.5].km.tolist() == [3.0, 2.0]
+
+    assert distances.sum() == Distance(6)
+    assert isinstance(distances.sum(), Distance)
+    assert distances.min() == Distance(1)
+    assert distances.max() == Distance(3)
+    assert distances.argmin() == 1
+    assert distances.argmax() == 0
+    assert type(distances.argmin()) is int
+
+    matrix = DistanceArray([[1.0, 5.0], [4.0, 2.0]])
+    assert matrix.sum(axis=0).km.tolist() == [5.0, 7.0]
+    assert matrix.min(axis=1).km.tolist() == [1.0, 2.0]
+    assert matrix.argmin(axis=1).tolist() == [0, 1]
+    assert matrix[1].km.tolist() == [4.0, 2.0]
+    assert matrix[1, 0] == Distance(4)
+
+
+@requires_numpy
+def test_distance_array_sequence_protocol():
+    distances = DistanceArray([3.0, 1.0])
+    assert len(distances) == 2
+    assert list(distances) == [Distance(3), Distance(1)]
+    assert distances[-1] == Distance(1)
+    assert distances[:1].km.tolist() == [3.0]
+    assert np.asarray(distances) is distances.km
+    assert np.array(distances, dtype=np.float32).dtype == np.float32
+    assert repr(distances) == 'DistanceArray([3., 1.])'
+    assert str(distances) == '[3. 1.] km'
+    with pytest.raises(TypeError):
+        hash(distances)
+    with pytest.raises(TypeError, match='unsized'):
+        len(DistanceArray(5))
+
+
+@requires_numpy
+def test_distance_matrix_out():
+    points = [(10, 20), (40, 60), (0, 80), (0, 10)]
+    out = np.zeros((4, 4), dtype=np.float32)
+    result = distance_matrix(points, out=out, chunk_size=3)
+    assert result is out
+    np.testing.assert_allclose(out, distance_matrix(points), rtol=1e-6)
+    with pytest.raises(ValueError):
+        distance_matrix(points, out=np.zeros((4, 3)))
+
+
+@requires_numpy
+def test_write_distance_matrix(tmp_path):
+    path = str(tmp_path / "matrix.npy")
+    origins = [(10, 20), (40, 60), (0, 80)]
+    destinations = [(0, 10), (-10, -20)]
+    written = write_distance_matrix(path, origins, destinations, chunk_size=2)
+    del written
+    matrix = np.load(path, mmap_mode='r')
+    assert isinstance(matrix, np.memmap)
+    assert matrix.dtype == np.float64
+    np.testing.assert_array_equal(matrix, distance_matrix(origins, destinations))
+
+    with pytest.raises(ValueError):
+        # Shape mismatch
+        write_distance_matrix(path, origins)
+    with pytest.raises(ValueError):
+        # dtype mismatch
+        write_distance_matrix(path, origins, destinations, dtype='float32')
+
+
+@requires_numpy
+def test_write_distance_matrix_resume(tmp_path):
+    path = str(tmp_path / "matrix.npy")
+    points = np.array([(10, 20), (40, 60), (0, 80), (0, 10), (-10, -20)])
+    expected = distance_matrix(points)
+
+    # Simulate an interrupted run: the first row of tiles is done
+    # (marked with -1 to make sure that it is not computed again),
+    # the rest is still NaN.
+    write_distance_matrix(path, points, dtype='float32')
+    partial = np.full((5, 5), np.nan, dtype=np.float32)
+    partial[:2, :] = partial[:, :2] = -1
+    np.save(path, partial)
+
+    matrix = write_distance_matrix(path, points, chunk_size=2, dtype='float32')
+    assert (matrix[:2, :] == -1).all()
+    assert (matrix[:, :2] == -1).all()
+    np.testing.assert_allclose(matrix[2:, 2:], expected[2:, 2:], rtol=1e-6)
+
+
+@requires_numpy
+def test_write_distance_matrix_resume_other_inputs(tmp_path):
+    path = str(tmp_path / "matrix.npy")
+    points = [(10, 20), (40, 60), (0, 80)]
+    write_distance_matrix(path, points)
+    with pytest.raises(ValueError):
+        write_distance_matrix(path, [(10, 20), (40, 60), (0, 81)])
+    with pytest.raises(ValueError):
+        write_distance_matrix(path, points, method=GreatCircleDistance)
+    np.testing.assert_array_equal(write_distance_matrix(path, points),
+                                  distance_matrix(points))
+
+    os.remove(path + ".inputs")
+    with pytest.raises(ValueError):
+        write_distance_matrix(path, points)
+
+
+@requires_numpy
+def test_write_distance_matrix_interrupted_initialization(tmp_path):
+    path = str(tmp_path / "matrix.npy")
+    points = [(10, 20), (40, 60), (0, 80)]
+    with patch("os.replace", side_effect=KeyboardInterrupt):
+        with pytest.raises(KeyboardInterrupt):
+            write_distance_matrix(path, points)
+    assert not os.path.exists(path)
+
+    # The zero-filled leftover is not resumed.
+    np.testing.assert_array_equal(write_distance_matrix(path, points),
+                                  distance_matrix(points))
+    assert not os.path.exists(path + ".partial")
+
+
+@requires_numpy
+def test_measure_many_processes():
+    rng = np.random.default_rng(42)
+    lat1, lat2 = rng.uniform(-80, 80, (2, 50))
+    lon1, lon2 = rng.uniform(-180, 180, (2, 50))
+    expected = GeodesicDistance().measure_many(lat1, lon1, lat2, lon2)
+    result = GeodesicDistance().measure_many(lat1, lon1, lat2, lon2,
+                                             processes=2, chunk_size=7)
+    np.testing.assert_array_equal(result, expected)
+
+    with pytest.raises(ValueError):
+        GeodesicDistance().measure_many(lat1, lon1, lat2, lon2, processes=0)
+
+
+@requires_numpy
+@pytest.mark.parametrize("method", [GeodesicDistance, GreatCircleDistance])
+def test_distance_matrix_processes(method):
+    points = np.random.default_rng(42).uniform([-80, -180], [80, 180], (23, 2))
+    expected = distance_matrix(points, method=method, chunk_size=5)
+    for processes in (1, 2, 3):
+        result = distance_matrix(points, method=method, chunk_size=5,
+                                 processes=processes)
+        np.testing.assert_array_equal(result, expected)
+
+    out = np.zeros((23, 10), dtype=np.float32)
+    distance_matrix(points, points[:10], method=method, chunk_size=4,
+                    out=out, processes=2)
+    np.testing.assert_array_equal(
+        out, distance_matrix(points, points[:10], method=method).astype(np.float32)
+    )
+
+
+@requires_numpy
+def test_write_distance_matrix_processes(tmp_path):
+    path = str(tmp_path / "matrix.npy")
+    points = np.random.default_rng(42).uniform([-80, -180], [80, 180], (11, 2))
+    matrix = write_distance_matrix(path, points, chunk_size=3, processes=2)
+    del matrix
+    np.testing.assert_array_equal(np.load(path), distance_matrix(points))
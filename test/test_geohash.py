@@ -0,0 +1,150 @@
+import random
+import unittest
+
+import pytest
+
+from geopy import geohash
+from geopy.geohash import GeohashIndex
+from geopy.point import Point
+
+try:
+    import numpy as np
+    numpy_available = True
+except ImportError:
+    numpy_available = False
+
+
+class GeohashTestCase(unittest.TestCase):
+
+    def test_encode(self):
+        self.assertEqual(geohash.encode((57.64911, 10.40744), 11), 'u4pruydqqvj')
+        self.assertEqual(geohash.encode(Point(42.6, -5.6), 5), 'ezs42')
+        self.assertEqual(geohash.encode("42.6, -5.6", 5), 'ezs42')
+        self.assertEqual(len(geohash.encode((0, 0))), 12)
+
+    def test_encode_extremes(self):
+        self.assertEqual(geohash.encode((90, 180), 3), 'zzz')
+        self.assertEqual(geohash.encode((-90, -180), 3), '000')
+        # Longitude is normalized like in Point:
+        self.assertEqual(geohash.encode((42.6, 354.4), 5), 'ezs42')
+
+    def test_decode(self):
+        point = geohash.decode('ezs42')
+        self.assertAlmostEqual(point.latitude, 42.6, delta=0.03)
+        self.assertAlmostEqual(point.longitude, -5.6, delta=0.03)
+        self.assertEqual(geohash.decode('EZS42'), point)
+
+    def test_bounds_contain_point(self):
+        rnd = random.Random(42)
+        for _ in range(200):
+            point = Point(rnd.uniform(-90, 90), rnd.uniform(-180, 180))
+            for precision in (1, 4, 9, 12):
+                south_west, north_east = geohash.bounds(
+                    geohash.encode(point, precision)
+                )
+                self.assertTrue(
+                    south_west.latitude <= point.latitude <= north_east.latitude
+                )
+                self.assertTrue(
+                    south_west.longitude <= point.longitude <= north_east.longitude
+                )
+
+    def test_neighbours(self):
+        result = geohash.neighbours('ezs42')
+        self.assertEqual(result, {
+            'n': 'ezs48', 'ne': 'ezs49', 'e': 'ezs43', 'se': 'ezs41',
+            's': 'ezs40', 'sw': 'ezefp', 'w': 'ezefr', 'nw': 'ezefx',
+        })
+
+    def test_neighbours_wrap_around_antimeridian(self):
+        result = geohash.neighbours('8')
+        self.assertEqual(result['w'], 'x')
+        self.assertEqual(geohash.neighbours('x')['e'], '8')
+
+    def test_neighbours_at_poles(self):
+        self.assertEqual(set(geohash.neighbours('z')), {'e', 'se', 's', 'sw', 'w'})
+        self.assertEqual(set(geohash.neighbours('0')), {'n', 'ne', 'e', 'w', 'nw'})
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            geohash.decode('ezs4a')  # 'a' is not in the alphabet
+        with self.assertRaises(ValueError):
+            geohash.decode('')
+        with self.assertRaises(ValueError):
+            geohash.encode((0, 0), 13)
+        with self.assertRaises(TypeError):
+            geohash.decode(42)
+
+
+@pytest.mark.skipif("not numpy_available")
+def test_encode_many():
+    rng = np.random.default_rng(42)
+    latitudes = rng.uniform(-90, 90, 500)
+    longitudes = rng.uniform(-180, 180, 500)
+    for precision in (1, 5, 12):
+        result = geohash.encode_many(latitudes, longitudes, precision)
+        assert result.shape == (500,)
+        assert result.tolist() == [
+            geohash.encode(point, precision) for point in zip(latitudes, longitudes)
+        ]
+    assert geohash.encode_many(42.6, -5.6, 5) == 'ezs42'
+    assert geohash.encode_many(90, 180, 5) == geohash.encode((90, 180), 5)
+
+
+@pytest.mark.skipif("not numpy_available")
+def test_encode_many_at_cell_boundaries():
+    for precision in range(1, geohash.MAX_PRECISION + 1):
+        lon_bits, lat_bits = geohash._bit_counts(precision)
+        latitudes = [90.0, -90.0, 90.0, -90.0, 0.0]
+        longitudes = [180.0, -180.0, -180.0, 180.0, 0.0]
+        for k in (1, 2, 3):
+            # The edges of the first, the last and some middle cells.
+            latitudes.append(-90 + 180.0 * k / (1 << lat_bits))
+            latitudes.append(90 - 180.0 * k / (1 << lat_bits))
+            longitudes.append(-180 + 360.0 * k / (1 << lon_bits))
+            longitudes.append(180 - 360.0 * k / (1 << lon_bits))
+        latitudes.append(90.0)
+        longitudes.append(180 - 360.0 / (1 << lon_bits) / 2)
+        assert geohash.encode_many(latitudes, longitudes, precision).tolist() == [
+            geohash.encode(point, precision)
+            for point in zip(latitudes, longitudes)
+        ]
+    with pytest.raises(ValueError), pytest.warns(UserWarning):
+        geohash.encode_many([91], [0])
+
+
+class GeohashIndexTestCase(unittest.TestCase):
+
+    def setUp(self):
+        rnd = random.Random(42)
+        self.points = [
+            (rnd.uniform(40, 45), rnd.uniform(-8, -3)) for _ in range(300)
+        ]
+        self.index = GeohashIndex(self.points, precision=7)
+
+    def test_cell(self):
+        for prefix in ('e', 'ez', 'ezs', 'ezs4'):
+            expected = [
+                i for i, point in enumerate(self.points)
+                if geohash.encode(point, 7).startswith(prefix)
+            ]
+            self.assertEqual(sorted(self.index.cell(prefix)), expected)
+        self.assertEqual(self.index.cell('u'), [])
+        with self.assertRaises(ValueError):
+            self.index.cell('ezs42ezs')
+
+    def test_nearby(self):
+        query = (42.6, -5.6)
+        cells = {geohash.encode(query, 3)}
+        cells.update(geohash.neighbours(geohash.encode(query, 3)).values())
+        expected = [
+            i for i, point in enumerate(self.points)
+            if geohash.encode(point, 3) in cells
+        ]
+        self.assertEqual(sorted(self.index.nearby(query, 3)), expected)
+
+    @pytest.mark.skipif("not numpy_available")
+    def test_numpy_points(self):
+        index = GeohashIndex(np.array(self.points), precision=7)
+        self.assertEqual(index.cell('ezs'), self.index.cell('ezs'))
+        self.assertEqual(len(index), len(self.points))
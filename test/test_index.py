@@ -0,0 +1,151 @@
+import unittest
+
+import pytest
+
+from geopy.distance import GeodesicDistance, GreatCircleDistance, distance_matrix
+from geopy.point import Point
+
+try:
+    import numpy as np
+
+    from geopy.index import SpatialIndex, assign
+    numpy_available = True
+except ImportError:
+    numpy_available = False
+
+
+def random_points(rng, n):
+    # Uniformly distributed over the sphere, including the polar regions.
+    latitudes = np.degrees(np.arcsin(rng.uniform(-1, 1, n)))
+    longitudes = rng.uniform(-180, 180, n)
+    return np.column_stack([latitudes, longitudes])
+
+
+@pytest.mark.skipif("not numpy_available")
+class CommonSpatialIndexCases:
+
+    method = None
+
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(42)
+        cls.points = np.concatenate([
+            random_points(rng, 500),
+            # Clusters near the poles and the antimeridian:
+            [[90, 0], [89.9, 45], [-90, 0], [-89.95, -120]],
+            [[0, 179.99], [0, -179.99], [10, 180], [-10, -179.5]],
+        ])
+        cls.queries = np.concatenate([
+            random_points(rng, 10),
+            [[90, 0], [0, 180], [0, -180], [-89.99, 10]],
+        ])
+        cls.matrix = distance_matrix(cls.queries, cls.points, method=cls.method)
+
+    def test_nearest_matches_brute_force(self):
+        index = SpatialIndex(self.points, method=self.method, leaf_size=8)
+        for query, row in zip(self.queries, self.matrix):
+            for k in (1, 7):
+                indices, distances = index.nearest(query, k=k)
+                expected = np.lexsort((np.arange(len(row)), row))[:k]
+                np.testing.assert_array_equal(indices, expected)
+                np.testing.assert_allclose(distances, row[expected], atol=1e-9)
+
+    def test_nearest_many_matches_brute_force(self):
+        index = SpatialIndex(self.points, method=self.method, leaf_size=8)
+        order = np.lexsort((
+            np.broadcast_to(np.arange(self.matrix.shape[1]), self.matrix.shape),
+            self.matrix,
+        ))
+        for k in (1, 7):
+            for chunk_size in (1, 5, 4096):
+                indices, distances = index.nearest_many(
+                    self.queries, k=k, chunk_size=chunk_size
+                )
+                self.assertEqual(indices.shape, (len(self.queries), k))
+                np.testing.assert_array_equal(indices, order[:, :k])
+                np.testing.assert_allclose(
+                    distances, np.take_along_axis(self.matrix, order[:, :k], 1),
+                    atol=1e-9,
+                )
+
+    def test_nearest_many_same_as_nearest(self):
+        index = SpatialIndex(self.points[:100], method=self.method)
+        indices, distances = index.nearest_many(self.points[100:200], k=3)
+        for query, row, row_distances in zip(self.points[100:200], indices, distances):
+            expected_indices, expected_distances = index.nearest(query, k=3)
+            np.testing.assert_array_equal(row, expected_indices)
+            np.testing.assert_array_equal(row_distances, expected_distances)
+
+    def test_assign(self):
+        indices, distances = assign(self.queries, self.points, method=self.method)
+        np.testing.assert_array_equal(indices[:, 0], self.matrix.argmin(axis=1))
+        np.testing.assert_allclose(distances[:, 0], self.matrix.min(axis=1),
+                                   atol=1e-9)
+        # Duplicate facilities are ordered by their index.
+        indices, _ = assign([(1, 1), (5, 5)], [(5, 5), (1, 1), (5, 5)], k=2,
+                            method=self.method)
+        np.testing.assert_array_equal(indices, [[1, 0], [0, 2]])
+
+    def test_within_matches_brute_force(self):
+        index = SpatialIndex(self.points, method=self.method, leaf_size=8)
+        for query, row in zip(self.queries, self.matrix):
+            for radius in (0, 500, 3000, 30000):
+                indices, distances = index.within(query, radius)
+                self.assertEqual(set(indices), set(np.flatnonzero(row <= radius)))
+                self.assertTrue((np.diff(distances) >= 0).all())
+
+    def test_accepts_points_and_distances(self):
+        points = [Point(p) for p in self.points[:50]]
+        index = SpatialIndex(points, method=self.method())
+        self.assertEqual(len(index), 50)
+        query = Point(self.queries[0])
+        indices, distances = index.within(query, self.method(5000))
+        self.assertEqual(
+            set(indices), set(np.flatnonzero(self.matrix[0, :50] <= 5000))
+        )
+
+    def test_nearest_more_than_size(self):
+        index = SpatialIndex(self.points[:3], method=self.method)
+        indices, distances = index.nearest(self.queries[0], k=10)
+        self.assertEqual(sorted(indices), [0, 1, 2])
+
+    def test_nearest_many_more_than_size_and_empty(self):
+        index = SpatialIndex(self.points[:3], method=self.method)
+        indices, distances = index.nearest_many(self.queries, k=10)
+        self.assertEqual(indices.shape, (len(self.queries), 3))
+        self.assertEqual(index.nearest_many([], k=2)[0].shape, (0, 2))
+        indices, distances = SpatialIndex([], method=self.method).nearest_many(
+            self.queries, k=2
+        )
+        self.assertEqual(indices.shape, (len(self.queries), 0))
+
+    def test_empty_index(self):
+        index = SpatialIndex([], method=self.method)
+        self.assertEqual(len(index.nearest((0, 0), k=3)[0]), 0)
+        self.assertEqual(len(index.within((0, 0), 100)[0]), 0)
+
+    def test_errors(self):
+        index = SpatialIndex(self.points[:3], method=self.method)
+        with self.assertRaises(ValueError):
+            index.nearest((0, 0), k=0)
+        with self.assertRaises(ValueError):
+            index.within((0, 0), -1)
+        with self.assertRaises(ValueError):
+            # Different altitudes
+            index.nearest((0, 0, 10))
+        with self.assertRaises(ValueError):
+            SpatialIndex(self.points, leaf_size=0)
+        with self.assertRaises(ValueError):
+            index.nearest_many([(0, 0)], k=0)
+        with self.assertRaises(ValueError):
+            index.nearest_many([(0, 0)], chunk_size=0)
+        with self.assertRaises(ValueError):
+            index.nearest_many([(0, 0), (1, 1, 10)])
+
+
+class TestGeodesicSpatialIndex(CommonSpatialIndexCases, unittest.TestCase):
+    method = GeodesicDistance
+
+
+class TestGreatCircleSpatialIndex(CommonSpatialIndexCases, unittest.TestCase):
+    method = GreatCircleDistance
@@ -1,3 +1,8 @@
+import subprocess
+import sys
+import textwrap
+
+import pytest
 from packaging.version import Version
 
 from geopy import __version__, __version_info__, get_version
@@ -15,3 +20,26 @@ def test_version_info():
 def test_get_version():
     version = get_version()
     assert isinstance(version, str) and version == __version__
+
+
+@pytest.mark.parametrize("blocked, modules", [
+    # Not available on some platforms, e.g. Emscripten and WASI.
+    (["_posixshmem", "multiprocessing.shared_memory", "mmap"],
+     ["geopy.distance", "geopy.index"]),
+    # Python might be built without sqlite3.
+    (["sqlite3", "_sqlite3"], ["geopy", "geopy.geocoders", "geopy.cache"]),
+])
+def test_import_without_optional_stdlib_modules(blocked, modules):
+    code = textwrap.dedent("""
+        import sys
+
+        class Blocker:
+            def find_spec(self, name, path=None, target=None):
+                if name in %r:
+                    raise ModuleNotFoundError(name)
+
+        sys.meta_path.insert(0, Blocker())
+        for module in %r:
+            __import__(module)
+    """) % (blocked, modules)
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -5,7 +5,15 @@ import time
 import unittest
 import warnings
 
-from geopy.point import Point
+import pytest
+
+from geopy.point import Point, PointArray
+
+try:
+    import numpy as np
+    numpy_available = True
+except ImportError:
+    numpy_available = False
 
 
 class PointTestCase(unittest.TestCase):
@@ -347,3 +355,195 @@ class PointTestCase(unittest.TestCase):
             point_unp = pickle.loads(pickled)
             self.assertEqual(point, point_unp)
             self.assertEqual(self.coords, point_unp)
+
+
+@pytest.mark.skipif("not numpy_available", reason="numpy is not installed")
+class PointArrayTestCase(unittest.TestCase):
+    latitudes = [40.74113, -16.1333333, 90]
+    longitudes = [-73.989656, 540.5, -180]
+    altitudes = [3, 0, 0.5]
+
+    def setUp(self):
+        self.points = PointArray(self.latitudes, self.longitudes, self.altitudes)
+        self.expected = [
+            Point(*coords)
+            for coords in zip(self.latitudes, self.longitudes, self.altitudes)
+        ]
+
+    def test_points(self):
+        self.assertEqual(len(self.points), 3)
+        self.assertEqual(list(self.points), self.expected)
+        for i, point in enumerate(self.expected):
+            self.assertEqual(self.points[i], point)
+            self.assertEqual(tuple(self.points[i]), tuple(point))
+        self.assertEqual(self.points[-1], self.expected[-1])
+        self.assertIsInstance(self.points[0].latitude, float)
+
+    def test_iteration_is_lazy(self):
+        iterator = iter(self.points)
+        self.assertEqual(next(iterator), self.expected[0])
+
+    def test_columns(self):
+        self.assertEqual(self.points.coordinates.shape, (3, 3))
+        self.assertEqual(self.points.coordinates.dtype, np.float64)
+        np.testing.assert_array_equal(self.points.latitudes, self.latitudes)
+        np.testing.assert_array_equal(
+            self.points.longitudes, [p.longitude for p in self.expected]
+        )
+        np.testing.assert_array_equal(self.points.altitudes, self.altitudes)
+
+    def test_coordinates_are_read_only(self):
+        with self.assertRaises(ValueError):
+            self.points.coordinates[0, 0] = 100
+        with self.assertRaises(ValueError):
+            self.points.latitudes[0] = 100
+
+    def test_default_altitudes_and_broadcasting(self):
+        points = PointArray([1, 2], 10)
+        self.assertEqual(list(points), [Point(1, 10), Point(2, 10)])
+
+    def test_slicing(self):
+        sliced = self.points[1:]
+        self.assertIsInstance(sliced, PointArray)
+        self.assertEqual(list(sliced), self.expected[1:])
+        self.assertTrue(np.shares_memory(sliced.coordinates, self.points.coordinates))
+
+        self.assertEqual(list(self.points[::-2]), self.expected[::-2])
+        self.assertEqual(list(self.points[[2, 0]]), [self.expected[2], self.expected[0]])
+        mask = np.array([True, False, True])
+        self.assertEqual(list(self.points[mask]), [self.expected[0], self.expected[2]])
+        self.assertEqual(len(self.points[3:]), 0)
+        with self.assertRaises(IndexError):
+            self.points[3]
+        with self.assertRaises(TypeError):
+            self.points[0, 0]
+
+    def test_zero_copy(self):
+        self.assertIs(np.asarray(self.points), self.points.coordinates)
+        copied = np.array(self.points, dtype=np.float32)
+        self.assertEqual(copied.dtype, np.float32)
+
+    @pytest.mark.skipif(sys.version_info < (3, 12), reason="requires PEP 688")
+    def test_buffer_protocol(self):
+        view = memoryview(self.points)
+        self.assertEqual(view.shape, (3, 3))
+        self.assertEqual(view.format, 'd')
+        self.assertTrue(view.readonly)
+        self.assertEqual(view[1, 0], self.latitudes[1])
+
+    def test_from_points(self):
+        for points in (self.expected,
+                       iter([tuple(p) for p in self.expected]),
+                       [str(p) for p in self.expected[:1]],
+                       np.array([tuple(p) for p in self.expected]),
+                       self.points):
+            result = PointArray.from_points(points)
+            self.assertEqual(list(result), self.expected[:len(result)])
+        self.assertEqual(len(PointArray.from_points([])), 0)
+        with self.assertRaises(ValueError):
+            PointArray.from_points(np.zeros((2, 4)))
+
+    def test_validation(self):
+        with self.assertRaises(ValueError):
+            PointArray([float('nan')], [0])
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            with self.assertRaises(ValueError):
+                PointArray([0, 91], [0, 0])
+            self.assertEqual(1, len(w))
+        with self.assertRaises(ValueError):
+            PointArray([[1, 2]], [[3, 4]])
+
+    def test_equality_and_pickling(self):
+        self.assertEqual(self.points, PointArray.from_points(self.expected))
+        self.assertNotEqual(self.points, self.points[1:])
+        for protocol in (0, 2, -1):
+            unpickled = pickle.loads(pickle.dumps(self.points, protocol=protocol))
+            self.assertEqual(unpickled, self.points)
+            with self.assertRaises(ValueError):
+                unpickled.coordinates[0, 0] = 100
+
+    def test_repr(self):
+        self.assertEqual(
+            repr(PointArray([1, 2], [3, 4])),
+            'PointArray([1.0, 2.0], [3.0, 4.0], [0.0, 0.0])'
+        )
+        self.assertEqual(eval(repr(self.points)), self.points)
+
+    def test_repr_of_large_arrays_is_summarized(self):
+        points = PointArray(np.arange(400) / 10, np.arange(400), 5)
+        self.assertEqual(
+            repr(points),
+            'PointArray([0.0, 0.1, 0.2, ..., 39.7, 39.8, 39.9], '
+            '[0.0, 1.0, 2.0, ..., 37.0, 38.0, 39.0], '
+            '[5.0, 5.0, 5.0, ..., 5.0, 5.0, 5.0])'
+        )
+
+
+@pytest.mark.skipif("not numpy_available", reason="numpy is not installed")
+class PointArrayFromStringsTestCase(unittest.TestCase):
+    strings = [
+        "41.5;-81.0",
+        "41.5,-81.0",
+        "41.5 -81.0",
+        " 41.5 ,\t-81.0 ",
+        "+41.5 N -81.0 W",
+        "41.5 N, 81.0 W, 2.5km",
+        "-41.5 S;81.0 E",
+        "-41.5 S;81.0 E 100 m",
+        "23 26m 22s N 23 27m 30s E",
+        "23 26' 22\" N 23 27' 30\" E 21.0mi",
+        "23\u00b0 26\u2032 22\u2033 N, 23\u00b0 27\u2032 30\u2033 W",
+        "UT: N 39\u00b020' 0'' / W 74\u00b035' 0''",
+        "51 19m 12.9s N, -1 1m 24.95s E, 15000m",
+        "40.0, 540.5, 3ft",
+        "41.5 -81.0 100m",  # 100 arcminutes, not meters
+        "1 2 3",
+    ]
+
+    def test_same_as_from_string(self):
+        points, errors = PointArray.from_strings(self.strings)
+        self.assertEqual(errors, {})
+        self.assertEqual(
+            [tuple(point) for point in points],
+            [tuple(Point.from_string(string)) for string in self.strings],
+        )
+
+    def test_errors(self):
+        strings = ["41.5,-81.0", "nowhere", None, "", "95, 10", "1, 2", 41.5]
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            points, errors = PointArray.from_strings(iter(strings))
+            self.assertEqual(0, len(w))
+        self.assertEqual(list(points), [Point(41.5, -81.0), Point(1, 2)])
+        self.assertEqual(sorted(errors), [1, 2, 3, 4, 6])
+        for error in errors.values():
+            self.assertIsInstance(error, ValueError)
+        self.assertIn('[-90; 90]', str(errors[4]))
+
+    def test_empty(self):
+        points, errors = PointArray.from_strings([])
+        self.assertEqual(len(points), 0)
+        self.assertEqual(errors, {})
+
+    def test_long_strings(self):
+        # Unlike `Point.from_string`, there is no length limit, and
+        # the time spent is linear in the length of the string.
+        prefix = "x" * 1000 + " "
+        points, errors = PointArray.from_strings([prefix + "41.5,-81.0"])
+        self.assertEqual(list(points), [Point(41.5, -81.0)])
+
+        strings = [
+            "1" + " " * 20000 + "2" + " " * 20000 + "x",
+            "1 " * 10000 + "x",
+            "1\u00b0 " * 10000 + "x",
+            "1" * 20000 + "x",
+        ]
+        points, errors = PointArray.from_strings(strings)
+        self.assertEqual(len(points), 0)
+        self.assertEqual(sorted(errors), [0, 1, 2, 3])
+
+    def test_newlines(self):
+        points, errors = PointArray.from_strings(["x\n41.5,-81.0", "41.5,\n-81.0\n"])
+        self.assertEqual(list(errors), [0])
+        self.assertEqual(list(points), [Point(41.5, -81.0)])